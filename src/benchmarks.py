@@ -0,0 +1,314 @@
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
+from data_preprocessing import (
+    ParallelPipeline,
+    base_pipeline,
+    final_cleaning_pipeline,
+    plotting_pipeline,
+    scaling_pipeline,
+)
+from data_preprocessing.base_transformers import DataLoader, FeatureEngineer
+from data_preprocessing.data_cleaners import (
+    DEDUP_COLUMNS,
+    OWNER_COLUMNS,
+    DataCleaner,
+    ListProcessor,
+)
+from data_preprocessing.encoders import CategoricalEncoder
+from data_preprocessing.parsing import parse_literal_series
+
+
+LITERAL_COLUMNS = [
+    "genres",
+    "tags",
+    "categories",
+    "supported_languages",
+    "full_audio_languages",
+    "developers",
+    "publishers",
+]
+
+
+def _best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _literal_eval_or_none(cell):
+    try:
+        return ast.literal_eval(cell)
+    except (ValueError, SyntaxError):
+        return None
+
+
+def benchmark_literal_parser(
+    df: pd.DataFrame, columns=LITERAL_COLUMNS, repeat: int = 3
+) -> pd.DataFrame:
+    """Time ``ast.literal_eval`` per cell against ``parse_literal_series``."""
+    rows = []
+    for col in columns:
+        series = df[col]
+        literal_eval_s = _best_time(lambda: series.map(_literal_eval_or_none), repeat)
+        parser_s = _best_time(
+            lambda: parse_literal_series(series, errors="coerce"), repeat
+        )
+        identical = series.map(_literal_eval_or_none).tolist() == (
+            parse_literal_series(series, errors="coerce").tolist()
+        )
+        rows.append(
+            {
+                "column": col,
+                "rows": len(series),
+                "unique_values": series.nunique(),
+                "literal_eval_s": literal_eval_s,
+                "parser_s": parser_s,
+                "speedup": literal_eval_s / parser_s,
+                "identical": identical,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def _masked_cleaning(df):
+    """The former DataCleaner row-local pass: one mask scan per statement."""
+    df = df.copy()
+    df.loc[df["publishers"] == "[]", "publishers"] = df.loc[
+        df["publishers"] == "[]", "developers"
+    ]
+    df.loc[df["developers"] == "[]", "developers"] = df.loc[
+        df["developers"] == "[]", "publishers"
+    ]
+    df = df[df["developers"] != "[]"]
+    df = df[df["publishers"] != "[]"]
+
+    mask = df["pct_pos_total"] == -1
+    zero_reviews_mask = mask & (df["positive"] == 0) & (df["negative"] == 0)
+    df.loc[zero_reviews_mask, "pct_pos_total"] = 50
+    total_reviews = df["positive"] + df["negative"]
+    calc_mask = mask & (total_reviews > 0)
+    df["pct_pos_total"] = df["pct_pos_total"].astype(float)
+    df.loc[calc_mask, "pct_pos_total"] = (
+        df.loc[calc_mask, "positive"] / total_reviews[calc_mask] * 100
+    ).round(2)
+    return df
+
+
+def benchmark_data_cleaner(df: pd.DataFrame, repeat: int = 5) -> pd.DataFrame:
+    """Time the repeated-mask cleaning against ``DataCleaner.transform_chunk``."""
+    cleaner = DataCleaner()
+    masked_s = _best_time(lambda: _masked_cleaning(df), repeat)
+    fused_s = _best_time(lambda: cleaner.transform_chunk(df), repeat)
+    return pd.DataFrame(
+        [
+            {
+                "rows": len(df),
+                "masked_s": masked_s,
+                "fused_s": fused_s,
+                "speedup": masked_s / fused_s,
+                "identical": _masked_cleaning(df).equals(cleaner.transform_chunk(df)),
+            }
+        ]
+    )
+
+
+def _sorted_deduplication(df):
+    """The original DataCleaner deduplication: sort on the range strings."""
+    df = df.sort_values(by="estimated_owners", ascending=False, kind="stable")
+    return df.drop_duplicates(subset=DEDUP_COLUMNS, keep="first")
+
+
+def _grouped_deduplication(df):
+    """Hashed groupby-idxmax on the owner bounds; finalize's survivors."""
+    keys = [df[col].to_numpy() for col in DEDUP_COLUMNS]
+    # Lower bound in the high bits, upper bound breaking ties in the low ones.
+    bounds = df["estimated_owners_lower"].to_numpy().astype(np.int64) << 32
+    bounds += df["estimated_owners_upper"].to_numpy().astype(np.int64)
+    survivors = (
+        pd.Series(bounds)
+        .groupby(keys, dropna=False, sort=False)
+        .idxmax()
+    )
+    return df.iloc[np.sort(survivors.to_numpy())]
+
+
+def benchmark_deduplication(
+    df: pd.DataFrame, rows: int = 1_000_000, repeat: int = 5
+) -> pd.DataFrame:
+    """Time ``DataCleaner.finalize`` against earlier deduplication variants.
+
+    ``df`` is the cleaned frame before deduplication; it is resampled
+    with replacement to ``rows`` rows. The string sort keeps different
+    survivors (it orders ranges lexically), so only the groupby variant is
+    checked for identical output.
+    """
+    df = df.sample(rows, replace=True, random_state=42).reset_index(drop=True)
+    cleaner = DataCleaner()
+    grouped = _grouped_deduplication(df).drop(columns=OWNER_COLUMNS)
+    return pd.DataFrame(
+        [
+            {
+                "rows": rows,
+                "sort_drop_duplicates_s": _best_time(
+                    lambda: _sorted_deduplication(df), repeat
+                ),
+                "groupby_idxmax_s": _best_time(
+                    lambda: _grouped_deduplication(df), repeat
+                ),
+                "argsort_duplicated_s": _best_time(
+                    lambda: cleaner.finalize(df), repeat
+                ),
+                "identical": grouped.equals(cleaner.finalize(df)),
+            }
+        ]
+    )
+
+
+def peak_allocation(func):
+    """Run ``func`` and return its result and its peak traced allocation.
+
+    tracemalloc sees Python objects and NumPy buffers; memory handed out by
+    the Arrow pool (Arrow-backed string columns) is not included.
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def check_pipeline_memory(
+    filepath: str = "../data/raw/games.csv", max_ratio: float = 5.0
+) -> pd.DataFrame:
+    """Peak allocation of each preprocessing stage relative to its frame.
+
+    Loads ``filepath`` with the base pipeline, then runs the final
+    cleaning and scaling pipelines on the result. ``ratio`` is the peak
+    traced allocation of a stage over ``memory_usage(deep=True)`` of its
+    input frame (its output for the loading stage), and every ratio must
+    stay below ``max_ratio``.
+    """
+    loading = clone(base_pipeline).set_params(data_loading__filepath=filepath)
+    rows = []
+    df = None
+    for stage, pipeline in (
+        ("base", loading),
+        ("final_cleaning", clone(final_cleaning_pipeline)),
+        ("scaling", clone(scaling_pipeline)),
+    ):
+        out, peak = peak_allocation(lambda: pipeline.fit_transform(df))
+        frame_bytes = (out if df is None else df).memory_usage(deep=True).sum()
+        rows.append(
+            {
+                "stage": stage,
+                "rows": len(out),
+                "frame_bytes": int(frame_bytes),
+                "peak_bytes": peak,
+                "ratio": peak / frame_bytes,
+            }
+        )
+        df = out
+    result = pd.DataFrame(rows)
+    too_high = result[result["ratio"] > max_ratio]
+    assert too_high.empty, f"peak allocation above {max_ratio}x:\n{too_high}"
+    return result
+
+
+def check_parallel_pipeline(
+    filepath: str = "../data/raw/games.csv", n_jobs: int = 2
+) -> int:
+    """Assert ParallelPipeline matches the serial pipelines, dense and sparse.
+
+    Covers the base pipeline, the plotting pipeline with dense and sparse
+    encoder output, and a row-local step after a sparse encoder, whose
+    input Arrow cannot serialize and which therefore runs serially.
+    Returns the number of pipelines compared.
+    """
+    loading = clone(base_pipeline).set_params(data_loading__filepath=filepath)
+    pipelines = [(loading, None)]
+    cleaned = clone(final_cleaning_pipeline).fit_transform(
+        clone(loading).fit_transform(None)
+    )
+    for sparse_output in (False, True):
+        plotting = clone(plotting_pipeline).set_params(
+            categorical_encoding__sparse_output=sparse_output,
+            multilabel_encoding__sparse_output=sparse_output,
+        )
+        pipelines.append((plotting, cleaned))
+    encoded = Pipeline(
+        [
+            ("categorical_encoding", CategoricalEncoder(sparse_output=True)),
+            ("list_processing", ListProcessor()),
+        ]
+    )
+    pipelines.append((encoded, cleaned))
+
+    for pipeline, X in pipelines:
+        serial = clone(pipeline).fit_transform(X)
+        parallel = ParallelPipeline(clone(pipeline), n_jobs=n_jobs, n_partitions=3)
+        pd.testing.assert_frame_equal(parallel.fit_transform(X), serial)
+    return len(pipelines)
+
+
+_STARTUP_SNIPPET = """
+import json, time
+start = time.perf_counter()
+import metadata_options
+imported = time.perf_counter()
+from data_preprocessing.developer_classifier import DeveloperTierClassifier
+loaded = time.perf_counter()
+DeveloperTierClassifier().fit(None)
+first_fit = time.perf_counter()
+DeveloperTierClassifier().fit(None)
+second_fit = time.perf_counter()
+print(json.dumps({
+    "import_metadata_s": imported - start,
+    "first_fit_s": first_fit - loaded,
+    "warm_fit_s": second_fit - first_fit,
+}))
+"""
+
+
+def benchmark_metadata_startup(repeat: int = 5) -> pd.DataFrame:
+    """Cold-start cost of metadata_options and DeveloperTierClassifier.fit.
+
+    Every run is a fresh interpreter, so the numbers include the lazy load
+    of metadata_options.json on the first fit.
+    """
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _STARTUP_SNIPPET],
+            cwd=src_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(result.stdout))
+    return pd.DataFrame(runs).describe().loc[["min", "50%", "max"]]
+
+
+if __name__ == "__main__":
+    print(check_pipeline_memory().to_string(index=False))
+    print(f"parallel pipelines matching serial: {check_parallel_pipeline()}")
+    games = DataLoader().fit_transform(None)
+    print(benchmark_literal_parser(games).to_string(index=False))
+    print(benchmark_data_cleaner(games).to_string(index=False))
+    cleaned = DataCleaner().transform_chunk(FeatureEngineer().fit_transform(games))
+    print(benchmark_deduplication(cleaned).to_string(index=False))
+    print(benchmark_metadata_startup())
@@ -8,6 +8,13 @@ from .pipelines import (
     quantile_scaler,
     robust_scaler,
 )
+from .catalog import CatalogStore
+from .data_cleaners import FittedOutlierRemover
+from .parallel import ParallelPipeline
+from .scalers import StreamingQuantileScaler
+from .step_cache import CachedPipeline
+from .streaming import ChunkedPipeline
+from .utilities import to_csr_matrix
 
 __all__ = [
     "base_pipeline",
@@ -18,4 +25,11 @@ __all__ = [
     "power_scaler",
     "quantile_scaler",
     "robust_scaler",
+    "ChunkedPipeline",
+    "ParallelPipeline",
+    "CachedPipeline",
+    "CatalogStore",
+    "FittedOutlierRemover",
+    "StreamingQuantileScaler",
+    "to_csr_matrix",
 ]
@@ -1,75 +1,246 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
-import ast
+import hashlib
+import json
+import os
+import pyarrow as pa
+import pyarrow.feather as feather
 from sklearn.base import BaseEstimator, TransformerMixin
+from .parsing import decode_owner_ranges, parse_literal_series
+from .schema import GAMES_DATE_FORMAT, GAMES_SCHEMA, GAMES_SNAPSHOT_DATE
+from .utilities import DefaultParamsOnLoadMixin
 
 
-class DataLoader(BaseEstimator, TransformerMixin):
-    def __init__(self, filepath="../data/raw/games.csv"):
+class DataLoader(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    """Load the raw Steam CSV.
+
+    Only the columns declared in ``schema`` are parsed, with their declared
+    dtypes. With ``cache_dir`` set, the resulting frame is written once to an
+    uncompressed Arrow (Feather v2) file and later runs memory-map it
+    instead of re-parsing the CSV. The source fingerprint is kept in a small
+    JSON file next to it, and the cache is rebuilt when the source file's
+    size/mtime changes and its SHA-256 no longer matches.
+    """
+
+    def __init__(
+        self, filepath="../data/raw/games.csv", schema=GAMES_SCHEMA, cache_dir=None
+    ):
         self.filepath = filepath
+        self.schema = schema
+        self.cache_dir = cache_dir
 
     def fit(self, X=None, y=None):
         return self
 
+    def _read_csv(self):
+        df = pd.read_csv(
+            self.filepath,
+            usecols=self.schema.usecols,
+            dtype=self.schema.read_dtypes(),
+        )
+        return self.schema.narrow(df)
+
+    def _cache_path(self):
+        name = os.path.splitext(os.path.basename(self.filepath))[0]
+        return os.path.join(self.cache_dir, f"{name}.arrow")
+
+    def _source_fingerprint(self, with_hash=False):
+        stat = os.stat(self.filepath)
+        fingerprint = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "schema": repr(self.schema),
+        }
+        if with_hash:
+            digest = hashlib.sha256()
+            with open(self.filepath, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            fingerprint["sha256"] = digest.hexdigest()
+        return fingerprint
+
+    def _fingerprint_path(self, path):
+        return f"{path}.json"
+
+    def _cached_fingerprint(self, path):
+        sidecar = self._fingerprint_path(path)
+        if not (os.path.exists(path) and os.path.exists(sidecar)):
+            return None
+        try:
+            with open(sidecar) as f:
+                return json.load(f)
+        except ValueError:
+            return None
+
+    def _cache_is_valid(self, path):
+        cached = self._cached_fingerprint(path)
+        if cached is None:
+            return False
+
+        current = self._source_fingerprint()
+        if all(cached.get(key) == value for key, value in current.items()):
+            return True
+
+        # Touched but unchanged files (e.g. a fresh checkout) keep the cache.
+        if (
+            cached.get("size") != current["size"]
+            or cached.get("schema") != current["schema"]
+        ):
+            return False
+        fingerprint = self._source_fingerprint(with_hash=True)
+        if cached.get("sha256") != fingerprint["sha256"]:
+            return False
+        # Record the new mtime so later runs skip hashing the CSV again.
+        self._write_fingerprint(path, fingerprint)
+        return True
+
+    def _write_fingerprint(self, path, fingerprint):
+        sidecar = self._fingerprint_path(path)
+        tmp_path = f"{sidecar}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(fingerprint, f)
+        os.replace(tmp_path, sidecar)
+
+    def _write_cache(self, df, path):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        fingerprint = self._source_fingerprint(with_hash=True)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Without a fingerprint a half-written cache is never trusted.
+        sidecar = self._fingerprint_path(path)
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+        tmp_path = f"{path}.tmp"
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+        self._write_fingerprint(path, fingerprint)
+
+    def _ensure_cache(self):
+        path = self._cache_path()
+        if not self._cache_is_valid(path):
+            self._write_cache(self._read_csv(), path)
+        return path
+
+    def iter_chunks(self, chunksize):
+        """Yield the loaded frame in blocks of at most ``chunksize`` rows."""
+        if self.cache_dir is None:
+            with pd.read_csv(
+                self.filepath,
+                usecols=self.schema.usecols,
+                dtype=self.schema.read_dtypes(),
+                chunksize=chunksize,
+            ) as reader:
+                for chunk in reader:
+                    yield self.schema.narrow(chunk)
+            return
+
+        table = feather.read_table(self._ensure_cache(), memory_map=True)
+        offset = 0
+        for batch in table.to_batches(max_chunksize=chunksize):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
     def transform(self, X=None):
-        df = pd.read_csv(self.filepath)
+        if self.cache_dir is None:
+            return self._read_csv()
+
+        path = self._cache_path()
+        if not self._cache_is_valid(path):
+            df = self._read_csv()
+            self._write_cache(df, path)
+            return df
+
+        return feather.read_table(path, memory_map=True).to_pandas()
 
-        columns_to_drop = [
-            "required_age",
-            "detailed_description",
-            "short_description",
-            "reviews",
-            "header_image",
-            "website",
-            "support_url",
-            "support_email",
-            "metacritic_url",
-            "recommendations",
-            "notes",
-            "packages",
-            "user_score",
-            "score_rank",
-            "num_reviews_recent",
-            "pct_pos_recent",
-        ]
 
-        return df.drop(columns=columns_to_drop, errors="ignore")
+def _as_arrow_text(series):
+    return series.astype("string[pyarrow]").fillna("")
 
 
-class FeatureEngineer(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
+# Any character str.strip() would keep, for Arrow's RE2 regex engine.
+_NON_BLANK = r"[^\t\n\v\f\r\x1c-\x1f \x85\p{Z}]"
+
+
+def _count_byte(text, char):
+    """Occurrences of the ASCII ``char`` per cell, read off the UTF-8 buffer."""
+    array = pa.array(text)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    _, offsets, data = array.buffers()
+    offset_type = np.int64 if pa.types.is_large_string(array.type) else np.int32
+    offsets = np.frombuffer(offsets, dtype=offset_type)
+    offsets = offsets[array.offset : array.offset + len(array) + 1]
+    data = np.frombuffer(data, dtype=np.uint8) if data else np.empty(0, np.uint8)
+    hits = np.flatnonzero(data == ord(char))
+    return np.diff(np.searchsorted(hits, offsets))
+
+
+def _count_list_items(series):
+    """Number of comma separated items per cell, 0 for empty or blank cells.
+
+    Same as ``len(x.split(","))`` per cell, without Python string objects.
+    """
+    text = _as_arrow_text(series)
+    counts = pd.Series(_count_byte(text, ",") + 1, index=series.index)
+    return counts.where(text.str.contains(_NON_BLANK), 0).astype(int)
+
+
+def _count_words(series):
+    r"""Number of word-character runs per cell (0 for missing cells).
+
+    Matches replacing ``[^\w\s]`` by spaces and splitting on whitespace;
+    ``[\pL\pN_]`` is Python's Unicode ``\w`` for Arrow's RE2 engine.
+    """
+    return _as_arrow_text(series).str.count(r"[\pL\pN_]+").astype(int)
+
+
+class FeatureEngineer(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    """Derive counts, genres_tags, price and owner features from raw columns.
+
+    Years since release are measured up to ``reference_date`` (the dataset
+    snapshot by default) rather than today, so reruns give the same output.
+    """
+
+    def __init__(self, copy=True, reference_date=GAMES_SNAPSHOT_DATE):
+        self.copy = copy
+        self.reference_date = reference_date
 
     def fit(self, X, y=None):
         return self
 
-    def extract_genres_tags(self, row):
-        genres = ast.literal_eval(row["genres"])
-        tags = ast.literal_eval(row["tags"])
+    def extract_genres_tags(self, genres, tags):
+        """Union of genre and tag names per row as native lists.
 
-        tag_names = list(tags.keys()) if isinstance(tags, dict) else []
-        combined = list(set(genres + tag_names))
+        Both columns are parsed column-wise and merged in one pass over the
+        parsed values instead of a row-wise ``apply``; ``ListProcessor``
+        consumes the lists directly, without a serialize/parse round trip.
+        """
+        genre_lists = parse_literal_series(genres)
+        tag_dicts = parse_literal_series(tags)
 
-        return "[" + ", ".join([f'"{item}"' for item in combined]) + "]"
+        tag_names = tag_dicts.map(lambda tags: tags if isinstance(tags, dict) else ())
+
+        return pd.Series(
+            [
+                list(set(genre_list).union(tag_name_list))
+                for genre_list, tag_name_list in zip(genre_lists, tag_names)
+            ],
+            index=genres.index,
+            dtype=object,
+        )
 
     def transform(self, X):
-        df = X.copy()
+        df = X.copy() if self.copy else X
 
         # Media counts
-        df["screenshot_count"] = (
-            df["screenshots"]
-            .fillna("")
-            .apply(lambda x: len(x.split(",")) if x and x.strip() else 0)
-        )
-
-        df["movie_count"] = (
-            df["movies"]
-            .fillna("")
-            .apply(lambda x: len(x.split(",")) if x and x.strip() else 0)
-        )
+        df["screenshot_count"] = _count_list_items(df["screenshots"])
+        df["movie_count"] = _count_list_items(df["movies"])
 
         # Combine genres and tags
-        df["genres_tags"] = df.apply(self.extract_genres_tags, axis=1)
+        df["genres_tags"] = self.extract_genres_tags(df["genres"], df["tags"])
 
         # Calculate actual price with discount
         discount_factor = (100 - df["discount"].fillna(0)) / 100
@@ -80,37 +251,32 @@ class FeatureEngineer(BaseEstimator, TransformerMixin):
             df["positive"].fillna(0) + df["negative"].fillna(0)
         ).astype(int)
 
-        df["description_word_count"] = (
-            df["about_the_game"]
-            .fillna("")
-            .str.replace(r"[^\w\s]", " ", regex=True)
-            .str.split()
-            .str.len()
-            .fillna(0)
-        )
+        df["description_word_count"] = _count_words(df["about_the_game"])
 
         df["platform_count"] = df[["windows", "mac", "linux"]].sum(axis=1)
 
-        df["release_date"] = pd.to_datetime(df["release_date"], errors="coerce")
+        df["release_date"] = pd.to_datetime(
+            df["release_date"], format=GAMES_DATE_FORMAT, errors="coerce"
+        )
         df["weekday"] = df["release_date"].dt.day_name()
 
-        current_date = pd.Timestamp.now()
-        years_since_release = (current_date - df["release_date"]).dt.days / 365.25
+        reference_date = pd.Timestamp(self.reference_date)
+        years_since_release = (reference_date - df["release_date"]).dt.days / 365.25
         years_since_release = years_since_release.clip(lower=1)
 
-        df["estimated_owners_calculated"] = (
-            pd.concat(
-                [
-                    df["estimated_owners"].str.extract(r"(\d+)").astype(int),
-                    df["num_reviews_total"].astype(int) * 40,
-                    df["peak_ccu"].astype(int),
-                ],
-                axis=1,
-            )
-            .max(axis=1)
-            .div(years_since_release)
-            .astype(int)
+        # Decoded once per owner-range category; DataCleaner dedups on them.
+        lower, upper = decode_owner_ranges(df["estimated_owners"])
+        df["estimated_owners_lower"] = lower
+        df["estimated_owners_upper"] = upper
+
+        owners = np.maximum.reduce(
+            [
+                lower.astype(np.int64),
+                df["num_reviews_total"].to_numpy(dtype=np.int64) * 40,
+                df["peak_ccu"].to_numpy(dtype=np.int64),
+            ]
         )
+        df["estimated_owners_calculated"] = (owners / years_since_release).astype(int)
 
         columns_to_drop = [
             "screenshots",
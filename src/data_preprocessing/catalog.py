@@ -0,0 +1,226 @@
+from __future__ import annotations
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
+from .data_cleaners import DEDUP_COLUMNS, OWNER_COLUMNS
+from .utilities import (
+    active_steps,
+    restore_list_columns,
+    run_finalize,
+    run_row_local,
+)
+
+
+_SEQ = "_seq"
+_SURVIVOR = "_survivor"
+_UNKNOWN_YEAR = "unknown"
+_POSITIONS_FILE = "positions.parquet"
+
+
+class CatalogStore:
+    """Preprocessed catalog on disk that takes daily deltas keyed by ``appid``.
+
+    ``build`` runs ``pipeline`` (``base_pipeline`` by default) over the full
+    CSV once and stores every row that passed the row-local steps as
+    Parquet, one file per release year, before deduplication. Each row
+    keeps its CSV position (``_seq``, recorded for every CSV row in
+    ``positions.parquet``), its owner range columns and a
+    ``_survivor`` flag marking the row the pipeline's ``finalize`` keeps
+    for its name/developers/publishers key.
+
+    ``update`` reads a delta CSV with the same columns, replaces all stored
+    rows of the delta's appids (new appids are appended), runs the
+    row-local steps on the delta rows only and recomputes ``_survivor``
+    for the affected dedup keys only. Only the release-year files that
+    gain, lose or re-flag rows are rewritten. ``read`` returns what the
+    pipeline returns for the CSV with the delta applied in place.
+    ``appid`` is expected to be unique per app.
+    """
+
+    def __init__(self, store_dir: str, pipeline: Pipeline | None = None):
+        from .pipelines import base_pipeline
+
+        self.store_dir = store_dir
+        self.pipeline = clone(pipeline if pipeline is not None else base_pipeline)
+
+    def _load(self, filepath):
+        loader = active_steps(self.pipeline)[0]
+        loader = clone(loader).set_params(filepath=filepath, cache_dir=None)
+        return loader.transform(None)
+
+    def _row_local(self, df):
+        return run_row_local(active_steps(self.pipeline)[1:], df, fit=True)
+
+    def _finalize(self, df):
+        return run_finalize(active_steps(self.pipeline)[1:], df)
+
+    def _survivors(self, candidates):
+        """Index (``_seq``) of the rows the pipeline keeps among candidates."""
+        return self._finalize(candidates.sort_index()).index
+
+    # --- storage -----------------------------------------------------------
+
+    @staticmethod
+    def _year(release_date):
+        years = pd.to_datetime(release_date).dt.year
+        return years.map(lambda y: _UNKNOWN_YEAR if pd.isna(y) else str(int(y)))
+
+    def _partition_path(self, year):
+        return os.path.join(self.store_dir, f"release_year={year}", "part.parquet")
+
+    def _years(self):
+        if not os.path.isdir(self.store_dir):
+            return []
+        return sorted(
+            entry.name.split("=", 1)[1]
+            for entry in os.scandir(self.store_dir)
+            if entry.name.startswith("release_year=")
+        )
+
+    def _read_partition(self, year, columns=None):
+        path = self._partition_path(year)
+        if not os.path.exists(path):
+            return None
+        return pq.read_table(path, columns=columns).to_pandas()
+
+    def _write_partition(self, year, df):
+        path = self._partition_path(year)
+        if df.empty:
+            if os.path.exists(path):
+                shutil.rmtree(os.path.dirname(path))
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df = df.sort_values(_SEQ, kind="stable").reset_index(drop=True)
+        df["estimated_owners"] = df["estimated_owners"].astype(str)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+
+    def _read_positions(self):
+        return pd.read_parquet(os.path.join(self.store_dir, _POSITIONS_FILE))
+
+    def _write_positions(self, positions):
+        path = os.path.join(self.store_dir, _POSITIONS_FILE)
+        positions.to_parquet(f"{path}.tmp", index=False)
+        os.replace(f"{path}.tmp", path)
+
+    def _stored(self, df):
+        """Row-local output with its ``_seq`` index moved into a column."""
+        return df.rename_axis(_SEQ).reset_index()
+
+    # --- public API --------------------------------------------------------
+
+    def build(self, filepath: str):
+        df = self._load(filepath)
+        positions = pd.DataFrame({"appid": df["appid"], _SEQ: df.index})
+        df = self._row_local(df)
+        df[_SURVIVOR] = df.index.isin(self._survivors(df))
+
+        if os.path.isdir(self.store_dir):
+            shutil.rmtree(self.store_dir)
+        stored = self._stored(df)
+        for year, part in stored.groupby(self._year(stored["release_date"])):
+            self._write_partition(year, part)
+        self._write_positions(positions)
+        return self
+
+    def update(self, filepath: str) -> int:
+        """Apply a delta CSV; returns the number of delta rows stored."""
+        if not self._years():
+            raise RuntimeError(
+                "CatalogStore is empty. Call build() before update()."
+            )
+        key_columns = ["appid", "release_date", _SEQ, _SURVIVOR]
+        index = pd.concat(
+            [
+                self._read_partition(
+                    year, columns=key_columns + DEDUP_COLUMNS + OWNER_COLUMNS
+                )
+                for year in self._years()
+            ],
+            ignore_index=True,
+        )
+
+        delta = self._load(filepath)
+        replaced = index["appid"].isin(delta["appid"])
+
+        # Changed apps take over the CSV positions of their old rows, also
+        # of rows the row-local steps had filtered out; new apps are
+        # appended, as if the delta had been applied to the CSV in place.
+        def numbered(frame):
+            return frame.assign(n=frame.groupby("appid").cumcount())
+
+        positions = self._read_positions()
+        seq = (
+            numbered(delta[["appid"]])
+            .merge(numbered(positions), on=["appid", "n"], how="left")[_SEQ]
+            .to_numpy(dtype=float, copy=True)
+        )
+        new = np.isnan(seq)
+        seq[new] = len(positions) + np.arange(new.sum())
+        delta.index = pd.Index(seq.astype(np.int64))
+        positions = pd.concat(
+            [positions, pd.DataFrame({"appid": delta["appid"][new], _SEQ: seq[new]})],
+            ignore_index=True,
+        ).astype({_SEQ: np.int64})
+
+        processed = self._row_local(delta)
+
+        # Only rows sharing a dedup key with a removed or added row can
+        # change their survivor status.
+        keep = index[~replaced]
+        touched = pd.concat(
+            [index.loc[replaced, DEDUP_COLUMNS], processed[DEDUP_COLUMNS]]
+        )
+        affected_keys = pd.MultiIndex.from_frame(touched.fillna("\0"))
+        candidates = keep[
+            pd.MultiIndex.from_frame(keep[DEDUP_COLUMNS].fillna("\0")).isin(
+                affected_keys
+            )
+        ].set_index(_SEQ)
+        pool = pd.concat(
+            [
+                candidates[DEDUP_COLUMNS + OWNER_COLUMNS],
+                processed[DEDUP_COLUMNS + OWNER_COLUMNS].astype(
+                    {"estimated_owners": str}
+                ),
+            ]
+        )
+        survivors = self._survivors(pool)
+
+        processed[_SURVIVOR] = processed.index.isin(survivors)
+        flipped = candidates.index[
+            candidates[_SURVIVOR] != candidates.index.isin(survivors)
+        ]
+
+        stored = self._stored(processed)
+        stored_years = self._year(stored["release_date"])
+        years = (
+            set(self._year(index.loc[replaced, "release_date"]))
+            | set(stored_years)
+            | set(self._year(candidates.loc[flipped, "release_date"]))
+        )
+        for year in years:
+            part = self._read_partition(year)
+            if part is None:
+                part = stored.iloc[:0]
+            else:
+                part = part[~part["appid"].isin(delta["appid"])]
+                in_pool = part[_SEQ].isin(candidates.index)
+                part.loc[in_pool, _SURVIVOR] = part.loc[in_pool, _SEQ].isin(survivors)
+            part = pd.concat([part, stored[stored_years == year]], ignore_index=True)
+            self._write_partition(year, part)
+        self._write_positions(positions)
+        return len(processed)
+
+    def read(self) -> pd.DataFrame:
+        parts = [self._read_partition(year) for year in self._years()]
+        df = pd.concat(parts, ignore_index=True)
+        df = df[df[_SURVIVOR]].drop(columns=_SURVIVOR)
+        df = df.set_index(_SEQ).rename_axis(None).sort_index()
+        return self._finalize(restore_list_columns(df))
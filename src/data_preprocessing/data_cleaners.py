@@ -1,101 +1,224 @@
 import pandas as pd
 import numpy as np
-import ast
 from sklearn.base import BaseEstimator, TransformerMixin
+from .parsing import decode_owner_ranges, parse_literal, parse_literal_series
+from .utilities import DefaultParamsOnLoadMixin
 
 
-class DataCleaner(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
+# Rows describing the same game; DataCleaner keeps one per key.
+DEDUP_COLUMNS = ["name", "developers", "publishers"]
+# Raw owner range and its decoded bounds (see FeatureEngineer); only needed
+# for the deduplication.
+OWNER_COLUMNS = [
+    "estimated_owners",
+    "estimated_owners_lower",
+    "estimated_owners_upper",
+]
+
+
+class DataCleaner(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    """Backfill developers/publishers, repair review percentages, deduplicate.
+
+    Everything except the deduplication is row-local and available as
+    ``transform_chunk``; ``finalize`` holds the deduplication so chunked
+    runs can defer it to one final pass.
+    """
+
+    def __init__(self, copy=True):
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
-    def transform(self, X):
-        df = X.copy()
-
-        df.loc[df["publishers"] == "[]", "publishers"] = df.loc[
-            df["publishers"] == "[]", "developers"
-        ]
-        df.loc[df["developers"] == "[]", "developers"] = df.loc[
-            df["developers"] == "[]", "publishers"
-        ]
+    def transform_chunk(self, X):
+        df = X.copy() if self.copy else X
+
+        developers, publishers = df["developers"], df["publishers"]
+        # Each "[]" mask is computed once; rows lacking both are dropped in
+        # a single filter, the others are backfilled from each other.
+        no_developers = (developers == "[]").to_numpy(dtype=bool, na_value=False)
+        no_publishers = (publishers == "[]").to_numpy(dtype=bool, na_value=False)
+        if no_publishers.any():
+            df["publishers"] = publishers.mask(no_publishers, developers)
+        if no_developers.any():
+            df["developers"] = developers.mask(no_developers, publishers)
+        keep = ~(no_developers & no_publishers)
+        if not keep.all():
+            df = df[keep]
+
+        positive, negative = df["positive"], df["negative"]
+        total_reviews = positive + negative
+        missing = df["pct_pos_total"] == -1
+        pct = df["pct_pos_total"].astype(float)
+        pct = pct.mask(missing & (positive == 0) & (negative == 0), 50.0)
+        df["pct_pos_total"] = pct.mask(
+            missing & (total_reviews > 0), (positive / total_reviews * 100).round(2)
+        )
 
-        df = df[df["developers"] != "[]"]
-        df = df[df["publishers"] != "[]"]
+        return df
 
-        df = df.sort_values(by="estimated_owners", ascending=False)
-        df = df.drop_duplicates(
-            subset=["name", "developers", "publishers"], keep="first"
+    def finalize(self, X):
+        # A stable descending lexsort on the integer owner bounds puts, per
+        # key, the row with the highest lower bound first, the highest upper
+        # bound among those, and the earliest row among full ties, so the
+        # survivors do not depend on how the rows were chunked.
+        if "estimated_owners_lower" in X:
+            lower_bound = X["estimated_owners_lower"].to_numpy()
+            upper_bound = X["estimated_owners_upper"].to_numpy()
+        else:
+            lower_bound, upper_bound = decode_owner_ranges(X["estimated_owners"])
+        order = np.lexsort(
+            (-upper_bound.astype(np.int64), -lower_bound.astype(np.int64))
         )
-        df = df.drop(columns=["estimated_owners"])
+        duplicated = X[DEDUP_COLUMNS].iloc[order].duplicated().to_numpy()
+        df = X.iloc[np.sort(order[~duplicated])]
+        return df.drop(columns=[col for col in OWNER_COLUMNS if col in df])
 
-        mask = df["pct_pos_total"] == -1
-        zero_reviews_mask = mask & (df["positive"] == 0) & (df["negative"] == 0)
-        df.loc[zero_reviews_mask, "pct_pos_total"] = 50
+    def transform(self, X):
+        return self.finalize(self.transform_chunk(X))
 
-        total_reviews = df["positive"] + df["negative"]
-        calc_mask = mask & (total_reviews > 0)
-        df["pct_pos_total"] = df["pct_pos_total"].astype(float)
-        df.loc[calc_mask, "pct_pos_total"] = (
-            df.loc[calc_mask, "positive"] / total_reviews[calc_mask] * 100
-        ).round(2)
 
-        return df
+# Hand-picked (min, max) per column used by OutlierRemover; also the default
+# columns of FittedOutlierRemover.
+OUTLIER_BOUNDS = {
+    "price": (0, 100),
+    "dlc_count": (0, 20),
+    "achievements": (0, 100),
+    "average_playtime_forever": (0, 6000),
+    "median_playtime_forever": (0, 6500),
+    "screenshot_count": (0, 50),
+    "movie_count": (0, 25),
+    "description_word_count": (0, 1000),
+    "estimated_owners_calculated": (0, 2500000),
+}
+
 
+def _within_bounds(values, lower, upper):
+    # NaN fails both comparisons, so rows with missing values are outliers.
+    return ((values >= lower) & (values <= upper)).all(axis=1)
 
-class OutlierRemover(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
+
+class OutlierRemover(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    def __init__(self, copy=True):
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X):
-        df = X.copy()
-
-        bounds = {
-            "price": (0, 100),
-            "dlc_count": (0, 20),
-            "achievements": (0, 100),
-            "average_playtime_forever": (0, 6000),
-            "median_playtime_forever": (0, 6500),
-            "screenshot_count": (0, 50),
-            "movie_count": (0, 25),
-            "description_word_count": (0, 1000),
-            "estimated_owners_calculated": (0, 2500000),
-        }
-
-        masks = [
-            (df[col] >= min_val) & (df[col] <= max_val)
-            for col, (min_val, max_val) in bounds.items()
-        ]
+        df = X.copy() if self.copy else X
 
-        combined_mask = np.ones(len(df), dtype=bool)
-        for mask in masks:
-            combined_mask = combined_mask & mask
+        lower, upper = np.array(list(OUTLIER_BOUNDS.values()), dtype=float).T
+        values = df[list(OUTLIER_BOUNDS)].to_numpy(dtype=float)
+        combined_mask = _within_bounds(values, lower, upper)
 
         return df[combined_mask].reset_index(drop=True)
 
 
-class ListProcessor(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
+class FittedOutlierRemover(BaseEstimator, TransformerMixin):
+    """OutlierRemover with per-column bounds learned from the training data.
+
+    ``method`` picks the bounds: ``"quantile"`` uses ``quantile_range``,
+    ``"iqr"`` extends the quartiles by ``factor`` (default 1.5) times the
+    interquartile range and ``"mad"`` the median by ``factor`` (default 3.5)
+    times the scaled median absolute deviation. All columns are fitted at
+    once on a stacked 2D array, and ``action`` decides what happens to
+    out-of-range rows: ``"drop"`` them (as OutlierRemover does), ``"clip"``
+    them to the bounds or ``"raise"`` a ValueError, e.g. to reject a
+    request at serving time. The fitted estimator is small and is dumped
+    with joblib next to the model like the scaling pipeline.
+    """
+
+    _DEFAULT_FACTORS = {"iqr": 1.5, "mad": 3.5}
+
+    def __init__(
+        self,
+        columns=None,
+        method="iqr",
+        quantile_range=(0.01, 0.99),
+        factor=None,
+        action="drop",
+        copy=True,
+    ):
+        self.columns = columns
+        self.method = method
+        self.quantile_range = quantile_range
+        self.factor = factor
+        self.action = action
+        self.copy = copy
+
+    def fit(self, X, y=None):
+        if self.method not in ("quantile", "iqr", "mad"):
+            raise ValueError("method must be 'quantile', 'iqr' or 'mad'")
+
+        self.columns_ = list(self.columns or OUTLIER_BOUNDS)
+        values = X[self.columns_].to_numpy(dtype=float)
+        factor = self.factor
+        if factor is None:
+            factor = self._DEFAULT_FACTORS.get(self.method)
+
+        if self.method == "quantile":
+            self.lower_, self.upper_ = np.nanquantile(
+                values, self.quantile_range, axis=0
+            )
+        elif self.method == "iqr":
+            q1, q3 = np.nanquantile(values, (0.25, 0.75), axis=0)
+            self.lower_ = q1 - factor * (q3 - q1)
+            self.upper_ = q3 + factor * (q3 - q1)
+        else:
+            median = np.nanmedian(values, axis=0)
+            # 1.4826 makes the MAD a consistent estimate of the std deviation.
+            mad = 1.4826 * np.nanmedian(np.abs(values - median), axis=0)
+            self.lower_ = median - factor * mad
+            self.upper_ = median + factor * mad
+        return self
+
+    def transform(self, X):
+        if not hasattr(self, "lower_"):
+            raise RuntimeError(
+                "FittedOutlierRemover instance is not fitted yet. "
+                "Call fit() before transform()."
+            )
+
+        df = X.copy() if self.copy else X
+        values = df[self.columns_].to_numpy(dtype=float)
+
+        if self.action == "clip":
+            df[self.columns_] = np.clip(values, self.lower_, self.upper_)
+            return df
+
+        within = _within_bounds(values, self.lower_, self.upper_)
+        if self.action == "raise":
+            if not within.all():
+                outside = ~((values >= self.lower_) & (values <= self.upper_))
+                columns = [
+                    col for col, bad in zip(self.columns_, outside.any(axis=0)) if bad
+                ]
+                raise ValueError(f"Values out of the fitted bounds in {columns}")
+            return df
+        return df[within].reset_index(drop=True)
+
+
+class ListProcessor(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    def __init__(self, copy=True):
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
     def safe_literal_eval(self, x):
+        if isinstance(x, list):
+            return sorted([item.lower() for item in x])
         if pd.isna(x) or x == "" or x == "[]":
             return []
         try:
-            items = ast.literal_eval(x)
+            items = parse_literal(x)
             return sorted([item.lower() for item in items])
         except (ValueError, SyntaxError):
             return []
 
     def transform(self, X):
-        df = X.copy()
+        df = X.copy() if self.copy else X
 
         list_columns = [
             "categories",
@@ -105,7 +228,10 @@ class ListProcessor(BaseEstimator, TransformerMixin):
         ]
 
         for col in list_columns:
-            df[col] = df[col].apply(self.safe_literal_eval)
+            parsed = parse_literal_series(df[col], errors="coerce")
+            df[col] = parsed.map(
+                lambda items: sorted([item.lower() for item in items]) if items else []
+            )
 
         df["full_audio_languages"] = df["full_audio_languages"].apply(
             lambda x: x if x else ["No full audio support"]
@@ -114,15 +240,15 @@ class ListProcessor(BaseEstimator, TransformerMixin):
         return df
 
 
-class DataCleanerFinal(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
+class DataCleanerFinal(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    def __init__(self, copy=True):
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X):
-        df = X.copy()
+        df = X.copy() if self.copy else X
 
         columns_to_drop_final = [
             "appid",
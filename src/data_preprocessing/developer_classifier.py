@@ -1,20 +1,130 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
-import ast
 import re
-from typing import Any, Dict, List, Sequence
+import unicodedata
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, List, Mapping, Sequence, Tuple
 from sklearn.base import BaseEstimator, TransformerMixin
-from metadata_options import get_developer_tiers
+from metadata_options import get_normalised_developer_tiers
+from .parsing import parse_literal, parse_literal_series
+from .utilities import DefaultParamsOnLoadMixin
 
 
-class DeveloperTierClassifier(BaseEstimator, TransformerMixin):
+def _tier_ranks(
+    tier_sets: Mapping[str, AbstractSet[str]], tier_order: Sequence[str]
+) -> Dict[str, int]:
+    # Best (lowest) rank wins for developers listed under several tiers.
+    ranks: Dict[str, int] = {}
+    for rank, tier in reversed(list(enumerate(tier_order))):
+        ranks.update(dict.fromkeys(tier_sets.get(tier, ()), rank))
+    return ranks
+
+
+# Legal-form and studio suffixes dropped from the end of alias keys, and
+# words too generic to identify a developer on their own.
+_ALIAS_SUFFIXES = frozenset(
+    {
+        "studio",
+        "studios",
+        "inc",
+        "incorporated",
+        "ltd",
+        "limited",
+        "llc",
+        "corp",
+        "corporation",
+        "co",
+        "gmbh",
+    }
+)
+_GENERIC_TOKENS = frozenset(
+    {"the", "game", "games", "digital", "interactive", "software", "team"}
+)
+_DROPPABLE_TOKENS = _ALIAS_SUFFIXES | _GENERIC_TOKENS
+
+
+def _alias_tokens(name: str) -> List[str]:
+    """Casefolded, accent-free, punctuation-free tokens."""
+    folded = unicodedata.normalize("NFKD", name)
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch)).casefold()
+    return re.sub(r"[\W_]+", " ", folded).split()
+
+
+def _strip_suffixes(tokens: Sequence[str]) -> List[str]:
+    tokens = list(tokens)
+    while len(tokens) > 1 and tokens[-1] in _ALIAS_SUFFIXES:
+        tokens.pop()
+    return tokens
+
+
+def _alias_index(ranks: Mapping[str, int]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Alias keys of the tier list: full token keys and suffix-free stems.
+
+    A stem is only recorded for multi-token names that lose a legal-form
+    or studio suffix ("valve corporation" -> "valve"), never for names
+    that are a single word to begin with. Best (lowest) rank wins when
+    several names fold to the same key.
+    """
+    full: Dict[str, int] = {}
+    stems: Dict[str, int] = {}
+    for name, rank in ranks.items():
+        tokens = _alias_tokens(name)
+        stem = _strip_suffixes(tokens)
+        for keys, key_tokens in ((full, tokens), (stems, stem)):
+            if keys is stems and len(stem) == len(tokens):
+                continue
+            key = " ".join(key_tokens)
+            if key and rank < keys.get(key, rank + 1):
+                keys[key] = rank
+    return full, stems
+
+
+def _alias_rank(
+    name: str, index: Tuple[Mapping[str, int], Mapping[str, int]]
+) -> float:
+    """Best (lowest) rank of ``name`` in the alias index, or NaN.
+
+    The whole name matches any key that folds to the same tokens. Shorter
+    token prefixes are tried while every dropped token is a suffix or
+    generic word. They match stems and multi-token keys, and one-word
+    keys only when just legal-form or studio suffixes were dropped. So
+    "Ubisoft Montréal Studio" finds "ubisoft montreal", "SEGA Corporation"
+    finds "sega" and "Valve Software" finds "Valve Corporation", while
+    "Zero Games" does not match a listed "Zero" and "Moon Rabbit Games"
+    does not match "Moon Studios GmbH".
+    """
+    full, stems = index
+    tokens = _alias_tokens(name)
+    candidates = [full.get(" ".join(tokens))]
+    only_suffixes = True
+    for end in range(len(tokens) - 1, 0, -1):
+        if tokens[end] not in _DROPPABLE_TOKENS:
+            break
+        only_suffixes = only_suffixes and tokens[end] in _ALIAS_SUFFIXES
+        key = " ".join(tokens[:end])
+        if end > 1 or only_suffixes:
+            candidates.append(full.get(key))
+        candidates.append(stems.get(key))
+    ranks = [rank for rank in candidates if rank is not None]
+    return min(ranks) if ranks else np.nan
+
+
+@lru_cache(maxsize=None)
+def _default_tier_ranks(tier_order: Tuple[str, ...]) -> Dict[str, int]:
+    return _tier_ranks(get_normalised_developer_tiers(), tier_order)
+
+
+class DeveloperTierClassifier(
+    DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin
+):
     _LIST_LIKE = re.compile(r"^\s*[\[\(\{].*[\]\)\}]\s*$")
 
     def safe_literal_eval(self, x):
         if pd.isna(x) or x == "" or x == "[]":
             return []
         try:
-            items = ast.literal_eval(x)
+            items = parse_literal(x)
             return sorted([item.lower() for item in items])
         except (ValueError, SyntaxError):
             return []
@@ -23,19 +133,32 @@ class DeveloperTierClassifier(BaseEstimator, TransformerMixin):
         self,
         tier_mapping: Dict[str, Sequence[str]] | None = None,
         tier_order: Sequence[str] = ("aaa", "aa+", "aa", "a"),
+        copy: bool = True,
+        alias_matching: bool = False,
     ) -> None:
         self.tier_mapping = tier_mapping
         self.tier_order = tuple(tier_order)
-        self._tier_sets: Dict[str, set[str]] | None = None
+        self.copy = copy
+        self.alias_matching = alias_matching
+        self._tier_sets: Dict[str, frozenset[str]] | None = None
+        self._tier_ranks: Dict[str, int] | None = None
+        self._alias_index: Tuple[Dict[str, int], Dict[str, int]] | None = None
 
     @staticmethod
     def _normalise_name(name: Any) -> str:
         return str(name).strip().lower()
 
-    def _prepare_tier_sets(self) -> Dict[str, set[str]]:
-        mapping = self.tier_mapping or get_developer_tiers()
+    def _prepare_tier_sets(self) -> Dict[str, frozenset[str]]:
+        if not self.tier_mapping:
+            # Precompiled once per process in metadata_options.
+            defaults = get_normalised_developer_tiers()
+            return {
+                tier: defaults.get(tier, frozenset()) for tier in self.tier_order
+            }
         return {
-            tier: {self._normalise_name(dev) for dev in mapping.get(tier, [])}
+            tier: frozenset(
+                self._normalise_name(dev) for dev in self.tier_mapping.get(tier, [])
+            )
             for tier in self.tier_order
         }
 
@@ -48,7 +171,7 @@ class DeveloperTierClassifier(BaseEstimator, TransformerMixin):
 
         if isinstance(cell, str) and self._LIST_LIKE.match(cell):
             try:
-                parsed = ast.literal_eval(cell)
+                parsed = parse_literal(cell)
                 if isinstance(parsed, (list, set, tuple)):
                     return [self._normalise_name(d) for d in parsed]
             except (ValueError, SyntaxError):
@@ -59,8 +182,25 @@ class DeveloperTierClassifier(BaseEstimator, TransformerMixin):
             self._normalise_name(d) for d in re.split(r"[;,]", cleaned) if d.strip()
         ]
 
+    def _prepare_tier_ranks(self) -> Dict[str, int]:
+        if not self.tier_mapping:
+            return _default_tier_ranks(self.tier_order)
+        return _tier_ranks(self._tier_sets, self.tier_order)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Classifiers pickled before the rank lookup only stored tier sets.
+        if "_tier_ranks" not in self.__dict__:
+            fitted = self.__dict__.get("_tier_sets") is not None
+            self._tier_ranks = self._prepare_tier_ranks() if fitted else None
+            self._alias_index = None
+
     def fit(self, X: pd.DataFrame, y: Any = None):
         self._tier_sets = self._prepare_tier_sets()
+        self._tier_ranks = self._prepare_tier_ranks()
+        self._alias_index = (
+            _alias_index(self._tier_ranks) if self.alias_matching else None
+        )
         return self
 
     def _mark_developer_tier(
@@ -69,16 +209,54 @@ class DeveloperTierClassifier(BaseEstimator, TransformerMixin):
         dev_col: str = "developers",
         tier_col: str = "developer_tier",
     ) -> pd.DataFrame:
-        tier_sets = self._tier_sets or {}
+        """Best tier per row from one hash lookup per listed developer.
+
+        Distinct developer cells are parsed once, exploded to one developer
+        per row, mapped to their tier rank and reduced with a group-min.
+        With ``alias_matching`` names without an exact match are looked up
+        in the alias index, and ``alias_tier_changes_`` counts the rows
+        whose tier differs from exact matching.
+        """
+        cells = df[dev_col]
+        try:
+            codes, uniques = pd.factorize(cells)
+        except TypeError:  # already parsed list cells are unhashable
+            codes, uniques = np.arange(len(cells)), cells.to_numpy(dtype=object)
+
+        # Well-formed list literals take the fast parser and are normalised
+        # column-wise; every other cell goes through _parse_developers.
+        parsed = parse_literal_series(pd.Series(uniques, dtype=object), errors="coerce")
+        developers = pd.Series(
+            [
+                value if isinstance(value, list) else self._parse_developers(cell)
+                for value, cell in zip(parsed, uniques)
+            ],
+            dtype=object,
+        ).explode()
+        names = developers.dropna().astype(str).str.strip().str.lower()
+
+        def best_rank(ranks: pd.Series) -> np.ndarray:
+            return (
+                ranks.groupby(level=0)
+                .min()
+                .reindex(range(len(uniques)))
+                .fillna(len(self.tier_order))
+                .to_numpy(dtype=int)
+            )
 
-        def classify(cell: Any) -> str:
-            devs = self._parse_developers(cell)
-            for tier in self.tier_order:
-                if any(dev in tier_sets.get(tier, set()) for dev in devs):
-                    return tier
-            return "indie"
+        exact = names.map(self._tier_ranks or {})
+        ranks = best_rank(exact)
+        if self._alias_index is not None:
+            unmatched = pd.unique(names[exact.isna()])
+            aliases = {name: _alias_rank(name, self._alias_index) for name in unmatched}
+            alias_ranks = best_rank(exact.fillna(names.map(aliases)))
+            changed = np.append(alias_ranks != ranks, False)[codes]
+            self.alias_tier_changes_ = int(changed.sum())
+            ranks = alias_ranks
 
-        df[tier_col] = df[dev_col].apply(classify)
+        # Missing cells have code -1 and pick the trailing "indie".
+        labels = np.array([*self.tier_order, "indie"], dtype=object)
+        df[tier_col] = np.append(labels[ranks], "indie")[codes]
         return df
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
@@ -88,5 +266,5 @@ class DeveloperTierClassifier(BaseEstimator, TransformerMixin):
                 "Call fit() before transform()."
             )
 
-        df = X.copy(deep=True)
+        df = X.copy(deep=True) if self.copy else X
         return self._mark_developer_tier(df)
@@ -1,156 +1,155 @@
+import numpy as np
 import pandas as pd
-import ast
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import OneHotEncoder, MultiLabelBinarizer
+from .parsing import parse_literal_series
+from .utilities import DefaultParamsOnLoadMixin
 
 
-class CategoricalEncoder(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        self.weekday_encoder = OneHotEncoder(sparse_output=False)
-        self.developer_tier_encoder = OneHotEncoder(sparse_output=False)
+def _encoded_frame(encoded, columns, index):
+    """Wrap an encoder result, keeping CSR output sparse (pandas SparseDtype)."""
+    if sparse.issparse(encoded):
+        # from_spmatrix gives float matrices a NaN fill value, which would turn
+        # every implicit zero into NaN; 0/1 indicators are exact as integers.
+        if encoded.dtype.kind == "f":
+            encoded = encoded.astype(np.int64)
+        return pd.DataFrame.sparse.from_spmatrix(encoded, index=index, columns=columns)
+    return pd.DataFrame(encoded, columns=columns, index=index)
+
+
+class CategoricalEncoder(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    """One-hot encode ``weekday`` and ``developer_tier``.
+
+    Indicator columns use ``dtype`` (``np.uint8`` by default, ``bool`` also
+    works) rather than float64. Note that ``select_dtypes(include=np.number)``
+    leaves out bool columns.
+    """
+
+    def __init__(self, copy=True, sparse_output=False, dtype=np.uint8):
+        self.copy = copy
+        self.sparse_output = sparse_output
+        self.dtype = dtype
+        self.weekday_encoder = OneHotEncoder(sparse_output=sparse_output, dtype=dtype)
+        self.developer_tier_encoder = OneHotEncoder(
+            sparse_output=sparse_output, dtype=dtype
+        )
         self.weekday_feature_names = None
         self.developer_tier_feature_names = None
 
     def fit(self, X, y=None):
-        df = X.copy()
-        self.weekday_encoder.fit(df[["weekday"]])
+        self.weekday_encoder.set_params(
+            sparse_output=self.sparse_output, dtype=self.dtype
+        )
+        self.developer_tier_encoder.set_params(
+            sparse_output=self.sparse_output, dtype=self.dtype
+        )
+
+        self.weekday_encoder.fit(X[["weekday"]])
         self.weekday_feature_names = [
             f"weekday_{cat}" for cat in self.weekday_encoder.categories_[0]
         ]
 
-        self.developer_tier_encoder.fit(df[["developer_tier"]])
+        self.developer_tier_encoder.fit(X[["developer_tier"]])
         self.developer_tier_feature_names = [
             f"developer_tier_{cat}" for cat in self.developer_tier_encoder.categories_[0]
         ]
         return self
 
     def transform(self, X):
-        df = X.copy()
+        df = X.copy() if self.copy else X
         weekday_encoded = self.weekday_encoder.transform(df[["weekday"]])
-        weekday_df = pd.DataFrame(
-            weekday_encoded, columns=self.weekday_feature_names, index=df.index
+        weekday_df = _encoded_frame(
+            weekday_encoded, self.weekday_feature_names, df.index
         )
 
         developer_tier_encoded = self.developer_tier_encoder.transform(df[["developer_tier"]])
-        developer_tier_df = pd.DataFrame(
-            developer_tier_encoded, columns=self.developer_tier_feature_names, index=df.index
+        developer_tier_df = _encoded_frame(
+            developer_tier_encoded, self.developer_tier_feature_names, df.index
         )
 
         df = df.drop(columns=["weekday", "developer_tier"])
         return pd.concat([df, weekday_df, developer_tier_df], axis=1)
 
 
-class MultiLabelEncoder(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        self.genres_tags_encoder = MultiLabelBinarizer()
-        self.categories_encoder = MultiLabelBinarizer()
-        self.supported_languages_encoder = MultiLabelBinarizer()
-        self.full_audio_languages_encoder = MultiLabelBinarizer()
-        self.genres_tags_feature_names = None
-        self.categories_feature_names = None
-        self.supported_languages_feature_names = None
-        self.full_audio_languages_feature_names = None
+class MultiLabelEncoder(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    """One-hot encode the list columns produced by ``ListProcessor``.
 
-    def fit(self, X, y=None):
-        df = X.copy()
-
-        genres_tags_lists = df["genres_tags"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-        )
-        self.genres_tags_encoder.fit(genres_tags_lists)
+    Columns that already hold parsed lists are used as they are; string
+    columns are parsed once per call, and ``fit_transform`` shares that
+    parse between fitting and encoding. With ``sparse_output=True`` the
+    indicator columns stay sparse end to end; see ``to_csr_matrix``.
+    Indicators use ``dtype`` (``np.uint8`` by default) instead of int64.
+    """
 
-        categories_lists = df["categories"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-        )
-        self.categories_encoder.fit(categories_lists)
+    list_columns = [
+        "genres_tags",
+        "categories",
+        "supported_languages",
+        "full_audio_languages",
+    ]
 
-        supported_languages_lists = df["supported_languages"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
+    def __init__(self, copy=True, sparse_output=False, dtype=np.uint8):
+        self.copy = copy
+        self.sparse_output = sparse_output
+        self.dtype = dtype
+        self.genres_tags_encoder = MultiLabelBinarizer(sparse_output=sparse_output)
+        self.categories_encoder = MultiLabelBinarizer(sparse_output=sparse_output)
+        self.supported_languages_encoder = MultiLabelBinarizer(
+            sparse_output=sparse_output
         )
-        self.supported_languages_encoder.fit(supported_languages_lists)
-
-        full_audio_languages_lists = df["full_audio_languages"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
+        self.full_audio_languages_encoder = MultiLabelBinarizer(
+            sparse_output=sparse_output
         )
-        self.full_audio_languages_encoder.fit(full_audio_languages_lists)
-
-        self.genres_tags_feature_names = [
-            f"genres_tags_{cat}" for cat in self.genres_tags_encoder.classes_
-        ]
-        self.categories_feature_names = [
-            f"categories_{cat}" for cat in self.categories_encoder.classes_
-        ]
-        self.supported_languages_feature_names = [
-            f"supported_languages_{cat}"
-            for cat in self.supported_languages_encoder.classes_
-        ]
-        self.full_audio_languages_feature_names = [
-            f"full_audio_languages_{cat}"
-            for cat in self.full_audio_languages_encoder.classes_
-        ]
+        self.genres_tags_feature_names = None
+        self.categories_feature_names = None
+        self.supported_languages_feature_names = None
+        self.full_audio_languages_feature_names = None
 
+    @staticmethod
+    def _as_lists(series):
+        if any(isinstance(value, str) for value in series):
+            return parse_literal_series(series)
+        return series
+
+    def _parse_lists(self, X):
+        return {col: self._as_lists(X[col]) for col in self.list_columns}
+
+    def _fit_lists(self, lists):
+        for col in self.list_columns:
+            encoder = getattr(self, f"{col}_encoder")
+            encoder.set_params(sparse_output=self.sparse_output)
+            encoder.fit(lists[col])
+            setattr(
+                self,
+                f"{col}_feature_names",
+                [f"{col}_{cat}" for cat in encoder.classes_],
+            )
         return self
 
-    def transform(self, X):
-        df = X.copy()
-
-        genres_tags_lists = df["genres_tags"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-        )
-        genres_tags_encoded = self.genres_tags_encoder.transform(genres_tags_lists)
-
-        categories_lists = df["categories"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-        )
-        categories_encoded = self.categories_encoder.transform(categories_lists)
-
-        supported_languages_lists = df["supported_languages"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-        )
-        supported_languages_encoded = self.supported_languages_encoder.transform(
-            supported_languages_lists
-        )
+    def _transform_lists(self, X, lists):
+        df = X.copy() if self.copy else X
+
+        encoded_dfs = [
+            _encoded_frame(
+                getattr(self, f"{col}_encoder")
+                .transform(lists[col])
+                .astype(self.dtype, copy=False),
+                getattr(self, f"{col}_feature_names"),
+                df.index,
+            )
+            for col in self.list_columns
+        ]
 
-        full_audio_languages_lists = df["full_audio_languages"].apply(
-            lambda x: ast.literal_eval(x) if isinstance(x, str) else x
-        )
-        full_audio_languages_encoded = self.full_audio_languages_encoder.transform(
-            full_audio_languages_lists
-        )
+        df = df.drop(columns=self.list_columns)
+        return pd.concat([df, *encoded_dfs], axis=1)
 
-        genres_tags_df = pd.DataFrame(
-            genres_tags_encoded, columns=self.genres_tags_feature_names, index=df.index
-        )
-        categories_df = pd.DataFrame(
-            categories_encoded, columns=self.categories_feature_names, index=df.index
-        )
-        supported_languages_df = pd.DataFrame(
-            supported_languages_encoded,
-            columns=self.supported_languages_feature_names,
-            index=df.index,
-        )
-        full_audio_languages_df = pd.DataFrame(
-            full_audio_languages_encoded,
-            columns=self.full_audio_languages_feature_names,
-            index=df.index,
-        )
+    def fit(self, X, y=None):
+        return self._fit_lists(self._parse_lists(X))
 
-        df = df.drop(
-            columns=[
-                "genres_tags",
-                "categories",
-                "supported_languages",
-                "full_audio_languages",
-            ]
-        )
+    def transform(self, X):
+        return self._transform_lists(X, self._parse_lists(X))
 
-        return pd.concat(
-            [
-                df,
-                genres_tags_df,
-                categories_df,
-                supported_languages_df,
-                full_audio_languages_df,
-            ],
-            axis=1,
-        )
+    def fit_transform(self, X, y=None):
+        lists = self._parse_lists(X)
+        return self._fit_lists(lists)._transform_lists(X, lists)
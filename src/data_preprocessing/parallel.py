@@ -0,0 +1,158 @@
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+from .base_transformers import FeatureEngineer
+from .data_cleaners import DataCleaner, ListProcessor
+from .developer_classifier import DeveloperTierClassifier
+from .utilities import (
+    active_steps,
+    restore_list_columns,
+    run_finalize,
+    run_row_local,
+)
+
+
+# Steps whose output row depends only on the same input row. DataCleaner
+# qualifies through transform_chunk; its deduplication runs in finalize.
+# Label-only steps such as FeatureNameCleaner are left out: renaming is
+# cheaper in-process than shipping wide encoded frames through Arrow.
+ROW_LOCAL_STEPS = (
+    FeatureEngineer,
+    DataCleaner,
+    ListProcessor,
+    DeveloperTierClassifier,
+)
+
+
+def _to_shared(df: pd.DataFrame):
+    """Write ``df`` as an Arrow IPC stream into a new shared memory block."""
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    counter = pa.MockOutputStream()
+    with pa.ipc.new_stream(counter, table.schema) as writer:
+        writer.write_table(table)
+    size = counter.size()
+
+    shm = SharedMemory(create=True, size=max(size, 1))
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf))
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    # The block can only be closed once no Arrow object points into it.
+    sink.close()
+    del sink, writer
+    shm.close()
+    return shm.name, size
+
+
+def _from_shared(name: str, size: int, unlink: bool = False) -> pd.DataFrame:
+    shm = SharedMemory(name=name)
+    try:
+        # One copy out of the block, so nothing returned points into it
+        # (Arrow-backed string columns would otherwise) once it is closed.
+        payload = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    df = pa.ipc.open_stream(payload).read_all().to_pandas()
+    # Arrow hands list columns back as NumPy arrays; the steps expect lists.
+    return restore_list_columns(df)
+
+
+def _run_partition(steps, name: str, size: int):
+    return _to_shared(run_row_local(steps, _from_shared(name, size)))
+
+
+class ParallelPipeline(BaseEstimator, TransformerMixin):
+    """Run the row-local steps of a pipeline on row partitions in a process pool.
+
+    Consecutive steps listed in ``ROW_LOCAL_STEPS`` are applied to
+    ``n_partitions`` row slices in ``n_jobs`` worker processes (-1 for all
+    cores). Partitions and results travel as Arrow IPC buffers in shared
+    memory instead of being pickled, and are concatenated in their
+    original order. Like ``ChunkedPipeline``, steps with a ``finalize``
+    method run it once on the concatenated frame; every other step runs
+    serially. A leading ``DataLoader`` loads the frame in this process.
+
+    Row-local steps are fitted here on the first ``fit_rows`` rows before
+    the pool starts, which suits their stateless ``fit``. Frames Arrow
+    cannot serialize, such as sparse encoder output, run serially.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        n_jobs: int = -1,
+        n_partitions: int | None = None,
+        fit_rows: int = 1_000,
+    ):
+        self.pipeline = pipeline
+        self.n_jobs = n_jobs
+        self.n_partitions = n_partitions
+        self.fit_rows = fit_rows
+
+    def _segments(self):
+        segments = []
+        for step in active_steps(self.pipeline):
+            row_local = isinstance(step, ROW_LOCAL_STEPS)
+            if row_local and segments and segments[-1][0]:
+                segments[-1][1].append(step)
+            else:
+                segments.append((row_local, [step]))
+        return segments
+
+    def _run_parallel(self, steps, df, fit):
+        if fit:
+            run_row_local(steps, df.head(self.fit_rows).copy(), fit=True)
+
+        n_jobs = os.cpu_count() if self.n_jobs in (None, -1) else self.n_jobs
+        n_partitions = max(1, min(self.n_partitions or n_jobs, len(df)))
+        bounds = np.linspace(0, len(df), n_partitions + 1).astype(int)
+
+        inputs = []
+        try:
+            for start, stop in zip(bounds, bounds[1:]):
+                inputs.append(_to_shared(df.iloc[start:stop]))
+        except (pa.ArrowException, TypeError, ValueError):
+            for name, _ in inputs:
+                SharedMemory(name=name).unlink()
+            return run_finalize(steps, run_row_local(steps, df))
+
+        try:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                futures = [
+                    pool.submit(_run_partition, steps, name, size)
+                    for name, size in inputs
+                ]
+                parts = [_from_shared(*f.result(), unlink=True) for f in futures]
+        finally:
+            for name, _ in inputs:
+                SharedMemory(name=name).unlink()
+
+        return run_finalize(steps, pd.concat(parts))
+
+    def _run(self, X, fit):
+        segments = self._segments()
+        df = X
+        for row_local, steps in segments:
+            if row_local:
+                df = self._run_parallel(steps, df, fit)
+                continue
+            for step in steps:
+                df = step.fit_transform(df) if fit else step.transform(df)
+        return df
+
+    def fit(self, X=None, y=None):
+        self._run(X, fit=True)
+        return self
+
+    def fit_transform(self, X=None, y=None, **fit_params):
+        return self._run(X, fit=True)
+
+    def transform(self, X=None):
+        return self._run(X, fit=False)
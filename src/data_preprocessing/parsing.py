@@ -0,0 +1,108 @@
+from __future__ import annotations
+import ast
+import re
+from typing import Any, Tuple
+import numpy as np
+import pandas as pd
+
+
+# The Steam dump stores list/dict columns as Python reprs such as
+# "['Action', 'Indie']" or "{'Indie': 123, \"Dragon's Lair\": 7}". Cells made
+# only of plain quoted strings (and integer counts for dicts) are decoded
+# with regular expressions; anything else, e.g. escape sequences, falls
+# back to ast.literal_eval so the result is always identical to it.
+_STRING = r"""'[^'\\\r\n\x00]*'|"[^"\\\r\n\x00]*\""""
+_INT = r"-?(?:0|[1-9][0-9]*)"
+
+# Whitespace the Python tokenizer accepts; ``\s`` would also admit e.g. NBSP.
+_WS = r"[ \t\f\r\n]*"
+# After the closing bracket a space or tab may not end a new line, which
+# the tokenizer would read as indentation.
+_TRAILING_WS = r"(?:[ \t\f]*|[ \t\f\r\n]*[\f\r\n])"
+
+_LIST_RE = re.compile(
+    rf"[ \t]*\[{_WS}(?:(?:{_STRING}){_WS}(?:,{_WS}(?:{_STRING}){_WS})*,?{_WS})?\]"
+    rf"{_TRAILING_WS}"
+)
+_DICT_RE = re.compile(
+    rf"[ \t]*\{{{_WS}(?:(?:{_STRING}){_WS}:{_WS}{_INT}{_WS}"
+    rf"(?:,{_WS}(?:{_STRING}){_WS}:{_WS}{_INT}{_WS})*,?{_WS})?\}}{_TRAILING_WS}"
+)
+_STRING_RE = re.compile(_STRING)
+_DICT_ITEM_RE = re.compile(rf"({_STRING}){_WS}:{_WS}({_INT})")
+
+_PARSE_ERRORS = (ValueError, SyntaxError)
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def parse_literal(cell: str) -> Any:
+    """Drop-in replacement for ``ast.literal_eval`` on Steam list/dict cells."""
+    if isinstance(cell, str):
+        if _LIST_RE.fullmatch(cell):
+            return [token[1:-1] for token in _STRING_RE.findall(cell)]
+        if _DICT_RE.fullmatch(cell):
+            return {
+                key[1:-1]: int(value) for key, value in _DICT_ITEM_RE.findall(cell)
+            }
+    return ast.literal_eval(cell)
+
+
+def parse_literal_series(series: pd.Series, errors: str = "raise") -> pd.Series:
+    """Parse a whole column of list/dict literals.
+
+    Each distinct string is parsed once; cells with equal text share the
+    parsed object, so treat the results as read-only. Cells that are not
+    strings (e.g. already parsed lists) are passed through unchanged,
+    except missing values, which are malformed like any other bad cell.
+    With ``errors="raise"`` malformed cells raise the same ``ValueError``
+    or ``SyntaxError`` as ``ast.literal_eval``; with ``errors="coerce"``
+    they become ``None``.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError("errors must be 'raise' or 'coerce'")
+
+    values = series.to_numpy(dtype=object)
+    is_string = np.fromiter(
+        (isinstance(value, str) for value in values), dtype=bool, count=len(values)
+    )
+    is_missing = ~is_string & pd.isna(series).to_numpy()
+
+    result = values.copy()
+    if is_string.any():
+        codes, uniques = pd.factorize(values[is_string])
+        parsed = np.empty(len(uniques), dtype=object)
+        for i, text in enumerate(uniques):
+            try:
+                parsed[i] = parse_literal(text)
+            except _PARSE_ERRORS:
+                if errors == "raise":
+                    raise
+                parsed[i] = None
+        result[is_string] = parsed[codes]
+
+    if is_missing.any():
+        if errors == "raise":
+            ast.literal_eval(values[is_missing][0])
+        result[is_missing] = None
+
+    return pd.Series(result, index=series.index, name=series.name, dtype=object)
+
+
+def decode_owner_ranges(owners: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower and upper bounds of ranges like "20000 - 50000" as int32 arrays.
+
+    Each distinct label (category) is decoded once and broadcast through
+    its code; missing or unparsable labels get -1 for both bounds.
+    """
+    if isinstance(owners.dtype, pd.CategoricalDtype):
+        codes, labels = owners.cat.codes.to_numpy(), owners.cat.categories
+    else:
+        codes, labels = pd.factorize(owners)
+
+    bounds = np.full((len(labels) + 1, 2), -1, dtype=np.int32)
+    for i, label in enumerate(labels):
+        numbers = _NUMBER_RE.findall(str(label))
+        if numbers:
+            bounds[i] = int(numbers[0]), int(numbers[-1])
+    # Code -1 (missing) picks the trailing row of -1s.
+    return bounds[codes, 0], bounds[codes, 1]
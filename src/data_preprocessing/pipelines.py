@@ -11,43 +11,47 @@ from .encoders import CategoricalEncoder, MultiLabelEncoder
 from .utilities import FeatureNameCleaner, FilterForIndieGames
 
 
+# Pipelines whose first step creates or copies the frame pass ``copy=False``
+# to every later step, so a full run copies the data once instead of once
+# per step. Steps that only filter, drop or concatenate never modify their
+# input and run without a copy as well.
 base_pipeline = Pipeline(
     [
         ("data_loading", DataLoader()),
-        ("feature_engineering", FeatureEngineer()),
-        ("data_cleaning", DataCleaner()),
-        ("list_processing", ListProcessor()),
-        ("developer_tier_classification", DeveloperTierClassifier()),
+        ("feature_engineering", FeatureEngineer(copy=False)),
+        ("data_cleaning", DataCleaner(copy=False)),
+        ("list_processing", ListProcessor(copy=False)),
+        ("developer_tier_classification", DeveloperTierClassifier(copy=False)),
     ]
 )
 
 scaling_pipeline = Pipeline(
     [
         ("scaling", PowerTransformerScaler()),
-        ("categorical_encoding", CategoricalEncoder()),
-        ("multilabel_encoding", MultiLabelEncoder()),
-        ("feature_name_cleaning", FeatureNameCleaner()),
+        ("categorical_encoding", CategoricalEncoder(copy=False)),
+        ("multilabel_encoding", MultiLabelEncoder(copy=False)),
+        ("feature_name_cleaning", FeatureNameCleaner(copy=False)),
     ]
 )
 
 final_cleaning_pipeline = Pipeline(
     [
-        ("outlier_removal", OutlierRemover()),
-        ("data_final_cleaning", DataCleanerFinal()),
+        ("outlier_removal", OutlierRemover(copy=False)),
+        ("data_final_cleaning", DataCleanerFinal(copy=False)),
     ]
 )
 
 plotting_pipeline = Pipeline(
     [
-        ("categorical_encoding", CategoricalEncoder()),
-        ("multilabel_encoding", MultiLabelEncoder()),
-        ("feature_name_cleaning", FeatureNameCleaner()),
+        ("categorical_encoding", CategoricalEncoder(copy=False)),
+        ("multilabel_encoding", MultiLabelEncoder(copy=False)),
+        ("feature_name_cleaning", FeatureNameCleaner(copy=False)),
     ]
 )
 
 indie_filter_pipeline = Pipeline(
     [
-        ("indie_filter", FilterForIndieGames()),
+        ("indie_filter", FilterForIndieGames(copy=False)),
     ]
 )
 
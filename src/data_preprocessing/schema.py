@@ -0,0 +1,126 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+import pandas as pd
+
+
+# Nullable counterparts used while parsing, so a stray empty cell does not
+# abort the read. Columns without missing values are narrowed afterwards.
+_READ_DTYPES = {
+    "bool": "boolean",
+    "int32": "Int32",
+}
+
+
+@dataclass(frozen=True)
+class CsvSchema:
+    """Columns to read from a CSV, their dtypes and the columns never read."""
+
+    keep: Tuple[str, ...]
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    skip: Tuple[str, ...] = ()
+
+    def usecols(self, column: str) -> bool:
+        return column in self.keep and column not in self.skip
+
+    def read_dtypes(self) -> Dict[str, str]:
+        return {
+            col: _READ_DTYPES.get(dtype, dtype)
+            for col, dtype in self.dtypes.items()
+            if self.usecols(col)
+        }
+
+    def narrow(self, df: pd.DataFrame) -> pd.DataFrame:
+        for col, dtype in self.dtypes.items():
+            if dtype in _READ_DTYPES and col in df and not df[col].hasnans:
+                df[col] = df[col].astype(dtype)
+        return df
+
+
+# Collection date of the Kaggle dump (March 2025). Features that depend on
+# "today", like years since release, are computed relative to it.
+GAMES_SNAPSHOT_DATE = "2025-03-31"
+
+# Format of ``release_date`` in the dump ("Oct 21, 2008"). Stated explicitly
+# so every chunk or partition parses dates like a full read does; inferring
+# it per chunk would pick "%B" for a chunk that starts with a "May" date.
+GAMES_DATE_FORMAT = "%b %d, %Y"
+
+GAMES_SCHEMA = CsvSchema(
+    keep=(
+        "appid",
+        "name",
+        "release_date",
+        "price",
+        "dlc_count",
+        "about_the_game",
+        "windows",
+        "mac",
+        "linux",
+        "metacritic_score",
+        "achievements",
+        "supported_languages",
+        "full_audio_languages",
+        "developers",
+        "publishers",
+        "categories",
+        "genres",
+        "screenshots",
+        "movies",
+        "positive",
+        "negative",
+        "estimated_owners",
+        "average_playtime_forever",
+        "average_playtime_2weeks",
+        "median_playtime_forever",
+        "median_playtime_2weeks",
+        "discount",
+        "peak_ccu",
+        "tags",
+        "pct_pos_total",
+        "num_reviews_total",
+    ),
+    dtypes={
+        # Text only counted in FeatureEngineer; kept in Arrow memory so the
+        # counts run as Arrow string kernels without Python str objects.
+        "about_the_game": "string[pyarrow]",
+        "screenshots": "string[pyarrow]",
+        "movies": "string[pyarrow]",
+        "price": "float32",
+        "dlc_count": "int32",
+        "windows": "bool",
+        "mac": "bool",
+        "linux": "bool",
+        "metacritic_score": "int32",
+        "achievements": "int32",
+        "positive": "int32",
+        "negative": "int32",
+        "estimated_owners": "category",
+        "average_playtime_forever": "int32",
+        "average_playtime_2weeks": "int32",
+        "median_playtime_forever": "int32",
+        "median_playtime_2weeks": "int32",
+        "discount": "int32",
+        "peak_ccu": "int32",
+        "pct_pos_total": "int32",
+        "num_reviews_total": "int32",
+    },
+    skip=(
+        "required_age",
+        "detailed_description",
+        "short_description",
+        "reviews",
+        "header_image",
+        "website",
+        "support_url",
+        "support_email",
+        "metacritic_url",
+        "recommendations",
+        "notes",
+        "packages",
+        "user_score",
+        "score_rank",
+        "num_reviews_recent",
+        "pct_pos_recent",
+    ),
+)
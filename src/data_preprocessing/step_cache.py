@@ -0,0 +1,180 @@
+from __future__ import annotations
+import hashlib
+import inspect
+import os
+import joblib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+from .utilities import active_steps, restore_list_columns
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> str:
+    """SHA-256 of the frame's Arrow IPC representation, index included."""
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return hashlib.sha256(sink.getvalue()).hexdigest()
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _package_sources():
+    """Source files the package's steps depend on, including the metadata."""
+    import metadata_options
+
+    paths = sorted(
+        os.path.join(_PACKAGE_DIR, name)
+        for name in os.listdir(_PACKAGE_DIR)
+        if name.endswith(".py")
+    )
+    return paths + [metadata_options.__file__, metadata_options._METADATA_PATH]
+
+
+def _code_version(step) -> str:
+    """Hash of the source code behind the step's class.
+
+    Steps defined in this package hash every module of it (and the
+    metadata lists), since their output also depends on shared helpers
+    such as parsing.py and schema.py; other steps hash their own module.
+    """
+    try:
+        path = os.path.abspath(inspect.getsourcefile(type(step)))
+    except TypeError:
+        return type(step).__module__
+    paths = _package_sources() if os.path.dirname(path) == _PACKAGE_DIR else [path]
+    digest = hashlib.sha256()
+    try:
+        for source in paths:
+            with open(source, "rb") as f:
+                digest.update(f.read())
+    except OSError:
+        return type(step).__module__
+    return digest.hexdigest()
+
+
+class CachedPipeline(BaseEstimator, TransformerMixin):
+    """Run a pipeline with a content-addressed on-disk cache per step.
+
+    Each step's key chains the previous key with the step's class,
+    ``get_params()`` and a hash of its source code (every module of this
+    package for its own steps); the first key comes from the input data
+    (the source CSV's SHA-256 for a leading ``DataLoader``, the frame's
+    contents otherwise). Outputs are stored as Parquet next to the fitted
+    step (joblib) under ``cache_dir``. A run resumes after the last step
+    that is already cached, so changing one step's parameters recomputes
+    that step and the ones after it only. ``transform`` keys the steps by
+    their fitted state instead of their parameters. Entries are evicted
+    least recently used first once the cache exceeds ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        cache_dir: str = "../data/cache/steps",
+        max_bytes: int = 2 * 1024**3,
+    ):
+        self.pipeline = pipeline
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _input_key(self, X, steps) -> str:
+        if steps and hasattr(steps[0], "_source_fingerprint"):
+            return steps[0]._source_fingerprint(with_hash=True)["sha256"]
+        return _frame_fingerprint(X)
+
+    def _step_keys(self, X, steps, fit):
+        keys = []
+        key = self._input_key(X, steps)
+        for step in steps:
+            state = step.get_params(deep=False) if fit else step
+            digest = hashlib.sha256(key.encode())
+            digest.update(b"fit" if fit else b"transform")
+            digest.update(f"{type(step).__module__}.{type(step).__qualname__}".encode())
+            digest.update(joblib.hash(state).encode())
+            digest.update(_code_version(step).encode())
+            key = digest.hexdigest()
+            keys.append(key)
+        return keys
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.parquet", f"{base}.joblib"
+
+    def _is_cached(self, keys, i):
+        # Resuming after step i needs its output and every earlier fitted step.
+        frame_path = self._paths(keys[i])[0]
+        return os.path.exists(frame_path) and all(
+            os.path.exists(self._paths(key)[1]) for key in keys[: i + 1]
+        )
+
+    def _load(self, keys, steps):
+        for key, step in zip(keys, steps):
+            step_path = self._paths(key)[1]
+            step.__dict__.update(joblib.load(step_path).__dict__)
+            os.utime(step_path)
+        frame_path = self._paths(keys[-1])[0]
+        os.utime(frame_path)
+        return restore_list_columns(pd.read_parquet(frame_path))
+
+    def _store(self, key, step, df):
+        frame_path, step_path = self._paths(key)
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=True)
+        except (pa.ArrowException, TypeError, ValueError):
+            return  # e.g. sparse columns; leave the step uncached
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # The frame is written last: its presence marks a complete entry.
+        joblib.dump(step, f"{step_path}.tmp")
+        os.replace(f"{step_path}.tmp", step_path)
+        pq.write_table(table, f"{frame_path}.tmp")
+        os.replace(f"{frame_path}.tmp", frame_path)
+        self._evict()
+
+    def _evict(self):
+        entries = {}
+        for entry in os.scandir(self.cache_dir):
+            key, ext = os.path.splitext(entry.name)
+            if ext not in (".parquet", ".joblib"):
+                continue
+            stat = entry.stat()
+            size, mtime = entries.get(key, (0, 0))
+            entries[key] = (size + stat.st_size, max(mtime, stat.st_mtime_ns))
+
+        total = sum(size for size, _ in entries.values())
+        for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            for path in self._paths(key):
+                if os.path.exists(path):
+                    os.remove(path)
+            total -= size
+
+    def _run(self, X, fit):
+        steps = active_steps(self.pipeline)
+        keys = self._step_keys(X, steps, fit)
+
+        start = next(
+            (i + 1 for i in reversed(range(len(steps))) if self._is_cached(keys, i)),
+            0,
+        )
+        df = self._load(keys[:start], steps[:start]) if start else X
+
+        for step, key in zip(steps[start:], keys[start:]):
+            df = step.fit_transform(df) if fit else step.transform(df)
+            self._store(key, step, df)
+        return df
+
+    def fit(self, X=None, y=None):
+        self._run(X, fit=True)
+        return self
+
+    def fit_transform(self, X=None, y=None, **fit_params):
+        return self._run(X, fit=True)
+
+    def transform(self, X=None):
+        return self._run(X, fit=False)
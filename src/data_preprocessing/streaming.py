@@ -0,0 +1,41 @@
+from __future__ import annotations
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+from .utilities import active_steps, run_finalize, run_row_local
+
+
+class ChunkedPipeline(BaseEstimator, TransformerMixin):
+    """Run a loader-headed pipeline such as ``base_pipeline`` chunk by chunk.
+
+    The first step must provide ``iter_chunks`` (see ``DataLoader``). Every
+    later step runs on each chunk through ``transform_chunk`` when it has
+    one and ``transform`` otherwise; steps with a ``finalize`` method get
+    one more call on the concatenated result for their global work (the
+    deduplication in ``DataCleaner``). Steps are fitted on the first
+    chunk, which only suits the row-local steps of ``base_pipeline``.
+    Vocabulary-learning encoders belong in the downstream pipelines that
+    run on the finished frame.
+    """
+
+    def __init__(self, pipeline: Pipeline, chunksize: int = 20_000):
+        self.pipeline = pipeline
+        self.chunksize = chunksize
+
+    def _run(self, fit):
+        loader, *steps = active_steps(self.pipeline)
+
+        parts = []
+        for chunk in loader.iter_chunks(self.chunksize):
+            parts.append(run_row_local(steps, chunk, fit=fit and not parts))
+        return run_finalize(steps, pd.concat(parts))
+
+    def fit(self, X=None, y=None):
+        self._run(fit=True)
+        return self
+
+    def fit_transform(self, X=None, y=None, **fit_params):
+        return self._run(fit=True)
+
+    def transform(self, X=None):
+        return self._run(fit=False)
@@ -1,29 +1,117 @@
+import inspect
+from itertools import groupby
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin
 
 
-class FeatureNameCleaner(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
+def to_csr_matrix(df):
+    """Convert a frame with dense and SparseDtype columns to a CSR matrix.
+
+    Sparse column blocks are converted without densifying; column order is
+    kept, so the result lines up with ``df.columns``.
+    """
+    blocks = []
+    for is_sparse, group in groupby(
+        df.columns, key=lambda col: isinstance(df[col].dtype, pd.SparseDtype)
+    ):
+        block = df[list(group)]
+        if is_sparse:
+            blocks.append(block.sparse.to_coo())
+        else:
+            blocks.append(sparse.csr_matrix(block.to_numpy(dtype=float)))
+    return sparse.hstack(blocks, format="csr")
+
+
+def restore_list_columns(df):
+    """Turn the NumPy arrays Arrow/Parquet return for list columns into lists.
+
+    The list processing steps expect native Python lists, as produced by
+    an in-memory run. Works in place and returns ``df``.
+    """
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].to_numpy()
+        if any(isinstance(value, np.ndarray) for value in values):
+            df[col] = [
+                value.tolist() if isinstance(value, np.ndarray) else value
+                for value in values
+            ]
+    return df
+
+
+def active_steps(pipeline):
+    """The pipeline's estimators, without ``None`` and ``"passthrough"``."""
+    return [
+        step
+        for _, step in pipeline.steps
+        if step is not None and step != "passthrough"
+    ]
+
+
+def run_row_local(steps, df, fit=False):
+    """Run ``df`` through ``steps`` as one chunk of a larger frame.
+
+    Steps use ``transform_chunk`` when they have one, which leaves their
+    global work to ``run_finalize``, and ``transform`` otherwise. With
+    ``fit`` every step is first fitted on its input.
+    """
+    for step in steps:
+        if fit:
+            step.fit(df)
+        if hasattr(step, "transform_chunk"):
+            df = step.transform_chunk(df)
+        else:
+            df = step.transform(df)
+    return df
+
+
+def run_finalize(steps, df):
+    """Apply the ``finalize`` of every step that has one to the whole frame."""
+    for step in steps:
+        if hasattr(step, "finalize"):
+            df = step.finalize(df)
+    return df
+
+
+class DefaultParamsOnLoadMixin:
+    """Give unpickled estimators the defaults of parameters added since.
+
+    Pipelines saved before a transformer gained a parameter (``copy``,
+    ``sparse_output``, ``columns``, ...) unpickle without that attribute;
+    filling in the ``__init__`` default makes them behave as when saved.
+    """
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        signature = inspect.signature(type(self).__init__)
+        for name, param in signature.parameters.items():
+            if param.default is not param.empty and name not in self.__dict__:
+                setattr(self, name, param.default)
+
+
+class FeatureNameCleaner(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    def __init__(self, copy=True):
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X):
-        df = X.copy()
+        df = X.copy() if self.copy else X
         df.columns = df.columns.str.replace(r"[\[\]<>]", "", regex=True)
         return df
 
 
-class FilterForIndieGames(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        pass
+class FilterForIndieGames(DefaultParamsOnLoadMixin, BaseEstimator, TransformerMixin):
+    def __init__(self, copy=True):
+        self.copy = copy
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X):
-        df = X.copy()
+        df = X.copy() if self.copy else X
 
         indie_mask = (
             (df.get("genres_tags_indie", 0) == 1)
@@ -1,6611 +1,53 @@
-def get_genres_tags_clusters():
-    cluster_dict = {
-    'Strategy_Management': [
-        'Base-Building', 'Building', 'Card Battler', 'Deckbuilding', 'Economy',
-        'Farming', 'Farming Sim', 'Fishing', 'Grand Strategy', 'Inventory Management',
-        'Logic', 'Management', 'Programming', 'Puzzle', 'Resource Management',
-        'Simulation', 'Strategy', 'Strategy RPG', 'Time Management', 'Tower Defense',
-        'Turn-Based', 'Turn-Based Combat', 'Turn-Based Strategy', 'Turn-Based Tactics',
-        'Real Time Tactics', 'RTS'
-    ],
+"""Metadata and options for the interface.
+
+The lists themselves live in ``metadata_options.json`` next to this module.
+The file is read on first use and cached for the rest of the process; the
+getters hand out fresh copies so callers may modify them freely.
+"""
+
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
+_METADATA_PATH = os.path.join(os.path.dirname(__file__), "metadata_options.json")
 
-    'Action_Combat': [
-        'Action RTS', 'Arena Shooter', 'Boomer Shooter', 'Combat', 'Driving',
-        'Dungeon Crawler', 'Extraction Shooter', 'Hero Shooter', 'Hunting',
-        'Looter Shooter', 'Martial Arts', 'Mystery Dungeon', 'Naval Combat',
-        'On-Rails Shooter', 'Shooter', 'Stealth', 'Third-Person Shooter',
-        'Twin Stick Shooter', 'Heist'
-    ],
 
-    'Survival_Systemic Play': [
-        'Action Roguelike', 'Auto Battler', 'Cooking', 'Crafting',
-        'Dungeons & Dragons', 'Hacking', 'Open World Survival Craft',
-        'Rogue-like', 'Rogue-lite', 'Roguelike Deckbuilder', 'Roguevania',
-        'Sandbox', 'Survival', 'Traditional Roguelike'
-    ],
-    'Education_Content': [
-        'Based On A Novel', 'Capitalism', 'Diplomacy', 'Documentary', 'Education',
-        'Faith', 'LGBTQ+', 'Politics', 'Science', 'Transhumanism'
-    ],
+@lru_cache(maxsize=None)
+def _load_metadata():
+    with open(_METADATA_PATH, encoding="utf-8") as f:
+        return json.load(f)
 
-    'Art_Design': [
-        '8-bit Music', 'Cinematic', 'Cartoon', 'Cartoony', 'Comic Book', 'Design & Illustration',
-        'Hand-drawn', 'Music', 'Music-Based Procedural Generation', 'Photo Editing', 'Pixel Graphics',
-        'Rock Music', 'Stylized', 'Visual Novel', 'Animation & Modeling', 'Electronic Music',
-        'Instrumental Music', 'Soundtrack', 'Video Production'
-    ],
-    'Monetarisation_Plattform': [
-        'Crowdfunded', 'Early Access', 'Free To Play', 'Free to Play', 'Kickstarter', 'Steam Machine'
-    ],
-    'Meta_Experience': [
-        'Addictive', 'Classic', 'Cult Classic', 'Experience', 'Experimental', 'Intentionally Awkward Controls',
-        'Masterpiece', 'Nostalgia', 'Remake', 'Reboot', 'Tutorial', 'Unforgiving', 'Well-Written'
-    ],
 
-    'Perspective_Presentation': [
-        '2D', '2D Fighter', '2D Platformer', '2.5D', '3D', '3D Fighter', '3D Platformer',
-        '360 Video', 'First-Person', 'Isometric', 'Side Scroller', 'Third Person',
-        'Third-Person Shooter', 'Top-Down', 'Top-Down Shooter', 'Touch-Friendly', 'VR',
-        'VR Only', '3D Vision'
-    ],
+def get_genres_tags_clusters():
+    clusters = _load_metadata()["genres_tags_clusters"]
+    return {cluster: list(tags) for cluster, tags in clusters.items()}
 
-    'Setting_World': [
-        '1980s', "1990's", 'Alternate History', 'America', 'Cold War', 'Cyberpunk', 'Dark Fantasy',
-        'Dystopian', 'Fantasy', 'Futuristic', 'Gothic', 'Historical', 'Lovecraftian', 'Magic',
-        'Mars', 'Medieval', 'Mythology', 'Nature', 'Naval', 'Naval Combat', 'Pirates',
-        'Post-apocalyptic', 'Rome', 'Sci-fi', 'Space', 'Space Sim', 'Spaceships',
-        'Steampunk', 'Submarine', 'Time Travel', 'Underwater', 'Underground', 'Vampire',
-        'Western', 'World War I', 'World War II'
-    ]
-    }
-    return cluster_dict
 
 def get_supported_languages():
-    return [
-        "English",
-        "French",
-        "German",
-        "Italian",
-        "Spanish - Spain",
-        "Japanese",
-        "Korean",
-        "Portuguese - Portugal",
-        "Russian",
-        "Simplified Chinese",
-        "Portuguese - Brazil",
-        "Traditional Chinese",
-        "Polish",
-        "Turkish",
-        "Ukrainian",
-        "Hungarian",
-        "Spanish - Latin America",
-        "Czech",
-        "Arabic",
-        "Bulgarian",
-        "Dutch",
-        "Greek",
-        "Swedish",
-        "Catalan",
-        "Danish",
-        "Finnish",
-        "Norwegian",
-        "Thai",
-        "Persian",
-        "Hebrew",
-        "Vietnamese",
-        "Indonesian",
-        "Hindi",
-        "Estonian",
-        "Latvian",
-        "Romanian",
-        "Azerbaijani",
-        "Slovak",
-        "Basque",
-        "Afrikaans",
-        "Albanian",
-        "Amharic",
-        "Armenian",
-        "Assamese",
-        "Bangla",
-        "Belarusian",
-        "Bosnian",
-        "Cherokee",
-        "Croatian",
-        "Dari",
-        "Filipino",
-        "Galician",
-        "Georgian",
-        "Gujarati",
-        "Hausa",
-        "Icelandic",
-        "Igbo",
-        "Irish",
-        "K'iche'",
-        "Kannada",
-        "Kazakh",
-        "Khmer",
-        "Kinyarwanda",
-        "Konkani",
-        "Kyrgyz",
-        "Lithuanian",
-        "Luxembourgish",
-        "Macedonian",
-        "Malay",
-        "Malayalam",
-        "Maltese",
-        "Maori",
-        "Marathi",
-        "Mongolian",
-        "Nepali",
-        "Odia",
-        "Punjabi (Gurmukhi)",
-        "Punjabi (Shahmukhi)",
-        "Quechua",
-        "Scots",
-        "Serbian",
-        "Sindhi",
-        "Sinhala",
-        "Slovenian",
-        "Sorani",
-        "Sotho",
-        "Swahili",
-        "Tajik",
-        "Tamil",
-        "Tatar",
-        "Telugu",
-        "Tigrinya",
-        "Tswana",
-        "Turkmen",
-        "Urdu",
-        "Uyghur",
-        "Uzbek",
-        "Valencian",
-        "Welsh",
-        "Wolof",
-        "Xhosa",
-        "Yoruba",
-        "Zulu",
-    ]
+    return list(_load_metadata()["supported_languages"])
+
 
 def get_categories():
-    return [
-        "captions available",
-        "co-op",
-        "commentary available",
-        "cross-platform multiplayer",
-        "family sharing",
-        "full controller support",
-        "hdr available",
-        "in-app purchases",
-        "includes level editor",
-        "includes source sdk",
-        "lan co-op",
-        "lan pvp",
-        "mmo",
-        "multi-player",
-        "online co-op",
-        "online pvp",
-        "partial controller support",
-        "pvp",
-        "remote play on phone",
-        "remote play on tablet",
-        "remote play on tv",
-        "remote play together",
-        "shared/split screen",
-        "shared/split screen co-op",
-        "shared/split screen pvp",
-        "single-player",
-        "stats",
-        "steam achievements",
-        "steam cloud",
-        "steam leaderboards",
-        "steam timeline",
-        "steam trading cards",
-        "steam turn notifications",
-        "steam workshop",
-        "steamvr collectibles",
-        "tracked controller support",
-        "valve anti-cheat enabled",
-        "vr only",
-        "vr support",
-        "vr supported"
-    ]
+    return list(_load_metadata()["categories"])
+
 
 def get_full_audio_languages():
-    return [
-        "English",
-        "French",
-        "German",
-        "Italian",
-        "Spanish - Spain",
-        "Japanese",
-        "Korean",
-        "Portuguese - Portugal",
-        "Russian",
-        "Simplified Chinese",
-        "Portuguese - Brazil",
-        "Traditional Chinese",
-        "Polish",
-        "Turkish",
-        "Ukrainian",
-        "Hungarian",
-        "Spanish - Latin America",
-        "Czech",
-        "Arabic",
-        "Bulgarian",
-        "Dutch",
-        "Greek",
-        "Swedish",
-        "Catalan",
-        "Danish",
-        "Finnish",
-        "Norwegian",
-        "Thai",
-        "Persian",
-        "Hebrew",
-        "Vietnamese",
-        "Indonesian",
-        "Hindi",
-        "Estonian",
-        "Latvian",
-        "Romanian",
-        "Azerbaijani",
-        "Slovak",
-        "Basque",
-        "Afrikaans",
-        "Albanian",
-        "Amharic",
-        "Armenian",
-        "Assamese",
-        "Bangla",
-        "Belarusian",
-        "Bosnian",
-        "Cherokee",
-        "Croatian",
-        "Dari",
-        "Filipino",
-        "Galician",
-        "Georgian",
-        "Gujarati",
-        "Hausa",
-        "Icelandic",
-        "Igbo",
-        "Irish",
-        "K'iche'",
-        "Kannada",
-        "Kazakh",
-        "Khmer",
-        "Kinyarwanda",
-        "Konkani",
-        "Kyrgyz",
-        "Lithuanian",
-        "Luxembourgish",
-        "Macedonian",
-        "Malay",
-        "Malayalam",
-        "Maltese",
-        "Maori",
-        "Marathi",
-        "Mongolian",
-        "Nepali",
-        "Odia",
-        "Punjabi (Gurmukhi)",
-        "Punjabi (Shahmukhi)",
-        "Quechua",
-        "Scots",
-        "Serbian",
-        "Sindhi",
-        "Sinhala",
-        "Slovenian",
-        "Sorani",
-        "Sotho",
-        "Swahili",
-        "Tajik",
-        "Tamil",
-        "Tatar",
-        "Telugu",
-        "Tigrinya",
-        "Tswana",
-        "Turkmen",
-        "Urdu",
-        "Uyghur",
-        "Uzbek",
-        "Valencian",
-        "Welsh",
-        "Wolof",
-        "Xhosa",
-        "Yoruba",
-        "Zulu",
-    ]
+    return list(_load_metadata()["full_audio_languages"])
+
 
 def get_developer_tiers():
-    return {
-        "a": [
-            "Rockstar North",
-            "#workshop",
-            ".tong",
-            "0 deer soft",
-            "0cube",
-            "10 games studios",
-            "100 cats",
-            "10101 software",
-            "11 bit studios",
-            "11planning",
-            "11sheep",
-            "13-lab",
-            "13am games",
-            "14dimension enterprise",
-            "17-bit",
-            "171dev",
-            "17night",
-            "17studio",
-            "18light game ltd.",
-            "1917 studios",
-            "1c game studios",
-            "1c wireless",
-            "1c: maddox games",
-            "1c:inoco",
-            "1cc games",
-            "1up games",
-            "1st-impact co.,ltd.",
-            "2 barrel arts",
-            "24frame,inc.",
-            "2awesome studio",
-            "2d_猫",
-            "2k australia",
-            "2medya",
-            "2qfarm",
-            "2by3 games",
-            "2ev1l",
-            "2kblater",
-            "2ndboss",
-            "2nek",
-            "3 sprockets",
-            "3000ad",
-            "34bigthings srl",
-            "3d factory",
-            "3d realms",
-            "3d visualisation aesthetics lab",
-            "3dduo",
-            "3di llc",
-            "3division",
-            "3f interactive",
-            "4 fun studio",
-            "4 i lab",
-            "40 pound tiger studios",
-            "4a games",
-            "4a50 studios",
-            "4bit games",
-            "4h studiolab",
-            "4head studios",
-            "4kids",
-            "4noki",
-            "5 games",
-            "5 lives studios",
-            "5dims inc.",
-            "5minlab corp.",
-            "5pb.",
-            "626 interactive",
-            "659 records (pty) ltd",
-            "68k studios",
-            "7 raven studios",
-            "74 ninjas, llc",
-            "74games",
-            "7a games",
-            "7dots",
-            "7miao game",
-            "8-bit productions, llc",
-            "86岁按时吃饭",
-            "8bitlab",
-            "8bitskull",
-            "8th shore, inc.",
-            "9 eyes game studio",
-            "90e games",
-            "99 game studio",
-            "9900studio",
-            "9fingergames",
-            "9garden",
-            "9heads game studios",
-            "@tonydevgame",
-            "@unepic_fran",
-            "a crowd of monsters",
-            "a memory of eternity",
-            "a sharp",
-            "a thousand myths",
-            "a. hagen",
-            "a.y.std",
-            "a2 game studio",
-            "a2 softworks",
-            "aa mini games studio",
-            "aa2g1",
-            "aaagames",
-            "ace team",
-            "achat animation studios",
-            "adelta",
-            "admi inc.",
-            "aecrnia",
-            "ael entertainment",
-            "afog",
-            "aftertime.inc",
-            "age zero",
-            "agl studios",
-            "aheartfulofgames",
-            "ahui.game",
-            "aihasto",
-            "aivik llc",
-            "aj",
-            "ajb games studio",
-            "akatsuki-works",
-            "al games",
-            "aleksander chepaikin",
-            "alice in dissonance",
-            "allaf games",
-            "alvion inc.",
-            "amplitude studios",
-            "and gear",
-            "ang people s.r.o.",
-            "ao games",
-            "apollon company limited",
-            "applemint",
-            "aquaplus",
-            "aquastyle",
-            "aquria co., ltd.",
-            "aranja games",
-            "arloopa inc.",
-            "arte france",
-            "artifacts",
-            "arvore",
-            "ask_games",
-            "asobi",
-            "atc games",
-            "atomic breath",
-            "attack mountain",
-            "avantgarde",
-            "ave team",
-            "axr-studios",
-            "azamatika",
-            "azarashi software",
-            "aaron dodo",
-            "aaron wise",
-            "aartform",
-            "aatlantis code",
-            "abbey 'scruncho' smith",
-            "abbey games",
-            "abdulla hassan al-farsi",
-            "abdullah al bajjali",
-            "absolute power game studio",
-            "absolutist ltd.",
-            "absorb reality",
-            "abstractart",
-            "abyscon",
-            "abyte entertainment",
-            "access software",
-            "accidental queens",
-            "accolade",
-            "accolade, inc",
-            "accolade, inc.",
-            "ace x",
-            "acerola",
-            "acetate123",
-            "achpile",
-            "ackk studios",
-            "acram digital",
-            "acrogames",
-            "actalogic",
-            "actor",
-            "acureus",
-            "acuze interactives",
-            "adam delease",
-            "adam stępiński",
-            "adam tarnowski",
-            "adam thompson",
-            "adam travers",
-            "adato games",
-            "addictive 247 games",
-            "adept studios gd",
-            "adglobe",
-            "adham jaber",
-            "adi zhavo",
-            "adipson studio",
-            "adjective animal",
-            "admia",
-            "adobe",
-            "adolf games",
-            "adriaan de jongh",
-            "adrovgames",
-            "adventure awaits",
-            "adventure islands",
-            "adventure soft",
-            "adventurer's tavern",
-            "aedian glair",
-            "aegon games ltd",
-            "aerial_knight",
-            "aesir interactive",
-            "aeterna ludi",
-            "aeternum game studios s.l",
-            "aether studios",
-            "aetheric games",
-            "afogames",
-            "african boy keita studio",
-            "afterburn",
-            "afterthought studios",
-            "agafonoff",
-            "agate",
-            "ageofgames",
-            "aged immortals",
-            "agelvik",
-            "aggroblakh",
-            "aglobex",
-            "agustin eisman moreno",
-            "ahrpuxr",
-            "aiaz marx",
-            "airship syndicate",
-            "akabaka",
-            "akella",
-            "akhir pekan studio",
-            "akihiko prince",
-            "akiragoya",
-            "akumu games",
-            "akupara games",
-            "alakhaine specialist consulting limited",
-            "alan bourhis",
-            "alan hazelden",
-            "alastair john jack",
-            "alastair low",
-            "alawar stargaze",
-            "albatross idea",
-            "albireo games",
-            "alcedo games",
-            "alchemist interactive",
-            "alda games",
-            "alder games",
-            "alecubicsoft",
-            "alec smith",
-            "aleksandr golovkin",
-            "aleksey izimov",
-            "aleph one developers",
-            "alex",
-            "alex gimson",
-            "alex hanson-white",
-            "alex le mesurier",
-            "alex loman",
-            "alex olinkiewicz",
-            "alex vr",
-            "alex8778",
-            "alexhoratio",
-            "alexander clark",
-            "alexander van den bulck",
-            "alexander voidoc",
-            "alexey davydov",
-            "algorocks",
-            "ali soltanian fard jahromi",
-            "alice & smith",
-            "alice games",
-            "alicesoft",
-            "alien cyber coat",
-            "alien jellyfish",
-            "alientrap",
-            "aligned games",
-            "alina digital",
-            "alister software",
-            "alkame games",
-            "alkemi",
-            "alkinoy",
-            "all in! games",
-            "allegorithmic",
-            "alley catz games",
-            "almighty games",
-            "almost games",
-            "alpha wave entertainment",
-            "alphanuts",
-            "alpheratz*",
-            "alright peaches studio",
-            "alterego games",
-            "aluba studio",
-            "alzan studios, llc",
-            "amanclo video games",
-            "amanita design",
-            "amaranth games, llc",
-            "ambiera",
-            "ambitious games",
-            "amegami",
-            "amir rajan",
-            "among giants",
-            "amonga99",
-            "ampersand game studios",
-            "amusitronix",
-            "anarch entertainment",
-            "anarchy games",
-            "anate studio",
-            "anaximanes entertainment",
-            "andrade games",
-            "andrealphus games",
-            "andreas ammer",
-            "andreev worlds",
-            "andrew augustine",
-            "andrew grbac",
-            "andrew nutter666 jaggar",
-            "andrew rowe",
-            "andy law",
-            "andy schneider",
-            "andyland",
-            "andymente",
-            "aneagames",
-            "angad matharoo",
-            "angela he",
-            "angelo gamedev",
-            "angels blue digital entertainment",
-            "angry demon studio",
-            "angry mob games",
-            "angry games",
-            "ani4bio animated",
-            "animas games",
-            "animation arts",
-            "anime squad",
-            "animicgame",
-            "animu game",
-            "anino games",
-            "ankama studio",
-            "ankoku marimokan",
-            "another dev company",
-            "anshar studios",
-            "ant workshop ltd",
-            "ant secret",
-            "anti-ded gamedev",
-            "antizero company",
-            "antler interactive",
-            "anton shatalov",
-            "antonio freyre",
-            "antonio renna",
-            "antonystiv",
-            "antti vaihia",
-            "anvate games",
-            "ape apps",
-            "apehardware",
-            "apeiron",
-            "apillo",
-            "aplovestudio",
-            "apogee entertainment",
-            "apogee software",
-            "apokalypsis studios",
-            "appeal studios",
-            "applecoffee",
-            "application systems heidelberg",
-            "appnori inc.",
-            "appnormals team",
-            "apskeppet",
-            "aquaregia31.app",
-            "aquila games",
-            "arational entertainment",
-            "aratog llc",
-            "arbatskii anatolii",
-            "arcwillow",
-            "arcade distillery",
-            "arcadia",
-            "archdawn",
-            "archiact",
-            "archive entertainment",
-            "arcupion art",
-            "arcus plume",
-            "argali entertainment",
-            "argent games",
-            "argus games",
-            "arhangel games",
-            "arkhouse telegraph",
-            "armagedoom games",
-            "armando rodrigues",
-            "arnold rauers",
-            "arrowhead game studios",
-            "arrowiz",
-            "art games studio s.a.",
-            "artalasky",
-            "artem kotov",
-            "artepi corporation",
-            "artic computing",
-            "artic wolf games",
-            "artificer creator",
-            "artless games",
-            "artogon",
-            "artplant",
-            "arttu tuovinen",
-            "arvus games",
-            "as-key",
-            "asakiyumemishi",
-            "asephy",
-            "ash game studio",
-            "ashina studios",
-            "ashnell games",
-            "asicxart",
-            "aslan game studio",
-            "asmodev",
-            "asobimo, inc.",
-            "asobo studio",
-            "aspyr",
-            "aspyr (linux)",
-            "aspyr (mac)",
-            "assemble entertainment",
-            "asset flip studio",
-            "associazione audiogames",
-            "assult",
-            "asteristic game studio",
-            "asteroid game studio",
-            "astra games",
-            "astra playroom",
-            "astralseal",
-            "astro game studio",
-            "astromonkey",
-            "atapki",
-            "atelier 801",
-            "aterdux entertainment",
-            "atlas v",
-            "atomteam",
-            "atomic fabrik",
-            "atomic games",
-            "atomic jelly",
-            "atomic lollypop",
-            "atomic wolf",
-            "atomictorch studio",
-            "atooi",
-            "attack studio",
-            "atum software",
-            "atypical games",
-            "auroch digital",
-            "aurogon shanghai",
-            "aurora",
-            "autarca",
-            "authogin",
-            "autotelic games llc",
-            "avalanche software",
-            "avalanche studios",
-            "avalon digital",
-            "average games",
-            "avigames",
-            "avisgames",
-            "avocavo",
-            "avrillionarts",
-            "awem studio",
-            "awesome games studio",
-            "awoker games",
-            "axe games",
-            "axel sonic",
-            "axis games",
-            "ayfjaygames",
-            "azatotgames",
-            "azzunyan",
-            "barchboi",
-            "batovi games",
-            "bbg entertainment gmbh",
-            "bbq大好き",
-            "bd studio games",
-            "bhpg",
-            "bifrost cloud pte. ltd.",
-            "big wood games",
-            "bitmeup",
-            "bkom studios",
-            "blum entertainment",
-            "bober bros",
-            "bot jungle productions",
-            "bov",
-            "brunoarts entertainment",
-            "bt studios",
-            "bug duck games",
-            "bugbear",
-            "bulkhead",
-            "busan sanai games",
-            "bwi games",
-            "baba yaga games",
-            "back to basics gaming",
-            "backhole",
-            "bacon bandit games",
-            "bacq stellan",
-            "bad bird studios",
-            "bad kong games",
-            "bad logic studios",
-            "bad seed",
-            "bad vices games",
-            "badfly interactive, a.s.",
-            "badwolf games",
-            "badru",
-            "bajogames",
-            "baked games",
-            "bakumatsu games",
-            "balazs rozsa",
-            "balio studio",
-            "ballistic machine",
-            "baltoro games",
-            "bambuseaegames",
-            "bamtang games",
-            "banana hub",
-            "bananadoggames",
-            "bananaking",
-            "bancyco",
-            "barcoffee studio",
-            "barji",
-            "barlock games",
-            "barlow games ltd",
-            "barracuda disaster",
-            "bart bonte",
-            "bartosz bojarowski",
-            "bartoš studio",
-            "barty games",
-            "batholith entertainment",
-            "battenberg software",
-            "battlegoat studios",
-            "battlecruiser games",
-            "battlefront",
-            "batuhan ertan",
-            "bawu team",
-            "baykal arts",
-            "bazookafriend",
-            "bazuro games",
-            "bexide inc.",
-            "beamdog",
-            "bean boy games",
-            "bear in the night",
-            "beardedbrothers.games",
-            "beast games s. a.",
-            "beatshapers",
-            "beautifun games",
-            "beautiful glitch",
-            "bebop games",
-            "becongamescorp",
-            "bedtime digital games",
-            "befuddlebug",
-            "behaviour interactive inc.",
-            "behold studios",
-            "beijing litchi culture media co., ltd.",
-            "bekkerdev studio",
-            "belgerum",
-            "bellcat game",
-            "ben 'yahtzee' croshaw",
-            "ben allen",
-            "ben aprigliano",
-            "ben olding games",
-            "beni games",
-            "benjamin soulé",
-            "berzah games",
-            "berzerk studio",
-            "beshbarmak games",
-            "beshevgames",
-            "best friend games",
-            "best ride simulators",
-            "best way",
-            "betadwarf",
-            "better me tree",
-            "bew games",
-            "bewolba studios",
-            "beyond games",
-            "bhelpuri boyz",
-            "bibiki",
-            "big bird games",
-            "big blue bubble",
-            "big blue studios",
-            "big boat interactive",
-            "big boobs studio",
-            "big chungus productions",
-            "big fat simulations inc.",
-            "big fish studios",
-            "big loop studios",
-            "big robot ltd",
-            "big way games",
-            "bigbread",
-            "bigfrog studios",
-            "bigrock school",
-            "bigmoon entertainment",
-            "bigosaur",
-            "binary zoo",
-            "binge gaming ou",
-            "bionic pony",
-            "bip media",
-            "biscuit play",
-            "bisquitplay",
-            "bit golem",
-            "bit planet games, llc",
-            "bitcake studio",
-            "bitrockgames",
-            "bitca",
-            "biteme games",
-            "bithell games",
-            "bitlife",
-            "bitmap bureau",
-            "bitten toast games inc.",
-            "blacer studio",
-            "black curtain studio",
-            "black eye games",
-            "black eyed priest",
-            "black forest games",
-            "black isle studios",
-            "black lime studio",
-            "black pants studio",
-            "black sheep studio",
-            "black side",
-            "black train",
-            "black wing foundation",
-            "blackmark studio",
-            "blackbird interactive",
-            "blackmill games",
-            "blacksmith studios",
-            "blackthornprod",
-            "blackturn ltd",
-            "blake gillman",
-            "blake pierce",
-            "blanket fort games",
-            "blast programming",
-            "blazing griffin",
-            "blazing planet studio",
-            "bleeding moon studio",
-            "blekoh",
-            "blendo games",
-            "blind squirrel games",
-            "blindflug studios ag",
-            "blitworks",
-            "blob lab",
-            "blobfish",
-            "bloober team",
-            "bloober team sa",
-            "bloody pixel games",
-            "bloom digital media",
-            "blot interactive",
-            "blowfish studios",
-            "blusped",
-            "blue banana lab",
-            "blue brain games",
-            "blue butterfly",
-            "blue byte",
-            "blue entropy studios",
-            "blue giraffe",
-            "blue isle studios",
-            "blue palm studio",
-            "blue phoenix games",
-            "blue pin studio",
-            "blue sky games",
-            "blue slayer gaming",
-            "blue wizard digital",
-            "blue panda games",
-            "blueberry 藍莓社",
-            "blueeagle productions",
-            "blueline games",
-            "blueprinting",
-            "bluetale",
-            "blueplant entertainment",
-            "blueshift media",
-            "blueside",
-            "bluespy studios",
-            "blueteak",
-            "bluish-green productions",
-            "blyts",
-            "boar-in-games",
-            "bolhut",
-            "bold statement games",
-            "bolder games",
-            "bolverk games",
-            "bombservice",
-            "boolat games",
-            "boolean",
-            "boombit",
-            "boomfire games",
-            "bootur games",
-            "borealis",
-            "boringkate",
-            "boru",
-            "bottlecube inc.",
-            "bottled starlight",
-            "bovinosoftware",
-            "brace yourself games",
-            "brahmana \"perfect\"",
-            "brain seal ltd",
-            "braingoodgames",
-            "brainstorming team",
-            "brainwash gang",
-            "brainwashing games",
-            "brandon brizzi",
-            "brandtner",
-            "brave giant",
-            "brawsome",
-            "breakfall",
-            "breakthrough gaming llc",
-            "brenntkopf development",
-            "brettspielwelt gmbh",
-            "brian fitzgerald",
-            "brian macumber",
-            "brickcream",
-            "brilliant game studios",
-            "brimstone",
-            "brinemedia",
-            "britnet media",
-            "broken bear games",
-            "broken bunny studios, inc",
-            "bronstudio",
-            "brotherwood games",
-            "brouillard",
-            "bry guy studios",
-            "bryce summer",
-            "brøderbund",
-            "buce studios llc",
-            "buff studio",
-            "bufoproject",
-            "bugbyte ltd.",
-            "bugy games",
-            "builder7",
-            "buka development",
-            "bulathard",
-            "bullfrog productions",
-            "bulut ulu",
-            "bulwark studios",
-            "bumblebean games",
-            "bumpkinbrothers",
-            "bundem games",
-            "bungie",
-            "burak dabak",
-            "burgee media",
-            "burut ct",
-            "business tycoon",
-            "butterfly",
-            "byaka games",
-            "byte barrel",
-            "byterockers' games",
-            "bytewerkz ltd.",
-            "bytro labs gmbh",
-            "byzantine games",
-            "c's earth",
-            "cage studios",
-            "capcom co., ltd",
-            "carnage production studios",
-            "cascha games",
-            "cave interactive co.,ltd.",
-            "cavyhouse",
-            "cbc games",
-            "cbe software",
-            "cc arts",
-            "ccyy",
-            "cdis lab.",
-            "cga studio",
-            "cgdc community game",
-            "cggames",
-            "ch-gaming studio",
-            "chen yuanji",
-            "ci games",
-            "clockup",
-            "colopl, inc.",
-            "cool devs s.r.l.",
-            "cosdots",
-            "cowcat",
-            "creativ game developer llc.",
-            "creative vr3d",
-            "crx entertainment pte ltd",
-            "crx entertainment pte ltd.",
-            "crx entertainment pte. ltd.",
-            "cuiwenping",
-            "cwdi games",
-            "caracing studio",
-            "cabbage soft",
-            "cabbibo",
-            "cabbit",
-            "cactus vr studios",
-            "caden goodwin",
-            "caio flavio",
-            "caipirinha games gmbh",
-            "cakeneq games",
-            "cakewalk",
-            "calappa games",
-            "calepin studio",
-            "calicosdev studio",
-            "caligari games",
-            "callmerat",
-            "calmdv",
-            "calvin maccaull",
-            "camel 101",
-            "cameron james low",
-            "campfire studio",
-            "canalside studios",
-            "cankut keskin",
-            "cannibal interactive",
-            "capky games",
-            "capstone software",
-            "captain games",
-            "capturedleek27",
-            "capybara games",
-            "caravel games",
-            "carbon games",
-            "carbon studio",
-            "cardboard keep",
-            "carlmorganart",
-            "carlo d'apostoli projects",
-            "carloc",
-            "carlos agüera fernández",
-            "carlos coronado",
-            "carlos junio",
-            "carlos martins",
-            "carrot studios",
-            "carson kompon",
-            "cartboard games",
-            "cascade of leaves",
-            "cascadia games",
-            "casey donnellan games llc",
-            "casgra",
-            "cashcowgames",
-            "casket",
-            "castle pixel, llc.",
-            "casual brothers ltd.",
-            "cat nigiri",
-            "cat paw game",
-            "cat-astrophe games",
-            "catbellunion",
-            "catastoica",
-            "catland",
-            "catness game studios",
-            "cats",
-            "cats who play",
-            "cavetap",
-            "cellab",
-            "celeritas games",
-            "celery emblem™",
-            "cellstudios",
-            "cellar door games",
-            "centvire",
-            "centerpoint gaming",
-            "cerasus",
-            "cerevrum inc.",
-            "chadams studios",
-            "chainsawesome games",
-            "challenging games",
-            "chaoye liu",
-            "chaos group games",
-            "chaos theory studios ltd.",
-            "chaosmonger studio",
-            "chard",
-            "charging llama",
-            "charles games",
-            "charlie behan",
-            "charlie brej",
-            "charlie oscar lima tango interactive entertainment",
-            "charlykuschel",
-            "charm games",
-            "charyb games",
-            "chasefox",
-            "chasing carrots",
-            "cheapeesoft games",
-            "cheesecake dev",
-            "cheesecake studios",
-            "cherry kiss games",
-            "cherry pop games",
-            "chessbase",
-            "chessbase gmbh",
-            "chewa",
-            "chibig",
-            "chicken launcher",
-            "chicken waffle",
-            "chickenpig software",
-            "child-dream",
-            "childish things",
-            "childish things ltd",
-            "chillfun",
-            "chilling moose games",
-            "chillyroom",
-            "chim ruoi games",
-            "chimera entertainment",
-            "chocolate ship games",
-            "choice provisions",
-            "choloco",
-            "chris",
-            "christoffer ryrvall",
-            "christopher cinq-mars jarvis",
-            "christopher shove",
-            "christopher yabsley",
-            "chromosphere games",
-            "chronospace",
-            "chucklefish",
-            "chute apps",
-            "cine game interactive systems",
-            "cipher hive",
-            "cipher prime studios",
-            "circle fairy flower",
-            "circle gyu",
-            "circle poison",
-            "circus",
-            "citor3",
-            "clap games",
-            "clapperheads",
-            "clarity games",
-            "clarus victoria",
-            "classic card games limited",
-            "classic game software",
-            "cleanwatersoft",
-            "cleardot games",
-            "clecota games",
-            "cleril calamity studios",
-            "clever plays",
-            "clever simulation entertainment",
-            "cleversan games",
-            "cleverweek",
-            "clickgames",
-            "clickteam",
-            "clifftop games",
-            "cloak and dagger games",
-            "cloaz studio",
-            "clock out games",
-            "clock in dream",
-            "clockstone",
-            "clockwork acorn",
-            "clockwork origins",
-            "clockwork wolf",
-            "cloudhead games ltd.",
-            "clyde smets",
-            "coatsink",
-            "cobra mobile",
-            "code avarice",
-            "code mystics",
-            "code society",
-            "codemanu",
-            "codeglue",
-            "codingape games",
-            "coffee stain studios",
-            "coffee studio",
-            "cogent education",
-            "cohort 32",
-            "cohort 33",
-            "coin operated games",
-            "coke cat studio",
-            "cold beam games",
-            "cold-dark software™",
-            "coldwild games",
-            "coldwood interactive",
-            "colestia",
-            "colorfiction",
-            "colorgrave",
-            "colossal order ltd.",
-            "colossal wreck",
-            "colossus game studio",
-            "colossus interactive",
-            "com2us",
-            "comar studios",
-            "commodore sinapsy",
-            "compulsion games",
-            "conceptual cage",
-            "concrete games",
-            "congo jungle games",
-            "conifer studios",
-            "conmtrast",
-            "connection",
-            "conner rush",
-            "conor hehr",
-            "conradical games",
-            "considera games llc",
-            "convoy games",
-            "cookiedev",
-            "coolcraftgames",
-            "coolpeng",
-            "corbie games",
-            "cordelia games",
-            "core design",
-            "coremedia,inc.",
-            "corentin derbré",
-            "corey martin",
-            "correcture games ab",
-            "corrosive studios llc",
-            "cortopia studios",
-            "corvaena games llc",
-            "cosmic void",
-            "cosmo d",
-            "cosmo machia",
-            "cosmocat",
-            "couplegames",
-            "cow corp.",
-            "cow game",
-            "cowleyfornia studios",
-            "cozy bee games",
-            "cozy game pals",
-            "cozy strawberry",
-            "cozy village",
-            "crabby team",
-            "crackedghostgames",
-            "crackshell",
-            "cradle games",
-            "crafty studios",
-            "cranberry production",
-            "crania games",
-            "crankage games",
-            "crazy devs",
-            "crazy games",
-            "crazy goat games",
-            "crazy retro games",
-            "crazybunch",
-            "crazylabs",
-            "crazysky3d",
-            "crespirit",
-            "createam",
-            "creaky lantern games",
-            "cream team",
-            "create something interesting",
-            "creative bytes studios",
-            "creative hand",
-            "creative storm entertainment",
-            "creativeforge games",
-            "creepy brothers",
-            "crema",
-            "crenetic",
-            "crenetic gmbh studios",
-            "crescent moon games",
-            "crian soft",
-            "crimsonite games",
-            "cristian manolachi",
-            "critical games",
-            "critoniuum",
-            "crossplatform",
-            "croteam vr",
-            "crows crows crows",
-            "crunchy leaf games",
-            "crush-vadin",
-            "crynex",
-            "cryo interactive",
-            "crystal game works",
-            "crystal shard",
-            "cuberz",
-            "cult software",
-            "curiosity computing",
-            "curious studio",
-            "curse box studios",
-            "curve studios",
-            "cutlass boardgames",
-            "cyan worlds inc",
-            "cyanide studios",
-            "cyber eye",
-            "cyber rhino studios",
-            "cyberconnect2",
-            "cyberconnect2 co. ltd.",
-            "cybernetic walrus",
-            "cyberwave",
-            "cyclone studios",
-            "cygames, inc.",
-            "cykyria",
-            "cynical honey",
-            "cyphen productions",
-            "d-pad studio",
-            "d.p.l.d.s",
-            "d.w.s.",
-            "d1one",
-            "ddd wares",
-            "ddreams games",
-            "deep games",
-            "deklazon",
-            "det@acu",
-            "dgma",
-            "dgv-games",
-            "dimps",
-            "dirigo games",
-            "dk productions",
-            "dl softworks",
-            "dm media",
-            "dmd 'ware",
-            "dmu software",
-            "dnv",
-            "dnzy games",
-            "dog hoggler",
-            "domo studio",
-            "don't nod",
-            "dontnod entertainment",
-            "dosman games",
-            "dragami games, ltd.",
-            "drago entertainment",
-            "dragonfly gf co., ltd.",
-            "drybread",
-            "du&i",
-            "dxf games",
-            "dy studio",
-            "dya games",
-            "dynamicnext",
-            "dystant games",
-            "dafluffypotato",
-            "dawenyu",
-            "daemin n",
-            "dahku",
-            "daimen gaming",
-            "daisessen",
-            "daisu games",
-            "daisy games",
-            "dakecraft",
-            "dancing dots",
-            "dancing dragon games",
-            "dane winn",
-            "dangerous derk interactive",
-            "dangerousbob studio llc",
-            "dani gas",
-            "danicy",
-            "daniel agüera fernández",
-            "daniel brendel",
-            "daniel fernandez chavez",
-            "daniel george",
-            "daniel henriques",
-            "daniel jeanneau",
-            "daniel li",
-            "daniel linssen",
-            "daniel mullins games",
-            "daniel ritchie - pdhowler.com",
-            "daniel rychlý",
-            "daniel snd",
-            "daniel da silva",
-            "daniele doesn't matter",
-            "dano sato",
-            "daotuan wang",
-            "dare looks",
-            "daring touch",
-            "darius bode",
-            "darius immanuel guerrero",
-            "dark gaia studios",
-            "dark light studio",
-            "dark one!",
-            "dark shine game studio",
-            "dark sky empire",
-            "darkbasic",
-            "darkchibishadow",
-            "darkdes labs",
-            "darkenergystudio",
-            "darklight studio",
-            "darkphobia games",
-            "darkstone digital",
-            "darkania works",
-            "darkling room",
-            "darksun studio",
-            "dasaku laboratory",
-            "dascumaru",
-            "data realms",
-            "datawheel",
-            "date ariane games",
-            "dave seaman",
-            "david gallardo",
-            "david montesi rivas",
-            "david moralejo sánchez",
-            "david nguyen",
-            "david pateti",
-            "david rudyi",
-            "david vogt",
-            "day art's games",
-            "daye productions",
-            "daylight studios",
-            "days of wonder",
-            "dexp",
-            "dead crow",
-            "dead mage",
-            "deadlycrow games",
-            "deanforge",
-            "deathtrap",
-            "debonosu works",
-            "deceptive games",
-            "deceptive games ltd.",
-            "deck 13",
-            "deck nine",
-            "deck13",
-            "deck13 hamburg",
-            "deconstructeam",
-            "deeber",
-            "deep dive interactive",
-            "deep green games",
-            "deep root interactive",
-            "deep shadows",
-            "deep shadows games",
-            "deep silver volition",
-            "deeprootsdevelop",
-            "deer dream studios",
-            "deilroxentertainment",
-            "dejobaan games",
-            "dejobaan games, llc",
-            "del_player",
-            "delta",
-            "delta arcade",
-            "delusional games",
-            "demagog studio",
-            "demin games",
-            "demolish games s.a.",
-            "denda games",
-            "denis novikov",
-            "denki gaka",
-            "dennaton games",
-            "dennis sven mittmann",
-            "denny truong",
-            "departure interactive",
-            "depiction games",
-            "derik d.f",
-            "derin",
-            "dern lin",
-            "derrick does vr",
-            "desert fox",
-            "desert owl games llc",
-            "design factory",
-            "destroyer doggo",
-            "destructive creations",
-            "detalion games s.a.",
-            "deva",
-            "devcats",
-            "devdan games",
-            "devespresso games",
-            "devil's cider games",
-            "devilishgames",
-            "devm games",
-            "devon wiersma",
-            "devonanimation",
-            "dexied games",
-            "dexter studios",
-            "deyteris",
-            "diamosdev",
-            "different tales",
-            "diggidy.net",
-            "digitales interactive",
-            "digital continue",
-            "digital crafter",
-            "digital cybercherries",
-            "digital domain",
-            "digital dream labs",
-            "digital dreams entertainment",
-            "digital eel",
-            "digital extremes",
-            "digital fusion inc.",
-            "digital happiness",
-            "digital leisure inc.",
-            "digital reality",
-            "digital sun",
-            "digital theory ltd.",
-            "digital tours interactive",
-            "digitaldna games llc",
-            "digitaldream",
-            "digitalez",
-            "digitalmindsoft",
-            "digixart",
-            "dikobraz games",
-            "dilmer valecillos",
-            "dima fyuriy",
-            "dimleteam",
-            "dimpiks",
-            "dimps corporation",
-            "dincicode",
-            "dingdang",
-            "dingo games",
-            "dininho",
-            "directive games limited",
-            "dirty adventures 🖤",
-            "disaster squad productions",
-            "dischan media",
-            "discocargames",
-            "disillusion dev",
-            "dmytro pohrebnyi",
-            "doborog games",
-            "dodge roll",
-            "dodo novels",
-            "dog dog studios",
-            "dog on god",
-            "doggottengame",
-            "dogwood gaming",
-            "dojin otome",
-            "dolores entertainment",
-            "domihorror development lab",
-            "dominik kopecký",
-            "domynyo srl",
-            "don whitaker",
-            "don't bite devs",
-            "dongguan liuli game technology co.,ltd",
-            "donuts co. ltd.",
-            "doomster entertainment",
-            "door 407",
-            "dorsalfin studio",
-            "dosane games",
-            "doseone",
-            "dotoyou games",
-            "double dash studios",
-            "double dice games",
-            "double e",
-            "double eleven",
-            "double peach productions",
-            "double stallion",
-            "double w",
-            "doubletapstudio",
-            "doubleagames",
-            "doubleton game studio",
-            "dr. kucho! games",
-            "dr. puzzler",
-            "dracula's cave",
-            "drageus games s.a.",
-            "dragon dropper",
-            "dragon emperors",
-            "dragon slumber",
-            "dragonrise games",
-            "dragons eye studio",
-            "drakeling labs",
-            "drakhar studio",
-            "drakkar dev",
-            "draw distance",
-            "dreadxp",
-            "dreamforge intertainment",
-            "dreamstep",
-            "dreamstudios",
-            "dreamteam mobile",
-            "dreamatrix",
-            "dreamers workshop",
-            "dreamirl",
-            "dreamlesshero",
-            "dreamlight games",
-            "dreamlight games studios sl",
-            "dreamlike",
-            "dreamloop games",
-            "dreamssoftgames",
-            "dreamverse entertainment",
-            "drillimation systems",
-            "drinkbox studios",
-            "droid productions",
-            "drone garden studios",
-            "drop_dead_fred",
-            "dry cactus",
-            "ducats games studio",
-            "dugringo",
-            "duawolf",
-            "duaik entretenimento",
-            "duality games",
-            "dualtail",
-            "duck inc",
-            "dudeeki",
-            "duhndal",
-            "dumativa",
-            "dvora studio co., ltd.",
-            "dwarven potion brew",
-            "dymchick1",
-            "dynamic games",
-            "dynamic pixels",
-            "e mcneill",
-            "e-line media",
-            "e.f. studios",
-            "ed",
-            "ef universe games llc",
-            "ejrgames",
-            "electrostalin entertainment",
-            "eliot",
-            "em games",
-            "emika_games",
-            "enf stuff",
-            "enteri",
-            "evil games",
-            "examgames",
-            "exor studios",
-            "experience",
-            "ey-studio",
-            "eyefront",
-            "eagleeye games",
-            "easy s studio",
-            "easygames",
-            "easyways team",
-            "eathrabaria",
-            "echoverse core",
-            "eclipse games",
-            "ecoshooter",
-            "edco games",
-            "eddysssgames",
-            "edelweiss",
-            "eden games",
-            "eden industries",
-            "edmund mcmillen",
-            "eduard kozadaev",
-            "edwin montgomery",
-            "edym pixels",
-            "eerie guest",
-            "efecto studios",
-            "egg fried rice",
-            "eggnut",
-            "eggcode",
-            "egor magurin",
-            "egutidze",
-            "eidos montreal",
-            "eidos-montréal",
-            "eirtep",
-            "el vagabundo",
-            "elaphant ar",
-            "elasto mania team",
-            "elden pixels",
-            "elder games",
-            "elder leaf studio",
-            "electric monkeys",
-            "electronic arts",
-            "element games, llc",
-            "element studios",
-            "elementarium games",
-            "elephant",
-            "elephant games ar",
-            "elise ogle",
-            "elite lords studios",
-            "ells&pills",
-            "elushis",
-            "elusive panda",
-            "elvgames",
-            "elvio lujan",
-            "emberheart games",
-            "emblematic group",
-            "emerald knight interactive llc",
-            "emergency exit",
-            "emerick gibson",
-            "emilios manolidis",
-            "emmanuel henné",
-            "empty clip studios",
-            "empyrean",
-            "enchant games",
-            "encoderx",
-            "endless shirafu",
-            "endless void studios",
-            "endlessfluff games",
-            "energy milk",
-            "engine software bv",
-            "enigma entertainment",
-            "enigmatic network",
-            "enitvare",
-            "enki",
-            "enlight software limited",
-            "enokippu",
-            "ensemble studios",
-            "entalto studios",
-            "entergram",
-            "entertainment forge",
-            "entries games",
-            "entwicklerx",
-            "enygmage",
-            "eojin kim",
-            "epixr games",
-            "epic banana games llc",
-            "epicvr",
-            "epiphany games",
-            "erebeta studios",
-            "eren aydin",
-            "erik asmussen",
-            "ero team triangle",
-            "erotes studio",
-            "ertal games",
-            "escu:de",
-            "esenthel",
-            "eskemagames",
-            "estoty",
-            "eternal dream",
-            "eternal night studios",
-            "eternity dev",
-            "eternity studios",
-            "ethan robichaux",
-            "ethereal darkness interactive",
-            "etienne andlau",
-            "eugen systems",
-            "euphoria games",
-            "eurocom",
-            "evan szymanski",
-            "every single soldier",
-            "evgeny petrov",
-            "evie powell",
-            "evil boobs cult",
-            "evil bunneh",
-            "evil objective",
-            "evil twin artworks",
-            "evvacon",
-            "excalibur",
-            "exkee",
-            "exordium games",
-            "expansive worlds",
-            "experience inc.",
-            "explosive squat games",
-            "expresso studios",
-            "exquisite games",
-            "exscape",
-            "extend studio",
-            "f-games",
-            "fc maker",
-            "felistella",
-            "feyxuan",
-            "fg",
-            "fhnbhj",
-            "fm studio",
-            "french-bread",
-            "fta games",
-            "full steam studios",
-            "fyqd-studio",
-            "fyre games",
-            "fabio cecchini",
-            "fabraz",
-            "facepunch studios",
-            "factus games",
-            "fading club",
-            "fadygames",
-            "failbetter games",
-            "fair games studio",
-            "fair play labs",
-            "fair weather studios, llc",
-            "faithy games",
-            "fakt software",
-            "fallalypse studio",
-            "fallen tree games ltd",
-            "falling ninja productions",
-            "family devs",
-            "fancy bytes, reactor",
-            "fancy fish games",
-            "fang of moon",
-            "fantasia studio",
-            "fantasy flight games",
-            "fantasy games studio",
-            "far mills",
-            "farsight studios",
-            "faravid interactive",
-            "farlight games industry",
-            "farmind studio",
-            "fasold games",
-            "fast travel games",
-            "fastgame",
-            "fatbot games, s. r. o.",
-            "fatih mert",
-            "fatshark",
-            "favorite",
-            "feas",
-            "feelthere",
-            "fei",
-            "felio stung rog",
-            "felipe fleming",
-            "felipe mattar",
-            "femdom game world",
-            "feodosiy",
-            "feperd games",
-            "feral code monkey",
-            "fermenter games",
-            "fern nigro",
-            "fernando araujo",
-            "ferulox studios",
-            "fewjix",
-            "fibretigre",
-            "fiction factory games",
-            "fictiorama studios",
-            "fifth edge studios",
-            "fika game studio",
-            "filip budd",
-            "final game studio",
-            "final offer",
-            "final screw",
-            "finalboss games",
-            "finger tip",
-            "finite reflection studios",
-            "finnish museum association",
-            "finnsoft",
-            "fire game studios",
-            "fire hose games",
-            "firefly",
-            "firepillar2",
-            "firering studio",
-            "firebelley",
-            "firebug games",
-            "firedog creative company limited",
-            "fireglow",
-            "fireproof games",
-            "first games interactive",
-            "fish chain games",
-            "fishcow studio",
-            "fishing cactus",
-            "five bn",
-            "five mind creations",
-            "fiveamp",
-            "fivesyounger development",
-            "fivexgames",
-            "flamebait games",
-            "flaming firefly",
-            "flapbox studios",
-            "flashpoint games, llc",
-            "flashback games",
-            "flat earth games",
-            "flat voxel",
-            "flazm",
-            "fleon games",
-            "flexible media",
-            "flgaming",
-            "flight school studio",
-            "flightless",
-            "flippfly llc",
-            "floor chicken",
-            "flow fire games",
-            "flox studios",
-            "flugames",
-            "flump studios",
-            "flux games",
-            "fly & wing studio",
-            "fly dream dev",
-            "flyanvil",
-            "flyin kebab studio",
-            "flying beast labs",
-            "flying islands team",
-            "flying oak games",
-            "flying star games",
-            "flying wild hog",
-            "flying. stone. production",
-            "flynn's arcade",
-            "fov",
-            "fobti interactive",
-            "focka games",
-            "foolish mortals games",
-            "for fun games",
-            "forceight",
-            "fordesoft",
-            "forevr games inc",
-            "forestlight games",
-            "forever young games",
-            "forgotten empires",
-            "formula fanboy",
-            "fortcullis games",
-            "fossettgaming",
-            "fountain game studio",
-            "four circle interactive",
-            "four quarters",
-            "four winged studio",
-            "fox_sebby",
-            "frazack",
-            "fractal projects",
-            "frag games",
-            "frank gallinsky",
-            "françois sahy",
-            "freakzone games",
-            "fred wood",
-            "fredaikis ab",
-            "frederik holst",
-            "free lives",
-            "free range games",
-            "freebird games",
-            "freedomize studio",
-            "frictional games",
-            "friday night software",
-            "friendly fire software",
-            "frima studio",
-            "frinky",
-            "frisbystudio",
-            "frogames",
-            "frogdice",
-            "from the bard",
-            "fromlefcourt",
-            "fromsoftware, inc.",
-            "frontier works",
-            "frontline: games series",
-            "frooxius",
-            "frostfire",
-            "frostwood interactive",
-            "frozen district",
-            "frozen way",
-            "frozenbyte",
-            "frymore",
-            "fullbright",
-            "fullmetal developer",
-            "fun infused games",
-            "funplus international ag",
-            "funatics software",
-            "funcom",
-            "funcraft games",
-            "funktronic labs",
-            "funny games",
-            "funny twins",
-            "funselektor labs inc.",
-            "furgoldgames",
-            "furlough games",
-            "furry dreams lab",
-            "furry tails",
-            "fury games pty ltd",
-            "fury software",
-            "fussycraft",
-            "future lighthouse",
-            "futuregamestudio",
-            "futurtech",
-            "fuyu games ab",
-            "fyn games",
-            "fürst",
-            "g. a. williams",
-            "g.rev ltd.",
-            "g1 playground",
-            "g5 software",
-            "game freak inc.",
-            "games for humans",
-            "gato studio",
-            "gb patch games",
-            "gbrossoft",
-            "gc studio",
-            "gdnomad",
-            "genie",
-            "gfx47",
-            "ggoldbig",
-            "ggaming",
-            "ghbe studios",
-            "ghxyk2",
-            "gift ten industry k.k.",
-            "giga",
-            "gj arts",
-            "glhf_studio",
-            "gn studios",
-            "gocore",
-            "godnask",
-            "grasshopper manufacture inc.",
-            "gsc game world",
-            "gtgd",
-            "gxplay",
-            "gagonfe",
-            "gaijin games",
-            "galactic games",
-            "galactic workshop",
-            "galart",
-            "galaxy gate",
-            "galaxyverse",
-            "galvanic games",
-            "game alchemists",
-            "game changers",
-            "game cooks",
-            "game development alexander lamers",
-            "game dynasty",
-            "game hollywood games",
-            "game mechanics llc",
-            "game museum",
-            "game on production",
-            "game sage productions",
-            "game science",
-            "game studio abraham stolk inc.",
-            "game studio inc.",
-            "game sunlight",
-            "game for games",
-            "game-labs",
-            "gameart studio gmbh",
-            "gamechanger studio",
-            "gamedev_toolmaker",
-            "gameformatic s.a.",
-            "gamemixer",
-            "gamerealmmadness",
-            "gamexp.com",
-            "gamechuck",
-            "gamecom team",
-            "gamecraft studios",
-            "gamedust",
-            "gameloop",
-            "gamenergy studio",
-            "gamepires",
-            "gameplay studio vr",
-            "gamera interactive",
-            "gamershype productions",
-            "gamerzdan",
-            "games 4experience",
-            "games farm",
-            "games by stitch",
-            "gamessafu",
-            "gamesare",
-            "gamesoft studios",
-            "gametroleum",
-            "gaming minds studios",
-            "gamious",
-            "gamma ray chamber",
-            "gammalateral",
-            "gangsta studios",
-            "garakowa marshmallow",
-            "garbage bin studio",
-            "garden of dreams",
-            "garett a c hunter",
-            "gas powered games",
-            "gattai games",
-            "gaugepunk games",
-            "gawkfish studios",
-            "gear worx productions",
-            "geekpit studio",
-            "geekon",
-            "gem rose accent",
-            "gemcraft games",
-            "gemdrops, inc.",
-            "gemini stars games",
-            "geniesoft inc.",
-            "geniteam solutions",
-            "genkung",
-            "gentle manhands",
-            "gentlymad studios",
-            "geoff keighley",
-            "george",
-            "george alexandros",
-            "gernot frisch",
-            "gestalt development studio",
-            "gestmorph games",
-            "gexagonvr",
-            "gg",
-            "ghost machine",
-            "ghost_rus games",
-            "giant fox studios",
-            "giant margarita",
-            "giants software",
-            "gidazgames",
-            "giioii",
-            "gilded rune games",
-            "giorgi abelashvili",
-            "girl's software",
-            "girls make games",
-            "glass bottom games",
-            "glass knuckle games",
-            "glasscannon studio",
-            "glitch games",
-            "glitch studio",
-            "glitchr studio",
-            "glob games studio",
-            "glowstick entertainment",
-            "gnelf",
-            "go play games ltd",
-            "go2game.com",
-            "gobit games",
-            "goblinz studio",
-            "goca games",
-            "goex games",
-            "gogii",
-            "golden dragon studio",
-            "golden pick games",
-            "golemlabs",
-            "goloso games",
-            "gompanggames",
-            "gonggamorecontents inc.",
-            "goodcrafter",
-            "goober games",
-            "good games",
-            "good gate media",
-            "goodmood",
-            "google",
-            "google inc.",
-            "gooners game",
-            "gordon little",
-            "gosdev production",
-            "grab games",
-            "grabthegames studios",
-            "grace bruxner",
-            "grade 9 games",
-            "grand technology associates",
-            "grant marrs",
-            "graphxgames",
-            "graphite lab",
-            "grassgames",
-            "graveck",
-            "graven visual novels",
-            "graverobber foundation",
-            "graviteam",
-            "gravity interactive",
-            "gray boss",
-            "gray mantis",
-            "gray wolf interactive",
-            "great idea games",
-            "great lakes reality labs",
-            "great potion games",
-            "greathergames",
-            "green goose corporation",
-            "green lava studios",
-            "green onion games",
-            "green-eyed taxi",
-            "greenbranchgames",
-            "greenlynx",
-            "greenolor studio",
-            "greewook studio",
-            "greg lobanov",
-            "gregory oliveira",
-            "grey alien games",
-            "grey dog software",
-            "grey gods",
-            "grey havens",
-            "grey sekiya",
-            "gridsky software",
-            "grimtalin",
-            "grimlore games",
-            "grimorio of games",
-            "grindwheel games",
-            "grizzlygames",
-            "groove jones llc",
-            "ground control studios",
-            "ground shatter",
-            "grounding inc.",
-            "grove street games",
-            "growfall games",
-            "growing seed games",
-            "growing seeds",
-            "grégory joerger",
-            "gua",
-            "guan yue",
-            "guara studios",
-            "guiltyeva",
-            "guimaraf studio",
-            "gunfire games",
-            "gurashop",
-            "gurila ware games",
-            "guru games",
-            "gus jewell",
-            "gustav",
-            "gustav almström",
-            "gwyn games",
-            "gyro-games inc.",
-            "ha studio ltd.",
-            "halva studio",
-            "hannmade studios",
-            "hanyubo",
-            "hb studios",
-            "heiwa entertainment",
-            "hfrk.",
-            "hiroko imaki",
-            "hizuki",
-            "hkgamesstudio",
-            "hmm",
-            "hoguru games!",
-            "hq games",
-            "hush interactive",
-            "hv",
-            "hade games",
-            "hajime doujin circle",
-            "hammer & ravens",
-            "hammer labs",
-            "hamster on coke games",
-            "hamsters gaming",
-            "hamumu games, inc.",
-            "han zhiyu",
-            "hanabira",
-            "hanako games",
-            "handmade game",
-            "handelabra games inc.",
-            "handshake firm",
-            "hanged bunny studio",
-            "hangover cat purrroduction",
-            "haohao games",
-            "hapgames",
-            "happy bat",
-            "happy fish",
-            "happy max",
-            "happy snake",
-            "happydaedalus",
-            "happygames",
-            "happymeal",
-            "happymeal inc.",
-            "hardcore studio",
-            "hardi",
-            "hardy games",
-            "harebrained schemes",
-            "haruneko entertainment",
-            "harvester games",
-            "hashdev",
-            "haska su",
-            "hasoyua",
-            "hassaanasif",
-            "hatus quemuel",
-            "havishamone games",
-            "hawkx games",
-            "haydee interactive",
-            "hayo van reek",
-            "hazelight studios",
-            "hazy paw games inc",
-            "her interactive, inc.",
-            "hex",
-            "headbang studio",
-            "headroom.one",
-            "headware games",
-            "headway games",
-            "heart machine",
-            "heart shaped games llc",
-            "heartbeat plus",
-            "heartcoredev",
-            "heartbit interactive",
-            "heartomics",
-            "heartstrings interactive",
-            "heatwave studios",
-            "heaven brotherhood",
-            "heaviside creations",
-            "heavy iron studios",
-            "heavy sheep",
-            "hecthoor entertainment",
-            "heidengames",
-            "heimo game studio",
-            "hejled studio",
-            "heliocentric studios",
-            "heliosphere software",
-            "hello games",
-            "hello there games",
-            "hellshake yano",
-            "hematite",
-            "henry hoare",
-            "hentai puzzle",
-            "hentai room",
-            "hentai room stories",
-            "hentai vr studios",
-            "hentai x",
-            "hero concept",
-            "hero games",
-            "herolabs",
-            "herrero games",
-            "hexage",
-            "hexaluga mines",
-            "hexes of war",
-            "hexxx game studio",
-            "heynau",
-            "hidden cats",
-            "hidden ocean games",
-            "hidden path entertainment",
-            "hidden tower studios",
-            "hide games",
-            "hidechara",
-            "higgs games gmbh",
-            "high voltage software",
-            "high and wide",
-            "highlander interactive",
-            "highwalls",
-            "hijong park",
-            "himalaya studios",
-            "hip soft",
-            "hippo games",
-            "hitbear studio",
-            "hitcents",
-            "hitheryon games",
-            "hogo company",
-            "hoi hoi hoi",
-            "holitass",
-            "hollow ponds",
-            "hollowings",
-            "hologryph",
-            "holomia",
-            "holospark",
-            "holyday studios",
-            "holystep games",
-            "home fire games",
-            "home works",
-            "homebearstudio",
-            "homegrown games",
-            "homeworks studios",
-            "hongzhenjin",
-            "honor games",
-            "hoochoo game studios",
-            "hopoo games",
-            "horizon hobby, llc",
-            "horny69team",
-            "horrible guild",
-            "horsegames",
-            "hot chill",
-            "hotbamboo",
-            "hotbunny",
-            "hotfoodgames",
-            "house of mallows",
-            "house of secrets",
-            "house of tales",
-            "house of the jackalope",
-            "hoverkitty games",
-            "howlingrain",
-            "huang pinghui",
-            "human head studios",
-            "hunex",
-            "huniepot",
-            "hunt games",
-            "hunt studio",
-            "huntah",
-            "hunted cow games",
-            "huochairen interactive entertainment",
-            "huy phan",
-            "hyanmaru games",
-            "hybriona technologies llp",
-            "hydravision entertainment",
-            "hype productionz",
-            "hypetrain digital",
-            "hyper games",
-            "hyper hippo games",
-            "hyperkat games",
-            "hyperstrange",
-            "hypnos games",
-            "hypnotic ants",
-            "hypothesys_indie_dev",
-            "hörberg productions",
-            "i'm moralist",
-            "idea fruition",
-            "idhas studios",
-            "igg singapore pte. ltd.",
-            "ikigames",
-            "ikinagames",
-            "ilikescifi games",
-            "illusion",
-            "imperial dynamics",
-            "indieplay",
-            "inessoft",
-            "inork game",
-            "inside system",
-            "intense",
-            "interheart glossy",
-            "io interactive a/s",
-            "iobit",
-            "ipacs",
-            "isvr",
-            "isy",
-            "itc studio",
-            "itk",
-            "iv productions",
-            "ian c pook",
-            "ian maclarty",
-            "ibis games",
-            "icarus games",
-            "ice code games",
-            "ice-cold shivering studios",
-            "ice-pick lodge",
-            "iced lizard games",
-            "iceflake studios",
-            "icehelm",
-            "icehole games",
-            "icuzo",
-            "idea cabin",
-            "ige olwen",
-            "iggymob co.,ltd",
-            "ignatios productions",
-            "ignibit",
-            "igniting spark games",
-            "igor krutov",
-            "iguana entertainment",
-            "iguanabee",
-            "ikuku",
-            "ilan papini",
-            "ilex games",
-            "ilias giouroukis",
-            "illfonic",
-            "illia ustenko",
-            "illuminated games",
-            "illusion softworks",
-            "illwinter game design",
-            "ilmir nasertdinov",
-            "ilya873",
-            "imcyan",
-            "image & form games",
-            "image power s.a.",
-            "image works",
-            "imagecode",
-            "imaginary conception",
-            "imaginationoverflow",
-            "imagitec",
-            "immersion",
-            "immersive vr education ltd.",
-            "imperiarte games",
-            "imperiumgame",
-            "impressions games",
-            "impromptu games",
-            "imran arafat",
-            "inarcade",
-            "inimages",
-            "insciencegames",
-            "incandescent games",
-            "incandescent workshop llc",
-            "incest tales",
-            "inceton games",
-            "independent arts software",
-            "independent arts software gmbh",
-            "indevelopment productions",
-            "indie",
-            "indie game group",
-            "indie games studio",
-            "indie marc",
-            "indie rocky",
-            "indiegala",
-            "indiecode games",
-            "indigo studios - interactive stories",
-            "indigoblue game studio",
-            "indigoware",
-            "indispensable studios",
-            "industry games",
-            "infidelisoft",
-            "infinite dreams",
-            "infinite level",
-            "infinite state games",
-            "infinitespring studio",
-            "infiniti sound imagery studios",
-            "infogrames europe sa",
-            "ingeniousfun",
-            "ink stains games",
-            "inkforge studios",
-            "inlet pipe productions",
-            "inlogic software",
-            "inner realm studios",
-            "innerspacevr",
-            "innervoid interactive",
-            "innocent grey",
-            "ino-co plus",
-            "inonia games",
-            "insane dreamers",
-            "inspiring games",
-            "instar",
-            "instinct games",
-            "integer games",
-            "interaction studios",
-            "interserv international",
-            "interactive fate",
-            "interactive gaming studios",
-            "interactive stone",
-            "interdimensional games inc",
-            "intermediaware",
-            "interplay",
-            "interplay entertainment corp.",
-            "intravenous software",
-            "intrepid marmot",
-            "introversion software",
-            "inuinangames",
-            "inverse game",
-            "invincibles studio ltd",
-            "iriysoft",
-            "iriya72",
-            "iron galaxy studios",
-            "iron tower studio",
-            "iron vr",
-            "ironequal",
-            "ironclad games corporation",
-            "ironhide game studio",
-            "ironsun studios",
-            "ironward",
-            "isa hutchinson",
-            "isaac cohen",
-            "ishtar games",
-            "islandware",
-            "it's anecdotal",
-            "itera laboratories",
-            "iteralabs",
-            "ithaqua labs",
-            "ivan pichugin",
-            "ivan zanotti's mymadnessworks",
-            "izanagigames",
-            "izukawan",
-            "j. c. springbourne",
-            "j. king-spooner",
-            "j.bowman",
-            "j.xargon",
-            "jchip game",
-            "jdm4ik",
-            "jdm4ik games",
-            "jfxgames",
-            "jjgames",
-            "jkk_works",
-            "jmj interactive",
-            "jnt games",
-            "joycity",
-            "jt mitchell",
-            "jw",
-            "jy",
-            "jace of shadows gaming llc",
-            "jack astral",
-            "jack gloyens",
-            "jack le hamster",
-            "jackbox gamez",
-            "jackson clayton",
-            "jacksong13",
-            "jaemoon choi",
-            "jaime barriga",
-            "jakai",
-            "jake olson",
-            "jake peng",
-            "jakub klementewicz",
-            "james butler",
-            "james earl cox iii",
-            "james h. van der meulen",
-            "james k. isaac",
-            "james smart",
-            "jan malitschek",
-            "jandusoft",
-            "jani penttinen",
-            "jason lovett",
-            "jason rohrer",
-            "jean-marc vanbalberghe",
-            "jeferson dias",
-            "jeff rigler",
-            "jellyfluff games",
-            "jellyfish parade",
-            "jellyworld",
-            "jenito",
-            "jeremy bailenson",
-            "jeremy couillard",
-            "jeremy fischer",
-            "jeroen van oosten",
-            "jerome labelle",
-            "jesse aidyn",
-            "jesse makkonen",
-            "jether",
-            "jhinbrush",
-            "jill gates",
-            "jim bame",
-            "jim dex",
-            "jimjams games",
-            "jincycle",
-            "jingtustudio",
-            "jl apps",
-            "jloo",
-            "jochen heizmann",
-            "joder",
-            "joe renwick",
-            "joe richardson",
-            "joel kivelä",
-            "joey drew studios",
-            "jofer's games",
-            "jofini",
-            "johan games",
-            "john adams",
-            "john coday",
-            "john szymanski",
-            "john wizard",
-            "john's project",
-            "johnny ostad",
-            "joi max",
-            "joindots gmbh",
-            "jolly crouton media ltd.",
-            "jollypunch games",
-            "joma rage",
-            "jon nielsen",
-            "jonathan francis",
-            "jonathan grey",
-            "jonathan moye",
-            "joogray videogames",
-            "jordan allen",
-            "jordan magnuson",
-            "jordan rott",
-            "jose lousa",
-            "josep monzonis hernandez",
-            "joseph cook",
-            "josh tam universe",
-            "joshua keith",
-            "josyan",
-            "jotar",
-            "joure visser",
-            "joy way",
-            "joyful software",
-            "joymasher",
-            "jublelemonseed",
-            "juggler games",
-            "jugilus",
-            "juicy lab",
-            "jul3dx",
-            "julian edison",
-            "julian henley",
-            "jump over the age",
-            "jundroo, llc",
-            "jungwoo yom",
-            "juri schupilo",
-            "just add water (developments), ltd.",
-            "just sauce studio",
-            "justjeff",
-            "justtomcuk",
-            "justin jimmo",
-            "justus yew",
-            "jutsu games",
-            "juvty worlds",
-            "jérôme bodin",
-            "k bros games",
-            "k-d lab",
-            "kadokawa corporation",
-            "kaijyu-09",
-            "kaiko",
-            "kamiichi digital",
-            "kara",
-            "karmagame hk limited",
-            "katsu",
-            "kayac inc.",
-            "kaydem games",
-            "kazegames",
-            "kdream",
-            "kemco",
-            "keyreal",
-            "khb-soft",
-            "kibodo",
-            "kibodo games",
-            "kimjuim",
-            "king art",
-            "kira",
-            "kkk",
-            "koex studio",
-            "kog",
-            "kosei yasuda",
-            "kotake create",
-            "ko_op",
-            "kr games",
-            "kritzelkratz 3000",
-            "ktx software",
-            "kx games",
-            "kaan bukusoglu",
-            "kaan özgül",
-            "kaigan games oü",
-            "kajaani university of applied sciences",
-            "kaleidogames",
-            "kamegames",
-            "kamichichi",
-            "kamil szczepanik",
-            "kan.kikuchi",
-            "kanashi studio",
-            "kaneda games",
-            "kanoe",
-            "kara stone",
-            "karashirenkon hobbies",
-            "karlis zabers",
-            "karolis dikcius",
-            "kastriot sulejmani",
-            "katapult",
-            "katatema",
-            "kavorka play",
-            "kavorkaplay",
-            "kawaii hentai",
-            "kazakov oleg",
-            "kazuhide oka",
-            "keaton applebaum",
-            "kebabos",
-            "kedronic uab",
-            "keen software house",
-            "kellenkyo",
-            "kelsam",
-            "kenningsly",
-            "kenny sun",
-            "kerberos productions",
-            "kerberos productions inc.",
-            "kerim kumbasar",
-            "kerry batts",
-            "ketchup ajino mayonnaise",
-            "kether studio",
-            "kevin macumber",
-            "kevin wacknov",
-            "key realm studios",
-            "keybol",
-            "kidalang",
-            "kielan xd",
-            "kigyodev",
-            "kiki castella",
-            "kiki games",
-            "killhouse games",
-            "killbug studio",
-            "killed pixel games",
-            "killerfish games",
-            "kimmo lahtinen",
-            "kinetic novels",
-            "king key games",
-            "king of the times",
-            "kingdom games",
-            "kinky fridays",
-            "kinto games llc",
-            "kipsaim(mike) delgado",
-            "kiririn",
-            "kiro games",
-            "kishmish games",
-            "kite games",
-            "kitfox games",
-            "kitsu games",
-            "kitsune games",
-            "kittehface software",
-            "kitty",
-            "kiz studios",
-            "kkyul",
-            "klabater",
-            "klankeklanke",
-            "kman studios",
-            "knight owl games",
-            "knuckle cracker",
-            "koalabs",
-            "kobra studio",
-            "kodansha vr lab",
-            "kodo linija",
-            "kofi-s",
-            "koheigallery",
-            "koker_007",
-            "koksny.com",
-            "kokutou umeboshi",
-            "kolbasinogames",
-            "kombits game studio",
-            "komar games",
-            "konfa games",
-            "konnichiwa games & media",
-            "konrad pawlikowski",
-            "konsordo",
-            "kool2play",
-            "korvinrular",
-            "koto games",
-            "kotoshiro",
-            "kraken ink.",
-            "krealit",
-            "kreizland games",
-            "krillbite studio",
-            "krisalis software",
-            "krispy animation",
-            "kristi jimenez",
-            "krome studios",
-            "krujoko",
-            "ktulhu solutions",
-            "kubikfoto gmbh",
-            "kucki",
-            "kunos simulazioni",
-            "kunstaat",
-            "kurayami yume games",
-            "kurenaibook",
-            "kvass da valenki",
-            "kwing works",
-            "kyle rodgers",
-            "kyle seeley",
-            "kylotonn",
-            "kyy games",
-            "kz software",
-            "l&p",
-            "l42 studios",
-            "lan - games ltd",
-            "lancarse ltd.",
-            "lb",
-            "lbr games",
-            "lcb game studio",
-            "leap game studios",
-            "lemioutgames",
-            "level5 inc.",
-            "lfr games",
-            "lh games limited",
-            "lijun",
-            "line games corporation",
-            "liv inc",
-            "lk avalon",
-            "lkk game",
-            "lkmad",
-            "llc blini games",
-            "lootzone studio",
-            "love&peace",
-            "lrdgames, inc.",
-            "lsp game",
-            "ltz",
-            "lu qi",
-            "luxo interactive",
-            "lzr games",
-            "la belle games",
-            "laray games",
-            "lab rabbit games ltd",
-            "labory",
-            "labyrinthine",
-            "lached up games",
-            "ladell parks",
-            "ladia group",
-            "lama glama game company",
-            "laminar research",
-            "lance games",
-            "landfall",
-            "lantis",
-            "larian studios",
-            "larsmidnatt",
-            "larsonsoft",
-            "lasse zacho malver",
-            "lasso games",
-            "last day of work",
-            "lastnoni",
-            "lateralis heavy industries",
-            "latif güngör",
-            "latte games jsc",
-            "laughing jackal ltd",
-            "lavamind",
-            "lazrool",
-            "lazy bear games",
-            "lazy monday games",
-            "lcc",
-            "leafy games",
-            "league of geeks",
-            "leakage games",
-            "legend entertainment",
-            "legend studio",
-            "leikir studio",
-            "lemondo games",
-            "lemonhaze studio",
-            "leo",
-            "leobot electronics",
-            "leon botha",
-            "leonwaan games",
-            "leonard menchiari",
-            "leonardo alexandrino",
-            "les kalifas",
-            "leslaw sliwko",
-            "lesta studio",
-            "let's go to the grindhouse",
-            "letmeowt games llc",
-            "lev gogol",
-            "lewis spalato",
-            "lexip games",
-            "li changchun",
-            "li yin",
-            "lilith",
-            "liao kai",
-            "liar-soft",
-            "libra heart",
-            "lieb",
-            "lienzo",
-            "life jumb dt",
-            "light",
-            "light era studio",
-            "light game",
-            "light studio",
-            "lighthouse games studio",
-            "lightning games",
-            "lightning man media",
-            "lightsoutgames",
-            "likegames",
-            "lil hentai games",
-            "lillymo games",
-            "lim games studio",
-            "limbic entertainment",
-            "limitcore.studio",
-            "limited run games",
-            "lindero edutainment",
-            "lingtan studio",
-            "linked squad",
-            "liquid",
-            "little black book entertainment",
-            "little chicken game company",
-            "little green men games",
-            "little orbit",
-            "little studio",
-            "little world studio",
-            "liujiajun",
-            "live motion games",
-            "live wire",
-            "live3d",
-            "living books",
-            "lizard hazard games",
-            "lizardfactory",
-            "lizardwish",
-            "llamasoft ltd.",
-            "localjamstudio",
-            "lock 'n load publishing",
-            "locked door puzzle",
-            "lockedon games",
-            "locomotivah",
-            "lodisgame",
-            "log games ltd",
-            "loglog games",
-            "logic artists",
-            "logisk studio inc.",
-            "lola fisher",
-            "lonelyocelot",
-            "loneminded",
-            "longbow games",
-            "lonhong team",
-            "lookforwardgames",
-            "looking glass studios",
-            "looksten inc.",
-            "loot inside",
-            "lorag games",
-            "lord of the stack",
-            "loren lemcke",
-            "lorenzo entertainment",
-            "lose",
-            "lost astronaut studios",
-            "lost frame development",
-            "lost the game studios",
-            "lostvolbytes",
-            "lotte|eod",
-            "love conquers all games",
-            "love seekers",
-            "love in space",
-            "lovely girls studio",
-            "lovely hellplace",
-            "lovixsama",
-            "lsgamedev",
-            "lugus studios",
-            "lun",
-            "lua ludica",
-            "lucaciu studio",
-            "lucas fernandez",
-            "lucas molina",
-            "lucas parise",
-            "lucid pixel",
-            "lucid sight, inc.",
-            "lucky duck games",
-            "lucky frame",
-            "lucky pikinini",
-            "luden.io",
-            "ludipe & friends",
-            "ludo land",
-            "ludomotion",
-            "luis pedro lopez perez",
-            "luiz felipe da silva marian",
-            "luiz otávio da silva",
-            "lukas litinskas",
-            "luke cripps",
-            "luke grayson",
-            "luke vincent",
-            "lukifah",
-            "luminatigames",
-            "lump of sugar",
-            "luna apps",
-            "lunabeat",
-            "lunasoft",
-            "lunagames",
-            "lunar chili",
-            "lunarhellgames",
-            "lunheim studios",
-            "lupiesoft",
-            "luris",
-            "lust desires 🖤",
-            "lust zone studio",
-            "lustful universe",
-            "lutegames",
-            "lycian studio",
-            "m&sg studio",
-            "m. hanka",
-            "m11 studio",
-            "m2 co.,ltd",
-            "m2h",
-            "m9 games",
-            "magic spell studios",
-            "magitec",
-            "magame",
-            "malgow",
-            "mammossix co., ltd.",
-            "mcgames",
-            "md studio",
-            "melovity",
-            "metagar",
-            "mewsturbo",
-            "mfc studio",
-            "mgp studios",
-            "migaloo games",
-            "migi studio",
-            "mirowin",
-            "mishra games",
-            "miyakopubl",
-            "mmeu",
-            "mmg company",
-            "mobsoft funstuff inc.",
-            "mom",
-            "monkeycraft co. ltd.",
-            "moonstone",
-            "moss co., ltd.",
-            "mps labs",
-            "ms games",
-            "mutan",
-            "mv jpl",
-            "my.games",
-            "mzq",
-            "ma ma software",
-            "machine 22",
-            "machine games",
-            "maciej targoni",
-            "mad data",
-            "mad jackal games",
-            "mad mag store",
-            "mad mimic",
-            "mad vulture games",
-            "madaboutgamesstudios",
-            "madbee",
-            "madgamesmith",
-            "madout games",
-            "madar games",
-            "madia entertainment",
-            "madison karrh",
-            "madmind studio",
-            "mado",
-            "madowl games",
-            "madruga works",
-            "madsug",
-            "maestro cinetik",
-            "mafia games",
-            "mage's hat",
-            "magenta factory",
-            "magic cat",
-            "magic cube",
-            "magic pockets",
-            "magicindie",
-            "magicaltimebean",
-            "magicvalley studio",
-            "magitech games",
-            "magnolia art",
-            "mahelyk",
-            "majao games",
-            "majorariatto",
-            "maker製造機",
-            "makhamdev",
-            "makivision games",
-            "male doll",
-            "male doll adventures",
-            "male doll stories",
-            "malfador machinations",
-            "malumgames",
-            "malzbie games",
-            "man-eater games",
-            "mana games",
-            "mana potion studios",
-            "mandinga",
-            "mandragora",
-            "manekoware",
-            "mango protocol",
-            "mango x2",
-            "manic hyena",
-            "manic mice",
-            "manodeix",
-            "manuel schenk games",
-            "maoucat studio / 魔王貓工作室",
-            "marastudio",
-            "marafigo games",
-            "marco amadei",
-            "marco braun",
-            "marco games",
-            "marco hirschfeld",
-            "marco marco",
-            "marco s hampel",
-            "marcos donnantuoni",
-            "marcos game dev",
-            "mardonpol inc.",
-            "mardozux studio",
-            "marginalact",
-            "mariaglorum",
-            "marina kittaka",
-            "marineverse",
-            "mario murkl",
-            "mario von rickenbach",
-            "maris ozols",
-            "marius popa",
-            "mark ainsworth",
-            "mark ffrench",
-            "mark schramm",
-            "markus korda",
-            "marmalade game studio ltd",
-            "mars on fire",
-            "martin buck software",
-            "marudice",
-            "marvelous games",
-            "masangsoft",
-            "masayuki ito",
-            "mash games",
-            "maskcatstudio",
-            "mass creation",
-            "massdigi",
-            "massive damage, inc.",
-            "massive galaxy studios",
-            "massive miniteam",
-            "massive monster",
-            "master bronze elite",
-            "master studios",
-            "mastery vr",
-            "matheus reis",
-            "matnogames",
-            "matryoshka",
-            "matt glanville",
-            "matt lloyd",
-            "matt roszak",
-            "matt scala",
-            "matt sowards",
-            "matt workman",
-            "matthew lalande",
-            "matthew lonsdale",
-            "matthew weston",
-            "matthieu gouby",
-            "mature games",
-            "maulidan games",
-            "mavi game studios",
-            "max",
-            "max loh",
-            "maximilian ritters",
-            "maximum entertainment",
-            "mayhem games usa",
-            "mazen games",
-            "mcleodgaming",
-            "mcpeppergames",
-            "mechabit",
-            "media art",
-            "mediatonic",
-            "meerkat gaming",
-            "mega dwarf inc.",
-            "megapixel studio s. a.",
-            "megalithic mainframe",
-            "megame llc",
-            "megapop",
-            "megu studio",
-            "mehsoft",
-            "melbourne house",
-            "melcher studios",
-            "mellowstudios",
-            "melos han-tani",
-            "mercurysteam",
-            "meridian'93",
-            "meridian93 studio",
-            "merla games",
-            "merriman games",
-            "messhof",
-            "metal fox",
-            "metalhead software inc.",
-            "mete deniz",
-            "meteorsakito",
-            "meteorwing",
-            "metthink",
-            "mew games",
-            "meyer games",
-            "mi'pu'mi games gmbh",
-            "mi-clos studio",
-            "micake",
-            "michael bell",
-            "michael callaghan",
-            "michael flynn",
-            "michael frei",
-            "michael hall",
-            "michael long",
-            "michael todd games",
-            "michaela laws",
-            "michal bárta",
-            "microprose",
-            "microprose software",
-            "microprose software, inc.",
-            "microblast games",
-            "microlith games",
-            "midhard games",
-            "midnight games",
-            "midori games / みどりげーむず",
-            "miga games",
-            "mighty games",
-            "mighty rabbit studios",
-            "mightycodedragon",
-            "mika pi",
-            "mikanbatake",
-            "mikethetech",
-            "mikhail maksimov",
-            "mikhail melnikov",
-            "mikki-boi",
-            "mikko seppälä",
-            "mikunirailwaygames",
-            "milan kazarka",
-            "milan matonok",
-            "milan raijmakers",
-            "milan toth",
-            "milk poison",
-            "milkbag games",
-            "milkfactory",
-            "milkstone studios",
-            "millwoo studio",
-            "milpitians",
-            "mimimi games",
-            "minmax games ltd.",
-            "mind flayer studios",
-            "mindfly studio",
-            "mindscape",
-            "mindware co.,ltd.",
-            "mingcang studio",
-            "mini fun games",
-            "minos games",
-            "minstrel studio",
-            "mipmap",
-            "mirage interactive",
-            "mire studios",
-            "miroko",
-            "misc games",
-            "misc.261",
-            "mischief & mayhem studios",
-            "mismatch studio",
-            "mission critical studios",
-            "misteryjay89",
-            "mito games",
-            "mitsuki game studio",
-            "mixed realms pte ltd",
-            "mixedbag srl",
-            "mixtor",
-            "mk-ii",
-            "moacube",
-            "mobilefusion apps ltd",
-            "mobirate",
-            "mocove studio",
-            "mode 7",
-            "modern dream",
-            "modus interactive",
-            "moegame",
-            "moenovel",
-            "mojotouch",
-            "molance games",
-            "molegato",
-            "mommy's best games",
-            "mon amiral",
-            "monavista dev",
-            "monkeys tales studio",
-            "monochrome, inc",
-            "monolith productions",
-            "monster couch",
-            "monster games, inc.",
-            "monster tooth studios",
-            "monsterattack",
-            "monstrum",
-            "montee games",
-            "moocow games",
-            "moobly",
-            "moolion",
-            "moon",
-            "moonana",
-            "moonbit",
-            "moondolino",
-            "moonlight productions",
-            "moonlit works",
-            "moonroof studios",
-            "moonshine games",
-            "moonskull games",
-            "moragami co., ltd",
-            "moral anxiety studio",
-            "mordesu studio",
-            "morfeodev",
-            "morgondag",
-            "morion studio",
-            "morningstar game studio",
-            "morningstar studios",
-            "morris åstrand",
-            "mossmouth",
-            "most wanted entertainment",
-            "motion game studio",
-            "mouldy toof studios",
-            "movavi",
-            "movavi software",
-            "movie games lunarium",
-            "mr chip software",
-            "mr ilyn.",
-            "mr. nutz studio",
-            "mr. pink",
-            "mr.h",
-            "msglobal",
-            "muha games",
-            "muyou",
-            "mugle studio",
-            "musa gungor",
-            "musclebird",
-            "muse games",
-            "mustella games",
-            "mutant entertainment studios",
-            "mutual fun studio",
-            "muzzy lane software",
-            "my digital garden",
-            "my next games",
-            "myacg studio",
-            "mydearest inc.",
-            "mydreamforever_old",
-            "mygrandfather games",
-            "myarcadegames studios",
-            "myke wills",
-            "mykel flynn",
-            "myroid-type comics",
-            "myshkin entertainment",
-            "mystael studio",
-            "mysterious",
-            "mysterytag",
-            "mythicowl",
-            "mythical city games",
-            "mzonestudio",
-            "mårten jonsson",
-            "mötiv",
-            "n j fox",
-            "n-fusion interactive",
-            "n-game studios",
-            "n-tri studio",
-            "n3v games",
-            "n4ba",
-            "nad games",
-            "naisu",
-            "nape games",
-            "nch software",
-            "neetnectar",
-            "neko works",
-            "neolavi",
-            "neowiz",
-            "nexon",
-            "nexon korea corporation",
-            "next studios",
-            "nfk games",
-            "nik studios",
-            "nl studio",
-            "nlb project",
-            "nlt media",
-            "nmy mixed-reality communication gmbh",
-            "norska",
-            "novect",
-            "no_buff",
-            "nsc creative",
-            "nsfwentertainment",
-            "ntstudios",
-            "nyx digital",
-            "nyx digital ltd",
-            "nadeo",
-            "naku kinoko",
-            "nami tentou",
-            "nanali studios",
-            "nano games",
-            "naoka games",
-            "naoka studio",
-            "napas torteeka",
-            "naps team",
-            "narfox llc",
-            "narko games",
-            "narrativearea",
-            "natasha delor",
-            "nate berens",
-            "nate sanders",
-            "nathan meunier",
-            "national film board of canada",
-            "natsume inc.",
-            "natsumeatari",
-            "naughty clogs",
-            "naughty narratives",
-            "nauris amatnieks",
-            "navel",
-            "nawia games",
-            "neat corporation",
-            "neckbolt",
-            "necrocatic games",
-            "neko game",
-            "nekonyan ltd.",
-            "nekoday",
-            "nementic games",
-            "nemesys games",
-            "neobird",
-            "neonight",
-            "neoclassic games",
-            "neojac entertainment inc.",
-            "neon",
-            "neon doctrine",
-            "neosphera",
-            "nepix",
-            "nerd monkeys",
-            "nerdook productions",
-            "nerdvision games",
-            "nerdybird studios",
-            "nerial",
-            "nero ag",
-            "net get games",
-            "netdinamica",
-            "netease games",
-            "nether lamp",
-            "netmin games",
-            "neuston ab",
-            "nevernorthgames",
-            "nevercenter",
-            "nevsram",
-            "new bridge games",
-            "new dawn game studio",
-            "new games waves",
-            "new reality games",
-            "new state",
-            "new world computing",
-            "new world interactive",
-            "newgen",
-            "neworderfantasysimulations",
-            "newwestgames",
-            "newbuild-c",
-            "next game",
-            "nextdoordev games",
-            "nexus media",
-            "nexvel entertainment",
-            "nezon production",
-            "ni mahao",
-            "nivision",
-            "nic schubert",
-            "nicalis, inc.",
-            "nicholas brakespear",
-            "nicholas rizzo",
-            "nick",
-            "nick serebryanik",
-            "nico thomas",
-            "nicolas bernard",
-            "niffler ltd.",
-            "nifty visuals",
-            "night school studio",
-            "night steed games",
-            "night stroll studio",
-            "nightshade",
-            "nikigames",
-            "nikita morti",
-            "niko belik",
-            "niko salocin",
-            "nikola bulj",
-            "nikolai usachev",
-            "nikolaj piet pagh",
-            "nimavoha interactive",
-            "nimble giant entertainment",
-            "nimbly games",
-            "nimos games",
-            "nincent",
-            "ninetail",
-            "ninja whale studios",
-            "ninth games co., ltd",
-            "nipobox",
-            "nipsapp gaming software pvt ltd",
-            "nitreal",
-            "nitro games",
-            "nitro+chiral",
-            "nitrome",
-            "nitroplus",
-            "nitx games",
-            "nival",
-            "nivnan",
-            "nixxes",
-            "nixxes software",
-            "no bull intentions",
-            "no future",
-            "no pest productions",
-            "no strike",
-            "no stuck game studio",
-            "no.25",
-            "nobreadstudio",
-            "noclip",
-            "noface工作室",
-            "noah lewin",
-            "noble empire corp.",
-            "noble master llc",
-            "noble muffins",
-            "nochi studios",
-            "nodbrim interactive",
-            "noham games",
-            "noio",
-            "nolo",
-            "nonadecimal creative",
-            "noobzilla",
-            "noodletub games",
-            "nooner bear studio llc",
-            "noraperikaproject",
-            "norb software development llc",
-            "normogames",
-            "north of earth",
-            "northern amusements",
-            "northway games",
-            "nosebleed interactive",
-            "nostalgames",
-            "nostalgia",
-            "nostradamon",
-            "not awful studio",
-            "not the best games",
-            "not-so classic games",
-            "notgames",
-            "notex",
-            "nothing rhymes with entertainment",
-            "notovia",
-            "noumenon games",
-            "nova-box",
-            "novasoft interactive ltd.",
-            "novaxproject",
-            "novalink",
-            "novelab",
-            "nowakgames",
-            "nowaki",
-            "nozhin games studio",
-            "nuci",
-            "nucko games",
-            "null reference games",
-            "nullreferenceexception",
-            "nuno donato",
-            "nupu neko dev",
-            "nuskadamo",
-            "nussygame",
-            "nuts pecker",
-            "nuts and volts electronics",
-            "nyakugames",
-            "nyanco channel",
-            "nymphs",
-            "nyxtales",
-            "o-two inc.",
-            "oa game studio",
-            "oc software solutions",
-            "odbear studios",
-            "off1c1al",
-            "okcity",
-            "okonnaya rama",
-            "oksoft",
-            "omagx studios",
-            "omegabyte",
-            "omnidream creations",
-            "oneone1",
-            "opt studio",
-            "osome studio",
-            "otto games",
-            "otusun land",
-            "overdrive",
-            "ozna studio",
-            "obi-wanya",
-            "object normal",
-            "oblom studio",
-            "obsessive science games",
-            "obumo games",
-            "ocean drive studio, inc.",
-            "octeto studios",
-            "octopus 8 studios",
-            "oddscure",
-            "odencat",
-            "odin game studio",
-            "odooh games",
-            "oedipe games",
-            "ofer rubinstein",
-            "officialandy",
-            "offworld",
-            "ogre pixel",
-            "oh, a rock! studios",
-            "ohsat games",
-            "old eagle",
-            "old school games",
-            "old skull games",
-            "oleg sereda",
-            "oleg skutte",
-            "oli taylor",
-            "omega games",
-            "on the level game studios",
-            "onskull games",
-            "one bit studio",
-            "one buck",
-            "one face studio",
-            "one man left studios",
-            "one more level",
-            "one up plus",
-            "one wheel studio",
-            "onecoin",
-            "oneshark",
-            "onetwoplay",
-            "oneiric worlds",
-            "oni gaming",
-            "onion games",
-            "onix games",
-            "only human studios",
-            "onteca ltd",
-            "onyx lute",
-            "opala project",
-            "open alpha",
-            "operahouse corporation",
-            "orange_juice",
-            "orangutanlemonk",
-            "orbi universo team",
-            "orbit studio",
-            "orca virtual",
-            "orfeas game studio",
-            "orgesta inc.",
-            "oriolus software gmbh",
-            "orion games",
-            "orionsoft",
-            "orneon",
-            "orube game studio",
-            "osarion",
-            "osaris games",
-            "oscar brittain",
-            "osmotic studios",
-            "other ocean interactive",
-            "otis miller",
-            "ouch giver games",
-            "ourlastspring",
-            "ouroboros_",
-            "out of the park developments",
-            "outofthebit ltd",
-            "outer brain studios",
-            "outerlynx",
-            "outis media",
-            "over the moon",
-            "overaction game studio",
-            "overflow",
-            "overlord empire llc",
-            "override",
-            "ovid works",
-            "owlcat games",
-            "owlchemy labs",
-            "owlskip enterprises",
-            "owned by gravity",
-            "oxdev",
-            "oxygenstudio",
-            "p.+",
-            "pajamas ex",
-            "palette",
-            "patrones & escondites",
-            "pearflower",
-            "pelmeni games",
-            "perennial hearts llc.",
-            "pgn inc",
-            "ph3 gmbh",
-            "phl collective",
-            "pictologi",
-            "pis games",
-            "pixel co., ltd",
-            "pixelssoftworks",
-            "pj.unreally",
-            "play mephistowaltz",
-            "preapp partners",
-            "prime works co.,ltd.",
-            "pro playa dev",
-            "produktivkeller studios",
-            "project ynp",
-            "ps games",
-            "pss",
-            "pumpkim",
-            "punkcake délicieux",
-            "pablo vidaurre sanz",
-            "pagie portal",
-            "paleno games",
-            "pan",
-            "panguojun",
-            "pancake games",
-            "pancakegames",
-            "pandacat 熊喵独立游戏",
-            "pandaroo interactive",
-            "pandemic studios",
-            "panic ensues software",
-            "panicbarn",
-            "pankabre",
-            "pantsu productions",
-            "pantyparrot",
-            "papaya studio",
-            "paphnutius",
-            "parables games",
-            "paradox white cat",
-            "parallel studio",
-            "parham",
-            "particle systems ltd.",
-            "party for introverts",
-            "pasha utt",
-            "passtech games",
-            "pasturesoft",
-            "patagoniart",
-            "patate douce studio",
-            "pathea games",
-            "patrick kelley, cit",
-            "patrick sweeney",
-            "paul bird",
-            "paul cuisset",
-            "pauloondra",
-            "pavel gorev",
-            "pavo entertainment",
-            "pawel zajac (artbarian games)",
-            "peach beach",
-            "peach rain",
-            "peanut button",
-            "pedro gilabert",
-            "pedro henrique baretta",
-            "peepod inc.",
-            "pendulo studios",
-            "people can fly",
-            "perchang",
-            "perfectly paranormal",
-            "performance artist games",
-            "perg valley",
-            "personaegame studio",
-            "perspektik",
-            "perverse games",
-            "petal sakura",
-            "peter hijma",
-            "peter labick",
-            "peter manfreda",
-            "petit fabrik",
-            "petoons studio",
-            "petr šimůnek",
-            "petricore, inc.",
-            "petroglyph",
-            "phanom games",
-            "phantom playworks",
-            "phantomcore studio",
-            "phantomheadache",
-            "phaser lock interactive",
-            "phatrobit",
-            "phil fortier",
-            "philip staiger - thebest3d.com",
-            "philips p.o.v. entertainment group",
-            "philosophy♂",
-            "phobetor",
-            "phodex games",
-            "phoenix online studios",
-            "phoesion",
-            "phosphor games",
-            "phung games",
-            "phylliida",
-            "piboso",
-            "pigravity",
-            "pihoentertainment",
-            "pickle drugs",
-            "pico games",
-            "picola inc.",
-            "picorinne soft",
-            "piece of cake studios",
-            "pieces interactive",
-            "pigeon-g",
-            "pigeondev",
-            "pikpok",
-            "piko interactive",
-            "piko interactive llc",
-            "pill bug interactive",
-            "pillow fight",
-            "pinblend studios",
-            "pine studio",
-            "pinebud games",
-            "pinel games",
-            "pinhead games",
-            "pink tea",
-            "pinkpeachstudio",
-            "pinky pads",
-            "pinokl games",
-            "piranha bytes",
-            "piranha games inc.",
-            "pirate dog games",
-            "pitigamedev",
-            "pixquake",
-            "pixel",
-            "pixel after pixel",
-            "pixel bones studio",
-            "pixel cattle games",
-            "pixel cattus",
-            "pixel drip games",
-            "pixel edge games",
-            "pixel federation",
-            "pixel fox",
-            "pixel games uk",
-            "pixel harmony studio",
-            "pixel licker llc",
-            "pixel lion studios",
-            "pixel vs pixel",
-            "pixelartgames",
-            "pixelfade",
-            "pixelgreeds",
-            "pixelmouse",
-            "pixelabor",
-            "pixelatto",
-            "pixellore inc",
-            "pixelsplit",
-            "pixelsplit simulations",
-            "pixelteriyaki",
-            "planescape game studio",
-            "planeta",
-            "platstudio",
-            "platine dispositif",
-            "platinum games",
-            "platinumgames",
-            "platinumgames inc.",
-            "platonic partnership",
-            "platuro",
-            "play publishing",
-            "play spirit limited",
-            "play and cum 💦",
-            "play2chill s.a.",
-            "playday co., ltd.",
-            "playside",
-            "playtoday",
-            "playtogether studio",
-            "playway s.a.",
-            "playcademy",
-            "playdek, inc.",
-            "playful corp.",
-            "playito.com",
-            "playsaurus",
-            "plazsoft",
-            "poccade llc",
-            "pocket rocket studio 🚀",
-            "pocketpair",
-            "pocketwatch games",
-            "poema games",
-            "point8 games inc.",
-            "poking water games",
-            "polantronic",
-            "polarityflow, adrian zingg",
-            "polincgames",
-            "pollapee",
-            "polovey alexander",
-            "poly poly games",
-            "polygon dust entertainment ltd.",
-            "polygon pictures inc.",
-            "polynetix studio",
-            "polyslash",
-            "polytale games",
-            "ponywolf",
-            "pookie",
-            "popcap games, inc.",
-            "popcannibal",
-            "popoko vm games",
-            "poppy works",
-            "post mortem pixels",
-            "potata company",
-            "potato games",
-            "potatoindustries",
-            "potatobrain games",
-            "power up to maximum",
-            "predict edumedia",
-            "predrag lazic",
-            "preonus games",
-            "president studio",
-            "prestige games",
-            "pretty fly games",
-            "prideful sloth",
-            "primarch interactive",
-            "prime bit games sa",
-            "prime games",
-            "primitive studio",
-            "primula",
-            "prince game studio",
-            "priory games",
-            "prisma games l.l.c.",
-            "professional villains",
-            "progenitorworks",
-            "project anthem",
-            "project whitecard studios inc.",
-            "projectkukuevo",
-            "projectmoon",
-            "project_lelz",
-            "propilgames",
-            "propulsion games",
-            "proton studio inc",
-            "protoria studios",
-            "proximity games",
-            "proxy studios",
-            "psychic software",
-            "psyop",
-            "psytec games ltd",
-            "pudding",
-            "pug fugly games",
-            "pugstorm",
-            "punch punk games",
-            "punx studios",
-            "puppet combo",
-            "puppetmaster3dx",
-            "puppygames",
-            "purple lamp",
-            "purple software",
-            "purple tree s r l",
-            "purrfect",
-            "puuba",
-            "puzzle game",
-            "puzzle lab",
-            "pyrebug studios",
-            "pyrodactyl",
-            "pyrozen",
-            "q-cumber factory",
-            "q-games ltd.",
-            "qcf design",
-            "qubyte interactive",
-            "quikgames",
-            "quikin games",
-            "qruppo",
-            "quadfix games",
-            "quantic dream",
-            "quantized bit",
-            "quantumfrog",
-            "quayterez brawley",
-            "qubicgames",
-            "queen developer",
-            "question",
-            "questtracers",
-            "quicksilver software",
-            "qute",
-            "r.h. industries",
-            "r2 games",
-            "re atelier",
-            "rekware",
-            "rembot games",
-            "remimory",
-            "retsuzan",
-            "revo team's",
-            "revvalution studio",
-            "rex pex games",
-            "rfl art",
-            "rgbyte software",
-            "rialab",
-            "riqplay",
-            "riverside sports",
-            "rlty chk",
-            "rmking",
-            "roseverte",
-            "roseverte mystery",
-            "rpg adventures team",
-            "rpg video",
-            "rpgames",
-            "rsoft games",
-            "ruok",
-            "r_games",
-            "rabah chikhi",
-            "rabbit studios",
-            "rabbiton",
-            "rabid troll studios llc",
-            "rabotiagi games",
-            "raciebug",
-            "raconteur games",
-            "racs studio",
-            "rad codex",
-            "radial games corp",
-            "radiangames",
-            "raf1dev",
-            "rafael farias",
-            "rafael garcía",
-            "ragdoll inc",
-            "rage software",
-            "rail slave games",
-            "rain games",
-            "rainforest games",
-            "rainbow studios",
-            "rainbowstudio",
-            "rainy night creations",
-            "rainysoft",
-            "raithen",
-            "rake in grass",
-            "rand.exe studios",
-            "randomspin",
-            "rank17",
-            "raptor claw games",
-            "rarefetishgamez",
-            "rarykos",
-            "rasul mono",
-            "ratalaika games s.l.",
-            "ratloop asia",
-            "ravinia",
-            "raw lion workshop",
-            "raytrace interactive",
-            "razdva games",
-            "razzart visual",
-            "reharmony games",
-            "react games",
-            "ready to play",
-            "real girl vr",
-            "reality inside ltd.",
-            "reality magiq",
-            "reality pump",
-            "reality pump studios",
-            "reality reflection",
-            "reality twist gmbh",
-            "realityrig",
-            "really interactive",
-            "realmforge studios",
-            "reb_orn",
-            "rebelião studio",
-            "reborn entertainment",
-            "rebound cg",
-            "recotechnology s.l.",
-            "red barrels",
-            "red dev studio s.a.",
-            "red dot games",
-            "red fables",
-            "red fox studios",
-            "red iron labs",
-            "red kraken studio",
-            "red limb studio",
-            "red meat games",
-            "red mount media",
-            "red nexus games inc.",
-            "red phoenix studios",
-            "red sasori",
-            "red six development",
-            "red skald",
-            "red thread games",
-            "red triangle games",
-            "red twice potato",
-            "redbrickstone games",
-            "reddeer.games",
-            "redkar devs",
-            "redpunch studios",
-            "redzone studios llc",
-            "redzyrro",
-            "redaster studio",
-            "redbeak games",
-            "redbrick studios ltd",
-            "reddoll srl",
-            "redefinearts.inc",
-            "reflect studios",
-            "reflections, a ubisoft studio",
-            "reija",
-            "reima project",
-            "reine works",
-            "reiza studios",
-            "rejected games",
-            "rejet",
-            "reky studios",
-            "remax42",
-            "remix games",
-            "remnants of mosaic",
-            "renpixel",
-            "render system",
-            "renderise",
-            "renka",
-            "reno games",
-            "repa games",
-            "repixel8",
-            "reply game studios",
-            "reptoid games",
-            "repulse",
-            "reset games ltd",
-            "resolution games",
-            "resonair",
-            "respect studios",
-            "retrific",
-            "retro army limited",
-            "retro gears",
-            "retrobug",
-            "retroactive fort",
-            "retrotainment games",
-            "retroware",
-            "return to adventure mountain, llc",
-            "reverie world studios",
-            "reverse impact",
-            "revino games",
-            "revolt games",
-            "revolution software ltd",
-            "revolutionary interactive",
-            "revulo games",
-            "reza mirzaei",
-            "re零同人社",
-            "rhinogearz",
-            "rhombico games",
-            "rhowsl",
-            "rhys510",
-            "ricardo alonso pina",
-            "ricardo pratas",
-            "richard bueno",
-            "richard campbell",
-            "richard haraším",
-            "richard hogg",
-            "richard letran",
-            "riddik",
-            "rideon,inc.",
-            "rideonjapan",
-            "right games",
-            "rikkigames limited",
-            "rionix",
-            "ripstone",
-            "rising sun interactive",
-            "rising win tech. co., ltd",
-            "ritual games",
-            "rivardus",
-            "rmonak",
-            "roastery games",
-            "robproductions",
-            "robert alvarez",
-            "roberto trasarti",
-            "robot",
-            "robot entertainment",
-            "robot gentleman",
-            "robot invader",
-            "robot legs games",
-            "robotality",
-            "robotizar games",
-            "rocrac",
-            "rock pocket games",
-            "rocket boy games",
-            "rocket monster games",
-            "rocket science games",
-            "rocketwerkz",
-            "rocketcat games",
-            "rocketeer games studio, llc",
-            "rockstar games",
-            "rodrigo banzato",
-            "rogerty",
-            "rogue duck interactive",
-            "rogue snail",
-            "rogueside",
-            "rokas",
-            "roley games",
-            "roll7",
-            "rolling cat studio",
-            "rolling crown",
-            "rolling glory jam",
-            "roman",
-            "roman shuvalov",
-            "romans i xvi gaming",
-            "rombo",
-            "rome renner",
-            "ronevansgamedev",
-            "ronimo games",
-            "rookbird games",
-            "room710games",
-            "roomsforrockets",
-            "roope tamminen",
-            "rootify",
-            "roppy chop studios",
-            "rosa special studio",
-            "roseportal games",
-            "roshan nowshad",
-            "rotech digital ltd",
-            "rovio sweden ab",
-            "roy",
-            "royalcandy",
-            "rsupport inc.",
-            "rubeki games",
-            "ruben alcañiz",
-            "rubicon development",
-            "rubilaxe",
-            "ruffian games",
-            "run and jump games",
-            "runserver",
-            "runestorm",
-            "runic games",
-            "runiccodes",
-            "running hoffman",
-            "running with scissors",
-            "rusalka unreal labs",
-            "rusimitu",
-            "rusimitu games",
-            "russell matney",
-            "rusty lake",
-            "rusty moyher",
-            "ryan bissonnette",
-            "ryan nein",
-            "ryan silberman",
-            "ryan wheeler",
-            "ryclaw games",
-            "ryseup studios",
-            "s.a. digiworks",
-            "s.c. 16 bit nights s.r.l.",
-            "s.y. games",
-            "saarse",
-            "safing",
-            "same qube",
-            "sandlot",
-            "sbn3",
-            "sct",
-            "sd",
-            "sdc ventures",
-            "se {} ks",
-            "secret character",
-            "sektor games",
-            "serialgames inc.",
-            "sfb games",
-            "sfs studios",
-            "sg entertech",
-            "shade inc.",
-            "shannon",
-            "shibo games",
-            "sieidi ltd",
-            "sienture",
-            "sigono inc.",
-            "siter skain",
-            "sixnails",
-            "sj games",
-            "sk soft",
-            "skipmore",
-            "sky hour works",
-            "slash",
-            "smg studio",
-            "smile",
-            "softstar technology(beijing)",
-            "softstar technology(beijing)co.ltd",
-            "softstar technology(shanghai)",
-            "soga std",
-            "solids studio",
-            "soulchan",
-            "sp digital arts inc.",
-            "sp games",
-            "sp-time",
-            "spiderworks",
-            "sprite!",
-            "sqrt games",
-            "srm games",
-            "srs games",
-            "ssp games",
-            "st hot dog king",
-            "storia",
-            "stp works",
-            "success corp.",
-            "sudt games",
-            "sunsoft",
-            "superhot team",
-            "superlumen",
-            "superita",
-            "surprised hotdog limited",
-            "synergy",
-            "szeiner",
-            "sad mask party",
-            "sad panda studios",
-            "saga planets",
-            "sagitta studios",
-            "saibot studios",
-            "sakari games",
-            "sakura river interactive",
-            "salamandra88",
-            "salangan games",
-            "salmi games",
-            "salsawi",
-            "salt & pixel llc",
-            "sam atlas",
-            "sam barlow",
-            "sam robinson",
-            "samer khatib (snowconesolid productions)",
-            "samet mumcu",
-            "sami kilani",
-            "samobee games",
-            "samuel leigh",
-            "samuka gomes",
-            "samurai punk",
-            "sand sailor studio",
-            "sand table software",
-            "sand traveler",
-            "sander bos",
-            "sandra moen",
-            "sandstorm studios inc.",
-            "sangwoon jin",
-            "santa ragione",
-            "sanuk games",
-            "sasderider",
-            "saturn vr",
-            "save giant girl",
-            "sawaiwagame",
-            "scary bee llc",
-            "scary creepy pasta",
-            "schmidt workshops",
-            "score studios llc",
-            "scorpiniti bruno",
-            "scott cawthon",
-            "scott ethington",
-            "scott h.f. dunbar",
-            "screambox studio",
-            "screaming bee",
-            "screaming villains",
-            "screwfly studios",
-            "scripting ventures",
-            "scuffed development",
-            "scumhead",
-            "scythe dev team",
-            "seacoxx",
-            "seal",
-            "sean marty",
-            "sean young",
-            "seaven studio",
-            "sebastian kemper",
-            "sebastian lind",
-            "second avenue learning",
-            "second reality",
-            "secret base",
-            "secret cow level",
-            "secret exit ltd.",
-            "secret garden",
-            "secret labo",
-            "seemingly pointless",
-            "segasoft",
-            "seikagames",
-            "seiren-publishing",
-            "seize studios",
-            "sekai project",
-            "sektan",
-            "sekushi usagi games",
-            "selugames",
-            "semi sağlam",
-            "sensen games",
-            "sensualharvest",
-            "seraphim creations",
-            "serendipity films",
-            "sergey bobrov",
-            "sergiopoverony",
-            "serhii khramov",
-            "serio studio",
-            "serious games interactive",
-            "serious tangents",
-            "serkan bakar",
-            "seventyfour productions",
-            "sexy dev!",
-            "sexy hentai games factory",
-            "shadow factory",
-            "shadowink designs",
-            "shadowwolf games",
-            "shady corner games",
-            "shanegame",
-            "shanghai thinkingbear network technology co.,ltd",
-            "shanghai huan zhen info tech ltd",
-            "shangkostudio",
-            "sharf co.",
-            "sharkgame",
-            "sharktales.",
-            "shashitha kularatna",
-            "shattered journal games",
-            "shatterproof",
-            "shawn hitchcock",
-            "shawn kilian",
-            "shawn perolis",
-            "sheer studios",
-            "shellpeach",
-            "shentzu",
-            "shenandoah studio",
-            "shenzhen simeng technology co., ltd.",
-            "shiba neko",
-            "shiftall inc.",
-            "shiinayashiro",
-            "shimobashira workshop",
-            "shin tomura",
-            "shindenken",
-            "shine research",
-            "shineproject",
-            "shiny entertainment",
-            "shiny shoe",
-            "shiro games",
-            "shirokurosoft",
-            "shironopanda",
-            "shiv",
-            "shiver games",
-            "shmoops games",
-            "shmurdik",
-            "shoho games",
-            "shorebound studios",
-            "short circuit studios",
-            "shortstackstudio",
-            "shotgun with glitters",
-            "shotx",
-            "sibear games",
-            "siactro",
-            "sicarius",
-            "siddharth sivaraman",
-            "side group",
-            "sidekick",
-            "sierra",
-            "sierra entertainment",
-            "sierra lee",
-            "sierra on-line",
-            "sigma team inc.",
-            "signal studios",
-            "silengames",
-            "silent dreams",
-            "silentfuture",
-            "silhouette valley games",
-            "silistre game",
-            "silkworm",
-            "siluman soft",
-            "silver cloud games",
-            "silver dollar games",
-            "silver eye studios",
-            "silver lemur games",
-            "silver machine studios",
-            "silverblade",
-            "silverstring media inc.",
-            "silverware games, inc.",
-            "simbin studios ab",
-            "simtex",
-            "simcoach games",
-            "simogo",
-            "simon eftestol",
-            "simon fredholm",
-            "simon labelle",
-            "simon says: play!",
-            "simoncreative",
-            "simple touch",
-            "simpledes",
-            "simplexgamestudio",
-            "simplicity games",
-            "sinclair strange",
-            "sinister design",
-            "sinkhole studio",
-            "sinn studio inc.",
-            "sinomod studios",
-            "sir-tech",
-            "sirgoose",
-            "sirlin games",
-            "sisin games",
-            "siso",
-            "sixteen tons entertainment",
-            "size five games",
-            "ska studios",
-            "skeleton crew studio",
-            "skermunkel",
-            "skill prepare",
-            "skobbejak games",
-            "skull box games",
-            "skunkape games",
-            "sky high games",
-            "skybox labs",
-            "skybrave",
-            "skygoblin",
-            "skyriver studios",
-            "skyvu",
-            "skydome studios",
-            "skylor beck",
-            "skyward digital",
-            "slavomír jurkovský",
-            "slay buherman",
-            "sleepy duck",
-            "slightly mad studios",
-            "slimesmile",
-            "slimomo",
-            "slipgate ironworks™",
-            "slippery snake studios",
-            "sloppy joe studios",
-            "slovgoblin",
-            "sluggerfly",
-            "smallbigsquare",
-            "smallriverstudio",
-            "smallsqurriel",
-            "smart tale games",
-            "smartgames",
-            "smartolivegames ltd",
-            "smartmove",
-            "smash game studios",
-            "smee",
-            "smiteworks usa, llc",
-            "smobile",
-            "smokey moose games",
-            "smoochgm",
-            "smudged cat games ltd",
-            "snail games usa",
-            "snail-ninja studio",
-            "snap finger click",
-            "snippy nguyen",
-            "snoutup",
-            "snowcable",
-            "snowflame",
-            "snowbird games",
-            "snowdon games",
-            "snowdrop lab",
-            "snowhaven studios",
-            "snuggle bug",
-            "soasasprogames",
-            "sobaka studio",
-            "soccer manager ltd",
-            "softwarware",
-            "softdisk",
-            "softened cookie",
-            "softmind ltd",
-            "softwaves mini",
-            "soiree games",
-            "solar eclipse games",
-            "soldak entertainment",
-            "solecismic software",
-            "soleil ltd.",
-            "solitarystudios",
-            "solluco",
-            "solohack3r studios",
-            "solsgames",
-            "solverto",
-            "somsmolgeims",
-            "soma games",
-            "somasim",
-            "somepx",
-            "sometimes you",
-            "somewhat software",
-            "somi",
-            "somnambulist games",
-            "somnova studios",
-            "soner çakır",
-            "song jun",
-            "sonic powered co.,ltd.",
-            "sonic team",
-            "sonya fung",
-            "soomkagames",
-            "sophie houlden",
-            "sorairo, inc.",
-            "sos sosowski",
-            "soteroapps",
-            "soulwarmers games",
-            "sounding stone / 老奉毊",
-            "source byte sp. z o.o.",
-            "sourcenity",
-            "southern vermilion bird",
-            "soyhan yazgan",
-            "space alpha",
-            "space boat studios",
-            "space fractal",
-            "space monkey international",
-            "space samurai studio",
-            "space wedgie, llc",
-            "spacefarer games limited",
-            "spacefarer games ltd",
-            "spacezero interactive",
-            "spearhead games",
-            "special bit",
-            "specialbit studio",
-            "spectral illusions",
-            "spellbook",
-            "spellbound",
-            "sphere, inc.",
-            "spicy",
-            "spicy tails",
-            "spider",
-            "spiders",
-            "spielmannspiel",
-            "spilt milk studios ltd",
-            "spire interactive",
-            "splash damage",
-            "splendortek",
-            "split light studio",
-            "sporobole",
-            "sports mogul, inc.",
-            "sprakelsoft gmbh",
-            "spring games",
-            "springloaded",
-            "sprite hills",
-            "spritewrench",
-            "sproing",
-            "sprovieri games",
-            "spry fox llc",
-            "spyridon thalassinos",
-            "spytihněv",
-            "square gem software",
-            "square wheel",
-            "squiddershins",
-            "srio vr studio",
-            "stacy story games",
-            "stage clear studios",
-            "stainless games ltd",
-            "stalkeralex",
-            "stand off software",
-            "stanislaw truchowski",
-            "staplesvr",
-            "stapleton",
-            "star drifters",
-            "star vault ab",
-            "starbreeze studios",
-            "starlight games",
-            "starlighttree games",
-            "starmage",
-            "starmyth",
-            "starni games",
-            "starodymov",
-            "starpixel studios",
-            "start vr",
-            "start warp",
-            "startreming games",
-            "starvingfox studio",
-            "starwind games",
-            "stas shostak",
-            "state of play",
-            "stately snail",
-            "static city games",
-            "station437",
-            "steedie",
-            "steel mantis",
-            "steel wool studios",
-            "steelkrill studio",
-            "stefan preuss",
-            "stegersaurus software inc.",
-            "stellarxiela",
-            "stepford",
-            "stephane valverde",
-            "stephen joseph",
-            "steppe hare studio",
-            "stereo7 games",
-            "steve gal",
-            "steve reynolds",
-            "steveclay",
-            "steven dileo",
-            "still running",
-            "sting",
-            "stoic",
-            "stolen couch games",
-            "stonehill games",
-            "stonepunk studios",
-            "stopshut",
-            "storm trident s.a.",
-            "storm in a teacup",
-            "stormcube games",
-            "stormind games",
-            "storming tech",
-            "stormling studios",
-            "stormregion",
-            "storyan team",
-            "storybird",
-            "storybird studio",
-            "storycentric worlds",
-            "storytaco",
-            "straight back games",
-            "stranga",
-            "stranga games",
-            "strange fire",
-            "strata mixed reality, inc.",
-            "strategic designs ltd.",
-            "strategy 3 tactics",
-            "strategy first",
-            "strategy labs",
-            "stratera games",
-            "strawberry game studios, llc",
-            "stray fawn studio",
-            "street art studios",
-            "strelitziagames",
-            "strelka games",
-            "strength in numbers studios, inc",
-            "stress level zero",
-            "streum on studio",
-            "stroboskop",
-            "strong cube",
-            "struct9",
-            "studio amateur",
-            "studio asgard gaming",
-            "studio bean",
-            "studio bidon games",
-            "studio clangore",
-            "studio evil",
-            "studio fizbin",
-            "studio gamaii",
-            "studio gauntlet",
-            "studio ginkgo",
-            "studio hk",
-            "studio lef",
-            "studio namaapa",
-            "studio nanafushi",
-            "studio night",
-            "studio oleomingus",
-            "studio pixel",
-            "studio thug life",
-            "studio wildcard",
-            "studio spektar",
-            "studio élan",
-            "studio48",
-            "studiogiw",
-            "studiovr",
-            "studios",
-            "stuffed wombat",
-            "stunlock studios",
-            "subdream studios",
-            "subsoap",
-            "succubella games",
-            "sugarcane games",
-            "sugoi yellow",
-            "suits & sandals",
-            "sukerasomero",
-            "sun labyrinth llc",
-            "sunray games",
-            "sundae month",
-            "sunday akor",
-            "sunday's games",
-            "sunflower games",
-            "sungame studio",
-            "sunlight games",
-            "sunny blaze",
-            "sunny demeanor games",
-            "sunrealm studios",
-            "sunrise9",
-            "sunshineovercast",
-            "supkai",
-            "super games studio",
-            "super walrus games",
-            "super16bits",
-            "superwriter games llc",
-            "supergiant games",
-            "supergonk",
-            "supermassive games",
-            "supernova games",
-            "superstring",
-            "superstruct",
-            "supra games",
-            "supreme gauntlet games",
-            "surreal games",
-            "survios",
-            "sushi_soft",
-            "suspicious developments",
-            "suspiciousmosquito",
-            "suzuki cecil",
-            "svarog studios",
-            "swamp scarecrow games",
-            "sweepy games",
-            "sweet banana games",
-            "sweet dreams studio",
-            "sweetgamez",
-            "swell games llc",
-            "swimming rock",
-            "swing swing submarine",
-            "sylph",
-            "sylvain seccia",
-            "sympl games",
-            "synetic gmbh",
-            "synnergy circle games",
-            "synodic arc",
-            "syntaxity",
-            "synthetic domain",
-            "sysreb games",
-            "system 3",
-            "systemsoft beta, inc.",
-            "szatkowsky",
-            "szekretar",
-            "sørb",
-            "t allen studios",
-            "t-bull",
-            "t.e.r. yarally",
-            "t.f.a.n.c.s.",
-            "t3entertainment",
-            "taito corp.",
-            "tas systems",
-            "tas systems corp",
-            "tb games",
-            "tbd",
-            "tbf",
-            "team black hat robot",
-            "tecopark",
-            "terarin games",
-            "ternox",
-            "tgm",
-            "the brotherhood",
-            "theey store pte. ltd.",
-            "thm studios",
-            "tikipod",
-            "tlr games",
-            "tm xr lab",
-            "tnt studio",
-            "tokyo cool japan",
-            "tokyotoon",
-            "tom create co.,ltd.",
-            "tomagamestudio",
-            "tose co., ltd.",
-            "toybox inc.",
-            "trebuchet",
-            "triangle service",
-            "ttlcic",
-            "tteokleaf",
-            "twen",
-            "type-moon",
-            "t_t games",
-            "tabby cat",
-            "taboo tales 💘",
-            "tacty studio",
-            "tag 44/24",
-            "taiga",
-            "tails games",
-            "tailsup4tyranno",
-            "tainted games",
-            "tainted pact",
-            "take it studio!",
-            "take toad",
-            "takethem.games",
-            "takethem.games (creative)",
-            "takeover studios",
-            "tale of tales",
-            "talehammer",
-            "taleworlds entertainment",
-            "talentless person games",
-            "talentplace",
-            "talha kaya",
-            "talia bob mair",
-            "tall james games",
-            "tamtamgames",
-            "tamalaki",
-            "tamationgames",
-            "tameem hamoui",
-            "tankcatgames",
-            "tantalus media",
-            "tarba paul cornel",
-            "targon studios",
-            "tasharen entertainment inc.",
-            "tate multimedia",
-            "tavern tale studio",
-            "tayfun tuna",
-            "tazdraperm",
-            "tbjbu2",
-            "tea monster games",
-            "team 6 studios",
-            "team emily",
-            "team grybanser fox",
-            "team halfbeard",
-            "team jolly roger",
-            "team junkfish",
-            "team ladybug",
-            "team monumental",
-            "team reptile",
-            "team ryzal",
-            "team sneed",
-            "team tailnut",
-            "team-k",
-            "team17",
-            "team2bit",
-            "team6 game studios",
-            "teamsnowball",
-            "teatime research ltd.",
-            "technologies&simulators",
-            "technomancy studios",
-            "tehawar",
-            "teleport games",
-            "teleport games bt",
-            "telltale",
-            "temple gates games",
-            "tender claws",
-            "tenkaigames",
-            "tensionsplice",
-            "tenth&hess games",
-            "tequila works",
-            "terapoly",
-            "terfilis",
-            "termeno, s.r.o.",
-            "terminal reality",
-            "terri vellmann",
-            "terrible posture games",
-            "terror dog studio",
-            "terry cavanagh",
-            "tessera studios",
-            "teyon",
-            "that guy's games",
-            "thatcher productions",
-            "the 25th studio",
-            "the 3do company",
-            "the bearded ladies",
-            "the behemoth",
-            "the binary mill",
-            "the chinese room",
-            "the domaginarium",
-            "the farm 51",
-            "the fox knocks",
-            "the game bakers",
-            "the game forger",
-            "the game kitchen",
-            "the gentlebros",
-            "the hideout",
-            "the knights of unity",
-            "the light sword team",
-            "the lordz games studio",
-            "the men who wear many hats",
-            "the mill",
-            "the n main shop",
-            "the periodic group",
-            "the poundry",
-            "the quantum astrophysicists guild",
-            "the secret games company",
-            "the secret pie",
-            "the stonebot studio",
-            "the strategy game studio",
-            "the tambourine",
-            "the voices games",
-            "the zoo",
-            "the-mark entertainment",
-            "theboys",
-            "thedollargamestore",
-            "thedreik",
-            "theelventale games",
-            "thegamecreators",
-            "thelaba",
-            "themastergames",
-            "thepensword",
-            "theshelfman",
-            "thedox games",
-            "theodor niklas",
-            "thetis games",
-            "thiago adamo",
-            "thiago cesário machado",
-            "thing trunk",
-            "think ten media group",
-            "thinkofgames",
-            "thirdverse, co., ltd.",
-            "thomas bowker",
-            "thomas k. young",
-            "thor gaming",
-            "thorne games",
-            "thoth vr health",
-            "thought generation society",
-            "thousand games",
-            "threaks",
-            "three fields entertainment",
-            "three river games (3rg)",
-            "threeyes",
-            "thrift thrift",
-            "thronelab",
-            "thunder lotus games",
-            "thunderbox entertainment",
-            "thylacine studios",
-            "tiburon",
-            "tic toc games",
-            "ticktock games",
-            "tidvis games",
-            "tiernan brazil",
-            "tim beaudet",
-            "tim kashani",
-            "tim mcarthur",
-            "tim venekamp",
-            "timberwolf studios",
-            "time galleon",
-            "timegate studios",
-            "tindalos interactive",
-            "tiny shiny things",
-            "tiny trinket games",
-            "tiny warrior games",
-            "tinycorp",
-            "titan deep space company",
-            "titanite games s.a.",
-            "titanite novels",
-            "titanzzz",
-            "titus interactive",
-            "toadman interactive",
-            "toast interactive",
-            "toastielabs",
-            "tobias springer",
-            "tobin asher",
-            "toblue",
-            "tobop productions",
-            "toddfeimangames",
-            "todist",
-            "toffer team",
-            "toge productions",
-            "tokyo rpg factory",
-            "tom van den boogaart",
-            "tom's feral cat games",
-            "tomas daugela",
-            "tomato fantasy games",
-            "tommy gun walrus",
-            "tommy yoder",
-            "tomorrow corporation",
-            "tomás esconjaureguy",
-            "tony mckormack",
-            "tony wang",
-            "tonye amienyo",
-            "tooizzi games",
-            "top evidence studio",
-            "tophouse studio",
-            "topware interactive",
-            "torch60",
-            "tormentor games",
-            "torn banner studios",
-            "tornado games",
-            "torple dook",
-            "tort",
-            "tortuga team",
-            "torus games",
-            "toster12d3",
-            "total mayhem games",
-            "totally games",
-            "tower up studios",
-            "toxic dog",
-            "toxic games",
-            "toxic studio",
-            "toylogic inc.",
-            "toyman",
-            "toyman interactive",
-            "tozai games, inc.",
-            "trainwreck studios",
-            "transhuman design",
-            "travian games gmbh",
-            "trederia",
-            "tree men games",
-            "treefall studios l.l.c.",
-            "treefortress games",
-            "trend redaktions- und verlagsgesellschaft mbh",
-            "trese brothers",
-            "trevor jones",
-            "triangle studios",
-            "triband",
-            "tribus games indie",
-            "tribute games inc.",
-            "trickster arts",
-            "trident game studio",
-            "trilobyte games",
-            "trinity project",
-            "trinity team",
-            "triority",
-            "triority interactive novels",
-            "triplebricksgames",
-            "tripwire interactive",
-            "triskell interactive",
-            "triumph studios",
-            "triverske",
-            "troglobytes games",
-            "trophy games",
-            "truant pixel, llc",
-            "true seria",
-            "truegames",
-            "tsukuyomi",
-            "tsunehiko shimazu",
-            "tudou games",
-            "tuga studios",
-            "tuning mania",
-            "tunnel vision studio",
-            "turbo button",
-            "turnopia",
-            "turquoise revival games",
-            "turtle cream",
-            "turtle game",
-            "twelve tiles",
-            "twilight sonata studio",
-            "twin sails interactive",
-            "twins halo",
-            "twisted universe",
-            "twistedscarlett60",
-            "twistplay",
-            "two clusters",
-            "two point studios",
-            "two star games",
-            "two thousand and one entertainment studios",
-            "two tribes",
-            "two and a half studios",
-            "tybug studios",
-            "tydecon games",
-            "tyler hudson",
-            "tyler l",
-            "tymedust games",
-            "tyre bytes llc",
-            "u+me plus",
-            "u24 solutions",
-            "ua games",
-            "ug virtual reality technology co.,ltd.",
-            "ukz arts",
-            "ul",
-            "ullucus heaven inc.",
-            "umai neko",
-            "up development ltd.",
-            "uplay online",
-            "urse games",
-            "urus games",
-            "uwu",
-            "ubisoft annecy",
-            "ubisoft blue byte",
-            "ubisoft bucharest",
-            "ubisoft kiev",
-            "ubisoft mainz",
-            "ubisoft montpellier",
-            "ubisoft shanghai",
-            "ugly zebra interactive",
-            "uintani",
-            "ulon",
-            "ultaan games",
-            "ultimacj productions",
-            "ultimatedesktop",
-            "ultimo games",
-            "ultra software",
-            "ultraleap",
-            "ume softworks",
-            "umigame studios",
-            "umix studios",
-            "unbound creations",
-            "unboxed games llc",
-            "uncle frost team",
-            "uncorporeal systems",
-            "underdoor",
-            "underlight",
-            "underbite games",
-            "undercoders",
-            "undying joy",
-            "unexpected",
-            "unfinished pixel",
-            "unhexigon",
-            "unholy creation",
-            "unicorn den",
-            "unikgame",
-            "unknown worlds entertainment",
-            "unrea",
-            "unseelie count",
-            "unseen interactive",
-            "untold games",
-            "unusualsoft",
-            "unwonted studios",
-            "up multimedia",
-            "uppercut games pty ltd",
-            "urban isotope",
-            "uri games",
-            "uruca game studio",
-            "useless machines",
-            "utsukushii games",
-            "uğur çeli̇k",
-            "v. chuvilin",
-            "vartstylegames",
-            "vd games",
-            "vdo games",
-            "vdvo co",
-            "vgstudio",
-            "vi games llc",
-            "victoria games",
-            "virtual magic",
-            "virtual reality laboratory dv",
-            "vison studios",
-            "visual arts/key",
-            "vn house",
-            "vobl games",
-            "voodoo",
-            "vr designs",
-            "vr factory",
-            "vr game studios",
-            "vr studio",
-            "vr-exodus",
-            "vra-games",
-            "vrani inc.",
-            "vrkiwi",
-            "vrmonkey",
-            "vroom",
-            "vrunicorns",
-            "vrx",
-            "vrdevelopment",
-            "vrillar",
-            "vrotein",
-            "vs entertaiment",
-            "vs revolution",
-            "vtree llc",
-            "vacantknight5",
-            "vadd games",
-            "vagabond dog",
-            "valentware games ltd",
-            "valera entertainment",
-            "valorware",
-            "vanguard games",
-            "varagtp",
-            "variable state",
-            "vast studios",
-            "vector game",
-            "vector hat",
-            "vector unit",
-            "velsin",
-            "velvet paradise games",
-            "vendel games",
-            "verde",
-            "vergiu",
-            "verterial flur",
-            "vertex pop",
-            "vertical reach",
-            "vertigo gaming inc.",
-            "verto studio llc",
-            "very very little studio",
-            "vinovella games",
-            "viva games",
-            "viacom next",
-            "vice age",
-            "vicente rosell roig",
-            "victor game studio",
-            "victor solodilov",
-            "victoryxr",
-            "videojuegos fermín",
-            "vidygames",
-            "viewapp",
-            "vifth floor",
-            "vigil games",
-            "vikintor",
-            "vile monarch",
-            "vimes entertainment",
-            "vincae entretenimento",
-            "vincent foster",
-            "vincent lade",
-            "viridino studios",
-            "viriver network technology co., ltd.",
-            "virtexuniverse",
-            "virtual arts studio",
-            "virtual basement llc",
-            "virtual sky interactive",
-            "visual engineering",
-            "visual light",
-            "visualarts/key",
-            "visualnoveler",
-            "vitruviusvr",
-            "vittorio giorgi (sbargisoft)",
-            "vivid games",
-            "vixa games",
-            "vlad dunaev",
-            "vladproduction",
-            "vladimir maslov",
-            "vladimir slav",
-            "vladislav castillo gonzalez",
-            "vlambeer",
-            "vovora games",
-            "voge_games",
-            "volfson studios",
-            "volha",
-            "volition",
-            "vona soft",
-            "voofoo studios",
-            "vortex00",
-            "vovoid media technologies ab",
-            "vox mare",
-            "voxel bytes",
-            "vrai",
-            "vuvuu",
-            "vyacheslav ozolnieks",
-            "vyacheslav shilikhin",
-            "w",
-            "w0nnafight",
-            "wanzungdev",
-            "wasd games",
-            "watu",
-            "wgi gaming",
-            "winged sakura games",
-            "wisecat",
-            "wjle",
-            "wjlegame",
-            "wombex games",
-            "wong kwan chi",
-            "wowwow",
-            "wrf studios",
-            "wrg",
-            "wss playground",
-            "wtfomgames",
-            "wzogi",
-            "wa tran",
-            "wadjet eye games",
-            "waffle",
-            "waidy andrade",
-            "waifu games",
-            "walaber entertainment llc",
-            "wallace lovecraft",
-            "walnut llc",
-            "wampee",
-            "wanadevstudio",
-            "wanderful interactive storybooks",
-            "wanech",
-            "waqudoo",
-            "warducks",
-            "warmachine",
-            "waraní studios",
-            "warfaresims",
-            "wargaming group limited",
-            "warlock arts",
-            "warriorsstudio",
-            "warshark games",
-            "watercress",
-            "wathitdew record",
-            "wave light games inc.",
-            "wayward preacher",
-            "wevery",
-            "weappy studio",
-            "weathered sweater",
-            "webcore games",
-            "wei",
-            "weird and wry",
-            "wellore",
-            "wenkly studio sp. z o.o.",
-            "west forest games",
-            "westerngamer",
-            "westernleaves",
-            "weston bell-geddes",
-            "westwood studios",
-            "wet noob",
-            "whalebox",
-            "whalebox studio",
-            "what pumpkin games, inc.",
-            "where 游戏",
-            "whim independent studios",
-            "whimsical universes",
-            "whiskeybarrel studios",
-            "white blanket games",
-            "white dog games",
-            "white giant rpg studios",
-            "white owls inc.",
-            "white paper games",
-            "white rabbit games",
-            "white vortex games",
-            "whitecute",
-            "whitepeach",
-            "whiteleaf studio",
-            "who we are games",
-            "wicky yu",
-            "wijat",
-            "wild fang films",
-            "wild kid games",
-            "wild monkey",
-            "wild monkeygames",
-            "wild river games gmbh",
-            "wildsphere",
-            "wildtangent",
-            "wildlak",
-            "wilkin games",
-            "will sykes games",
-            "windthunder studio",
-            "windforce",
-            "windward_birds",
-            "windybeard",
-            "wingjoy games",
-            "winterspring games",
-            "wired dreams studio",
-            "wise box studios",
-            "wise wizard games, llc",
-            "wishes ultd.",
-            "witchgames",
-            "wither studios",
-            "witte studio",
-            "witz games",
-            "wix games",
-            "wizbyte games",
-            "wizard games",
-            "wizard games inc",
-            "wizard++",
-            "wnmstudio",
-            "wobbly tooth",
-            "woblyware",
-            "wojciech krupinski",
-            "wojtek",
-            "woksonstudios",
-            "wolf & wood interactive ltd",
-            "wolverinesoft studio",
-            "wonderland",
-            "wonderland kazakiri inc.",
-            "wonderthing",
-            "wooden monkeys",
-            "woodenwolf",
-            "woodland games",
-            "woodsy studio",
-            "world map tycoon",
-            "wormwood studios",
-            "worthing & moncrieff",
-            "wreck tangle games",
-            "wu zhang",
-            "wubsgames",
-            "x-legend entertainment co., ltd.",
-            "x-miguplay, llc",
-            "xcentric",
-            "xd",
-            "xd games studio",
-            "xdesktopsoft",
-            "xgen studios",
-            "xiaowuwei",
-            "xocus",
-            "xreal games",
-            "xxiv",
-            "xaloc studios",
-            "xatrix entertainment",
-            "xaviant",
-            "xcogames llc",
-            "xefier games inc.",
-            "xeip games",
-            "xelphyre games",
-            "xeneder",
-            "xennial digital",
-            "xenoaisam",
-            "xigma games",
-            "xitilon",
-            "xoullion",
-            "xyak-xyak",
-            "y-square games g.k.",
-            "y.kageyama",
-            "yamayuri games",
-            "yaoyichen",
-            "ycjy games",
-            "ydkr",
-            "years",
-            "yetu game",
-            "yfc games",
-            "yuke's",
-            "yuzusoft",
-            "yacht club games",
-            "yahaha studios",
-            "yakiniku banzai",
-            "yamauchi_games",
-            "yamoto",
-            "yanako rpgs",
-            "yang sun",
-            "yangyang mobile",
-            "yann geffrotin",
-            "yaremchuk",
-            "yarncat games",
-            "yasha",
-            "yeshu  wu",
-            "yeehaw games",
-            "yellow dot",
-            "yellowafterlife",
-            "yellowduckworks",
-            "yiming",
-            "yobob",
-            "yobowargames",
-            "yoiko books",
-            "yoji ojima",
-            "yokcos",
-            "yolopia ltd",
-            "yonder",
-            "youkuni",
-            "young horses",
-            "young horses: free range",
-            "youshen interactive",
-            "yuiami games",
-            "yukiostudio",
-            "yukinoshin",
-            "yume creations",
-            "yume game studio",
-            "yummy yummy studio",
-            "yunus ayyildiz",
-            "yuri bechthold",
-            "yuri eletskikh",
-            "yurii nikshych",
-            "yustas game studio",
-            "yuzugames",
-            "z-software",
-            "z-software gmbh",
-            "zeleniuk",
-            "zgamestudio",
-            "zoo digital publishing",
-            "zoom platform media",
-            "zov game studio",
-            "zzyzx rd game studios",
-            "zach augustine",
-            "zach tsiakalis-brown",
-            "zai studio",
-            "zakroutil",
-            "zanardi and liza",
-            "zaratustragamedev",
-            "zarfhome software",
-            "zarioside",
-            "zatun",
-            "zenfa productions",
-            "zeboyd digital entertainment llc",
-            "zee vital",
-            "zeekerss",
-            "zelltin",
-            "zemunbre",
-            "zenimax online studios",
-            "zeno rogue",
-            "zenz vr",
-            "zero",
-            "zero sum games",
-            "zerobit games",
-            "zerobyter games",
-            "zeros",
-            "zerouno games",
-            "zertuk",
-            "zeta bit",
-            "zgame studio",
-            "zhang huiqin",
-            "zhongce games",
-            "ziggy makes games",
-            "zillion whales",
-            "zima software",
-            "zoe vartanian",
-            "zoink games",
-            "zolden games",
-            "zombie studios",
-            "zoom games",
-            "zooptek",
-            "zoë mode",
-            "zugalu entertainment",
-            "zygobot",
-            "zylyx",
-            "zyngms",
-            "[2.21]",
-            "[onemanband]",
-            "_badger",
-            "a1esska",
-            "adecon production",
-            "aburasobabiyori",
-            "ado",
-            "aim up games - peter thomä",
-            "alienmelon",
-            "althi inc.",
-            "andiegoesindie",
-            "anthund",
-            "attic entertainment software gmbh",
-            "axilirate",
-            "azucat",
-            "bhaptics inc.",
-            "bair games",
-            "baron sengia",
-            "ben lunato",
-            "bison",
-            "blain",
-            "blooming spectrum",
-            "bluesky",
-            "boxedworks",
-            "brusnik.com",
-            "btf",
-            "bumblebee",
-            "bumblebee.",
-            "by cassandra",
-            "byxtogo",
-            "cgh one",
-            "caiys",
-            "celusis",
-            "cem99",
-            "chen youzhen",
-            "chengcong",
-            "chenjd",
-            "chimp",
-            "circle j",
-            "cnsgames",
-            "concluse_dev",
-            "corrox",
-            "crowgames",
-            "cybereality",
-            "cyberworks",
-            "d3t",
-            "daihua.k",
-            "daminggede",
-            "de fault",
-            "deadworld games",
-            "deepglugs",
-            "derevotyan",
-            "devotid",
-            "didigames",
-            "digitalbathtub",
-            "diman production",
-            "dorgel",
-            "doublemizzlee",
-            "dramatic create",
-            "droqen",
-            "dustinaux",
-            "dvdvideomedia",
-            "e-sheep",
-            "efunsoft-games",
-            "emedia music",
-            "eprodigy",
-            "etirue",
-            "edybtt studios",
-            "ehmprah",
-            "einpictures",
-            "eniscoskun",
-            "etherane",
-            "evlavv_studio",
-            "fap girls",
-            "feng",
-            "fnnbrr",
-            "foolsroom",
-            "forefinger",
-            "foxel_",
-            "furiousdevphoenix",
-            "fuzz, inc.",
-            "game54 software",
-            "games by lum",
-            "gentome",
-            "goodmoxing",
-            "goonswarm",
-            "grapefrukt games",
-            "grin robot",
-            "gtgame",
-            "guilemus",
-            "hoshi",
-            "hammer games",
-            "hannibalnotdead",
-            "heyjeff",
-            "historia inc.",
-            "hubiao",
-            "hublab",
-            "hyperboreangames",
-            "i273 llc",
-            "iblackpen",
-            "ientertainment network inc",
-            "ifaction studio",
-            "igindisgames",
-            "imel inc.",
-            "infinite production",
-            "idiotideas",
-            "illucalab",
-            "illuminati",
-            "ilyumi",
-            "increpare games",
-            "inkle ltd",
-            "irisgamedev",
-            "istom games kft.",
-            "ismail ozel",
-            "it matters games",
-            "iwangr",
-            "jomego76",
-            "k148 game studio",
-            "kchamp games",
-            "kakeia",
-            "kamti",
-            "kantal collective",
-            "kazakovstudios",
-            "kc6067",
-            "keron veal",
-            "kg games",
-            "khos85",
-            "kjkjkaistudio",
-            "krishgames",
-            "kurigamedev",
-            "kyuu fujisaki",
-            "lamb of game",
-            "lastgame",
-            "leimonya",
-            "lemoniedev",
-            "liangxiegame",
-            "liugao",
-            "lonch.me",
-            "louis morel",
-            "mpower games studio",
-            "madosoft",
-            "magicdweedoo",
-            "maou",
-            "matthizzone",
-            "mc2games",
-            "mebius.",
-            "megaeggz",
-            "meokigame",
-            "mibix",
-            "milkypossum",
-            "minori",
-            "mirai",
-            "momostorm entertainment",
-            "monacrea",
-            "morojenoe's empire",
-            "mumimumi",
-            "np studios",
-            "nstarcube",
-            "neko.works",
-            "nekogameteacher",
-            "nextjen",
-            "nikukyu",
-            "nkmr appworks",
-            "nobodyshot",
-            "nobones",
-            "nonpareil institute",
-            "none",
-            "nornware ab",
-            "notagamestudio",
-            "npckc",
-            "oates",
-            "ogsoftgames",
-            "ondydev",
-            "oophok",
-            "orange",
-            "origamihero games",
-            "oyajinojiike",
-            "parade",
-            "peakvox",
-            "pheenix93",
-            "phime studio llc",
-            "photographer",
-            "pixel games sarl-s",
-            "prophecy",
-            "quicktequila",
-            "r0kee",
-            "rainstory.games",
-            "randomcreations",
-            "raptor lab",
-            "reiti.net",
-            "rentaka",
-            "resnijars",
-            "riinwin",
-            "robinz",
-            "roflinka games",
-            "rokaplay",
-            "ryuukyuushi",
-            "steloxz",
-            "sad3d",
-            "sakastudio",
-            "sakevisual",
-            "samuel crevier",
-            "scitydreamer",
-            "selenophobia",
-            "sewohayami",
-            "sheen.games",
-            "shiftbacktick",
-            "shinachiku-castella",
-            "siki2046",
-            "silly little games",
-            "simplecakestudio",
-            "slh99",
-            "sloth gamer",
-            "socah development",
-            "souvenir circ.",
-            "sprite",
-            "stage-nana",
-            "starmops",
-            "stillalive studios",
-            "stramp",
-            "studio don quixote",
-            "studio wasp",
-            "sur",
-            "taecg",
-            "takayakata",
-            "taletronic",
-            "terunon's lab",
-            "thatgamecompany",
-            "the bratans",
-            "the ninelust studios",
-            "the seas",
-            "theneko",
-            "theclasoft",
-            "tiny cactus studio",
-            "tinybuild",
-            "tinybugbot",
-            "tjern",
-            "tomimar",
-            "torcado",
-            "tri-ace",
-            "u&i",
-            "uehara create",
-            "uglycoal",
-            "ujumiru",
-            "undownsidable",
-            "ustwo games",
-            "uwu lab",
-            "veryok",
-            "vikingfabian",
-            "whdinc.",
-            "wang huimin",
-            "weltenbauer. software entwicklung gmbh",
-            "wraithgames",
-            "wxm",
-            "x-climb, inc.",
-            "xfairx",
-            "xe2050",
-            "xeen inc.",
-            "xingchunfang",
-            "xproject",
-            "xrrawva",
-            "yao",
-            "yayapipi",
-            "yeswecamp",
-            "yevhen8",
-            "yfyx games",
-            "yondray",
-            "yugamesplay",
-            "zakichi",
-            "zebaxx",
-            "zelun_",
-            "zhangzhaogong",
-            "zoocros",
-            "zzzgame",
-            "özgün bursalıoğlu",
-            "i̇ni̇ti̇um studi̇o",
-            "аlexandr telminov",
-            "ильямазо",
-            "△○□× (miwashiba)",
-            "あいあんそぉど",
-            "あうとさいど",
-            "あみそ組",
-            "かべろくん",
-            "くそいサイト",
-            "たまぷろじぇくと",
-            "ときてっと",
-            "ぬるぬる坊主",
-            "ひとりサークル「匙投げ部」",
-            "ほんわかふわふわ",
-            "ぽんこん堂",
-            "やぶから堂",
-            "アトリエすえ",
-            "オートリ電子",
-            "キラ☆タマ",
-            "ケイエル",
-            "サイレント4",
-            "ツノウサギの家",
-            "ハーフトーンドット",
-            "ファントムゾーン観測室",
-            "プラスカゼット",
-            "七彩绘色游戏",
-            "七転び八転がり",
-            "上海烛龙信息科技有限公司",
-            "东风吹",
-            "乌鸦大仙",
-            "乐客游戏",
-            "乔元成",
-            "二色幽紫蝶",
-            "人型ですカオス",
-            "傅真",
-            "元气工作室",
-            "几几不小心",
-            "危途旅行团travellersonhazard",
-            "古德模型",
-            "吃了就睡工作室",
-            "哈视奇科技",
-            "四畳半ファクトリー",
-            "团购规划局",
-            "埋月山枯",
-            "夢幻泡影リョウショウカカン",
-            "孤单工作室",
-            "寂静四周",
-            "小创",
-            "幻想理戈游戏开发工作室",
-            "广州雷氪沉浸技术有限公司",
-            "弘煜科技事業股份有限公司",
-            "张亮002",
-            "愛上補習班",
-            "我妻寒十",
-            "戴永翔(dai yong xiang)",
-            "斜塔ソンブレロ",
-            "明枭网络",
-            "星辰重工stellagames",
-            "木子工坊",
-            "李园园",
-            "李晟艺",
-            "杰游科技",
-            "株式会社metaware",
-            "株式会社ワンコネクト",
-            "梅果子plumko",
-            "梦影幻忆",
-            "梵天游戏",
-            "樂磚joy brick",
-            "樹懶叫工作室",
-            "水狗工作室",
-            "永恆艾莉絲工坊",
-            "法螺会",
-            "波浪游戏 (wave game)",
-            "海貓",
-            "清风",
-            "渡里laboratory",
-            "游戏养家工作室",
-            "灰烬天国",
-            "灵虚之幽",
-            "熊窝dodox",
-            "燃核工业",
-            "独立游戏sun_official",
-            "王韋",
-            "琉璃花糖制作组",
-            "甲山林娛樂股份有限公司",
-            "疯王子",
-            "白信鸽工作室",
-            "白露社",
-            "石家庄龙游科技有限公司",
-            "純白花園weissgarden",
-            "绅士游戏工坊",
-            "肉鸽鸽独立游戏工作室",
-            "自由愉悦小黄猫(free pleasure little yellow cat)",
-            "自転車創業",
-            "致意",
-            "臻新",
-            "艾露比工作室",
-            "苒紫网络",
-            "莉莉恩工作室",
-            "藤札",
-            "蛋炒饭",
-            "谭浩翔",
-            "赚大钱工作室",
-            "迟到的南雨亭",
-            "追风的鱼",
-            "都要恰饭的",
-            "重楼工作室",
-            "金戈兄",
-            "阿正不经",
-            "零创游戏(zerocreationgame)",
-            "青春18金魚",
-            "青灯独酌",
-            "香港商河洛互動娛樂股份有限公司",
-            "魔界あ号営業所",
-            "黄昏フロンティア",
-            "黒子ラボ",
-            "빌리 헤링턴",
-            "티민이"
-        ],
-        "aa": [
-            "&y",
-            "07th expansion",
-            "100 cozy games",
-            "10tons ltd",
-            "16air",
-            "2024-ngame",
-            "3dclouds",
-            "3dm_live_wallpapers",
-            "430games",
-            "616 games",
-            "727 not hound",
-            "9ratones",
-            "a nostru",
-            "acquire corp.",
-            "afbik studio",
-            "ak studio",
-            "alphy",
-            "amg games",
-            "argames",
-            "artdink",
-            "astro port",
-            "atlus",
-            "avi games",
-            "abstraction games",
-            "adamvision studios",
-            "afil games",
-            "ageod",
-            "airem",
-            "alawar",
-            "alawar entertainment",
-            "alcachofa soft",
-            "aldorlea games",
-            "aleksey",
-            "alternative software ltd",
-            "amaterasu software",
-            "ammonite design studios ltd",
-            "anawiki games",
-            "anarchy enterprises",
-            "andy jurko",
-            "anima games",
-            "anime mania",
-            "appetite",
-            "arcen games, llc",
-            "archaeologygames",
-            "artefacts studio",
-            "artifex mundi",
-            "artur rezende",
-            "astronomic games",
-            "axyos games",
-            "aztech",
-            "azurezero",
-            "bravegiant ltd",
-            "bug-studio",
-            "bad kid games",
-            "balti calarasi",
-            "bandai namco studios inc.",
-            "banzaiproject",
-            "beam software",
-            "big ant studios",
-            "big fish games",
-            "bitwave games",
-            "black banshee studios",
-            "black hole",
-            "black phoenix studio",
-            "blackthug",
-            "blam! games",
-            "blaze epic",
-            "bloodrain publishing",
-            "blue sunset games",
-            "blue tea games",
-            "bohemia interactive",
-            "boom games",
-            "boom team",
-            "boomzap entertainment",
-            "boomzap inc",
-            "bossa studios",
-            "brave giant ltd",
-            "brewsterland studios",
-            "bully revenge studios",
-            "byking inc.",
-            "ccs",
-            "cfk co., ltd.",
-            "charon",
-            "cinemax games",
-            "city connection",
-            "compile heart",
-            "csm",
-            "cute anime girls",
-            "caipirinha games",
-            "candy games studios",
-            "casgames",
-            "cateia games",
-            "catnip studio",
-            "cellec games",
-            "cggtgroup",
-            "chanimk",
-            "chequered ink ltd.",
-            "chilla's art",
-            "chris antoni",
-            "chun y.",
-            "cicada_dancing",
-            "city interactive s.a.",
-            "climax studios",
-            "coderenderx",
-            "colloseusx",
-            "cornutopia software",
-            "cotton game",
-            "cow games",
-            "crazysoft limited",
-            "crew lab",
-            "crisp app studio",
-            "critogames",
-            "croteam",
-            "crystal dynamics",
-            "cupcupmug",
-            "cute pen games",
-            "cyberlink",
-            "dig publishing",
-            "digidiced",
-            "dsgame",
-            "daedalic entertainment",
-            "daily magic productions",
-            "david mulder",
-            "david szymanski",
-            "dead drop studios llc",
-            "dieselmine",
-            "digimight",
-            "digipen europe-bilbao",
-            "digital eclipse",
-            "digital melody",
-            "dillyframe",
-            "dinosaur workshop",
-            "dire wolf",
-            "dirty fox games",
-            "displacement studios",
-            "dogenzaka lab",
-            "doky",
-            "dotemu",
-            "dovetail games",
-            "dr. cyril splutterworth",
-            "dreambig games",
-            "droid riot",
-            "egamer",
-            "egc games",
-            "ermedia",
-            "esat",
-            "esquadra,inc.",
-            "eastasiasoft limited",
-            "easy game",
-            "efunsoft games",
-            "eko software",
-            "elefun games",
-            "enaayah software development and services private limited",
-            "endless loop studios",
-            "enoops",
-            "entropy digital entertainment",
-            "epyx, inc.",
-            "error 300",
-            "euphoric brothers",
-            "eversim",
-            "fm simple games studio",
-            "furyu corporation",
-            "fabio ferrara",
-            "falco software",
-            "feral interactive (linux)",
-            "firefly studios",
-            "flagmanjeremy",
-            "flat cat games",
-            "flying panjandrum / ふらいんぐパンジャンドラム",
-            "forever entertainment s. a.",
-            "freeanimals_software",
-            "freemind s.a.",
-            "freezenova",
-            "friendly fox",
-            "frogwares",
-            "frontier developments",
-            "frosted wings studio",
-            "fulqrum publishing",
-            "fury games production",
-            "gcn",
-            "gfi",
-            "gvr training computer software",
-            "gz storm",
-            "galactic geckon",
-            "game mixer",
-            "gameon production",
-            "gameloft",
-            "games for pleasure",
-            "games incubator",
-            "gamesbraz",
-            "gamesforfarm",
-            "gammera nest",
-            "general arcade",
-            "gibar",
-            "girlgames",
-            "gogii games",
-            "goldengod games",
-            "grandma studios",
-            "graphium studio",
-            "green sauce games",
-            "gremlin graphics",
-            "gremlin interactive",
-            "guilty pleasure games",
-            "gunnar games",
-            "heg games",
-            "hfm games",
-            "hftgames",
-            "hunters",
-            "haemimont games",
-            "handygames",
-            "her interactive",
-            "heart's choice",
-            "hede games",
-            "hell bomb studio",
-            "hentai panda",
-            "hit-point co.,ltd.",
-            "home net games",
-            "hugepixel",
-            "hunny bunny studio",
-            "infinite bridge",
-            "inti creates co., ltd.",
-            "io games",
-            "ip izmailov vladimir yurievich",
-            "imagine",
-            "infogrames",
-            "inoa games",
-            "inu to neko",
-            "invertmouse",
-            "invictus games ltd.",
-            "ironcode gaming",
-            "ivanovich games",
-            "jozgamer",
-            "jackbox games, inc.",
-            "jordan freeman group",
-            "joybits ltd.",
-            "jujubee s.a.",
-            "kadokawa",
-            "kimidori soft",
-            "kogado studio",
-            "konami",
-            "kt racing",
-            "kadragon",
-            "kedexa",
-            "khud0",
-            "kiddy",
-            "kink master studios",
-            "klei entertainment",
-            "kodansha",
-            "konnichiwa games",
-            "konstructors",
-            "korion interactive",
-            "kuko",
-            "l. stotch",
-            "ln",
-            "lazy turtle games",
-            "lesson of passion",
-            "lieon games",
-            "lillywelland inc.",
-            "loadupgames.com",
-            "lonely troops",
-            "loolust",
-            "louie inc",
-            "lu",
-            "lucasarts",
-            "ludosity",
-            "lunarcore games",
-            "mackinn7",
-            "matre",
-            "mcg",
-            "mcgame",
-            "mdickie",
-            "mad head games",
-            "magichouse",
-            "marginal act",
-            "marvelous inc.",
-            "matthew brown",
-            "max pedro",
-            "mega cat studios",
-            "melon games",
-            "meng games",
-            "mens sana interactive",
-            "michael richard lannon",
-            "microprose software, inc",
-            "microids",
-            "might and delight",
-            "mihai morosanu",
-            "mikołaj spychał",
-            "mindware",
-            "minicactus games",
-            "minimol games",
-            "minor key games",
-            "mixogames ltd.",
-            "mojiken",
-            "momentum games",
-            "moonlightgames",
-            "mumbojumbo",
-            "my label game studio",
-            "mydreamforever",
-            "mykhail konokh",
-            "nsfw18 games",
-            "nacks soft",
-            "naipsoft",
-            "narrator",
-            "nedostudio",
-            "neki4 electronics",
-            "neocoregames",
-            "nevosoft",
-            "nibb games",
-            "nightdive studios",
-            "ninja kiwi",
-            "nippon ichi software, inc.",
-            "nomad games",
-            "norn",
-            "notus games ltd",
-            "noxurtica",
-            "nukgames",
-            "nukearts studio",
-            "nyankofeti",
-            "objectif 3d",
-            "ocean software",
-            "old school vibes",
-            "ominous entertainment",
-            "orangepixel",
-            "orcsoft",
-            "poison",
-            "punkcake delicieux",
-            "panda indie studio",
-            "paradox development studio",
-            "paul connor",
-            "paulart",
-            "peaksel",
-            "performance artist",
-            "petite games",
-            "phoenixfire games",
-            "phoenixxx games",
-            "phr00t's software",
-            "pilgrim adventures",
-            "pinkysoul",
-            "pirates of the digital sea",
-            "pix arts",
-            "pixel puzzles",
-            "pixeljam",
-            "playstige interactive",
-            "playtouch",
-            "pokies4fun",
-            "polygon art",
-            "positech games",
-            "projectorgames",
-            "puzzle l porject",
-            "puzzles by joe",
-            "qloc",
-            "qzq studio",
-            "quantum quiver games",
-            "quarlellle",
-            "queen's court",
-            "quickbobber",
-            "quicksave",
-            "quiet river",
-            "r. benny",
-            "rsk entertainment",
-            "rainbow games",
-            "randumb studios",
-            "rawi studio",
-            "rebellion",
-            "reddiamondgames",
-            "renegade sector games",
-            "revmatek",
-            "rising moon games",
-            "rocky studio",
-            "romantic room",
-            "ruskija game experience",
-            "sc jogos",
-            "scs software",
-            "seep",
-            "sega",
-            "smu guildhall",
-            "snk corporation",
-            "softstar entertainment",
-            "sqrt3",
-            "svgames",
-            "saber interactive",
-            "sabrina aridi",
-            "sacada",
-            "saintheiser",
-            "sapphire dragon productions",
-            "satur entertainment",
-            "schell games",
-            "schwan og",
-            "seedwall",
-            "seito games",
-            "serenity forge",
-            "shaman games studio",
-            "siberian mouse",
-            "sigyaad team",
-            "silver cow studio",
-            "simprose studios",
-            "sinvr",
-            "sinned games",
-            "slitherine ltd.",
-            "sneakybox",
-            "softwaves",
-            "sonic-alpha",
-            "sons of welder",
-            "soomka games",
-            "spiderweb software",
-            "spike chunsoft co., ltd.",
-            "spooclemacboogle",
-            "sports interactive",
-            "starsystemstudios",
-            "stardock",
-            "stardock entertainment",
-            "stas paty9mkin",
-            "strange scaffold",
-            "strategic simulations",
-            "strategy game studio",
-            "studio goya",
-            "studio inward",
-            "studio saizensen",
-            "studio six",
-            "sub orbital software",
-            "sumo digital",
-            "sunward games",
-            "super powerup games",
-            "suricate software",
-            "t-time technology co., ltd.",
-            "talesshop co., ltd.",
-            "thq nordic",
-            "titanium armor",
-            "tml-studios",
-            "tryset break",
-            "tt games",
-            "tamashii",
-            "tamsoft",
-            "taranau aliaksei",
-            "targem games",
-            "team syukino",
-            "team17 digital ltd",
-            "teamey",
-            "tegridy made games",
-            "telltale games",
-            "the house of fables",
-            "the revills games",
-            "thebigo games",
-            "tigerqiuqiu",
-            "tim rachor",
-            "tin man games",
-            "toaplan",
-            "tonguç bodur",
-            "totem games",
-            "towndarktales",
-            "travellin cats",
-            "tuomo laine",
-            "unico inc.",
-            "userjoy technology co.,ltd.",
-            "ubisoft montreal",
-            "united independent entertainment",
-            "urchin games",
-            "uzura studio",
-            "valofe",
-            "vis-games",
-            "vaka game magazine",
-            "valkyria games",
-            "vantan game academy",
-            "vertigo games",
-            "vidas salavejus",
-            "vitok",
-            "volens nolens games",
-            "vutune",
-            "winglay",
-            "wales interactive",
-            "walter machado",
-            "wastelands interactive",
-            "wayforward",
-            "webfoot",
-            "whackakey games",
-            "whale rock games",
-            "whirlpool",
-            "wholetone games",
-            "wolfs moon studios",
-            "workroom7",
-            "world-loom",
-            "xdevs ltd",
-            "xsgames",
-            "xinfinity games",
-            "y press games",
-            "yaw studios",
-            "yaeko",
-            "yai gameworks",
-            "yamate",
-            "yash future tech solutions pvt ltd",
-            "zhang fan",
-            "zachtronics",
-            "zanggames",
-            "zaxtorgames",
-            "zeiva inc",
-            "zen studios",
-            "zerodiv",
-            "zetsubou",
-            "zloy krot studio",
-            "zojoi",
-            "zombie developer",
-            "zoom out games",
-            "anchor inc.",
-            "artoonu",
-            "azimuth team",
-            "b-alive gmbh",
-            "bakno games",
-            "bankbank",
-            "beans rolls",
-            "bhungry",
-            "cblck",
-            "desunoya",
-            "e-funsoft games",
-            "esolutions",
-            "echomune",
-            "exosyphen studios",
-            "familyplay",
-            "htaidisgust",
-            "imel",
-            "ima shouganai",
-            "indie_games_studio",
-            "indiegames3000",
-            "lightup",
-            "okyakusama",
-            "pengjianniu",
-            "qureate",
-            "russpuppy",
-            "upjers",
-            "wow wow games",
-            "▲ pyramid games",
-            "アトリエさくら (atelier sakura)",
-            "上海アリス幻樂団",
-            "个人",
-            "冷笑黑妖",
-            "凝冰剑斩",
-            "橘子班",
-            "유진게임즈"
-        ],
-        "aa+": [
-            "8floor",
-            "amax interactive",
-            "alawar casual",
-            "anamik majumdar",
-            "anatoliy loginovskikh",
-            "arc system works",
-            "archor wright",
-            "blender games",
-            "blessing company",
-            "boogygames studios",
-            "capcom co., ltd.",
-            "casual arts",
-            "choice of games",
-            "creobit",
-            "cute hannah's games",
-            "cyanide studio",
-            "cyber keks",
-            "cyberstep, inc.",
-            "dharker studios",
-            "dnovel",
-            "do games limited",
-            "domini games",
-            "eipix entertainment",
-            "elephant ar",
-            "elephant games",
-            "ensenasoft",
-            "epixr games ug",
-            "eroticgamesclub",
-            "exe create inc.",
-            "five-bn games",
-            "feral interactive (mac)",
-            "follow the fun",
-            "frontwing",
-            "g-mode",
-            "gamehouse",
-            "gamesforgames",
-            "gentledriver",
-            "gotcha gotcha games",
-            "hard shark games",
-            "hede",
-            "hentai works",
-            "hexwar games",
-            "hosted games",
-            "humongous entertainment",
-            "ir studio",
-            "idea factory",
-            "individual software",
-            "jetdogs studios",
-            "koei tecmo games co., ltd.",
-            "kairosoft co.,ltd",
-            "king kong",
-            "kotovodk studio",
-            "lgt sia",
-            "lgv",
-            "ltzinc",
-            "laush dmitriy sergeevich",
-            "lovely games",
-            "mages. inc.",
-            "magix software gmbh",
-            "miel",
-            "milestone s.r.l.",
-            "nanningsgames",
-            "nihon falcom",
-            "nikita \"ghost_rus\"",
-            "octo games",
-            "puzzle games",
-            "piece of voxel",
-            "qumaron",
-            "racing bros",
-            "rewindapp",
-            "rideon works co. ltd,",
-            "ripknot systems",
-            "sat-box",
-            "stunt",
-            "samet acar",
-            "seven sails games",
-            "slippy floor",
-            "snkl studio",
-            "sokpop collective",
-            "somer games",
-            "stegalosaurus game development",
-            "tero lunkka",
-            "tiny little lion",
-            "top-down games",
-            "valkeala software",
-            "warfare studios",
-            "william at oxford",
-            "winged cloud",
-            "winter wolves",
-            "wolverine studios",
-            "yusuf islam seyhan",
-            "zoo corporation",
-            "ebi-hime",
-            "magnussoft",
-            "me",
-            "owlyboi",
-            "橙光游戏"
-        ],
-        "aaa": [
-            "343 industries",
-            "activision",
-            "activision shanghai",
-            "amazon games",
-            "arkane studios",
-            "bandai namco studios",
-            "beenox",
-            "bend studio",
-            "bethesda game studios",
-            "bioware",
-            "blizzard",
-            "blizzard entertainment",
-            "bluepoint games",
-            "capcom",
-            "cd projekt red",
-            "codemasters",
-            "creative assembly",
-            "criterion games",
-            "crytek",
-            "demonware",
-            "dice",
-            "double fine productions",
-            "ea tiburon",
-            "ea vancouver",
-            "epic games",
-            "firaxis games",
-            "fromsoftware",
-            "gearbox software",
-            "ghost games",
-            "guerrilla games",
-            "hangar 13",
-            "high moon studios",
-            "housemarque",
-            "id software",
-            "infinity ward",
-            "insomniac games",
-            "inxile entertainment",
-            "io interactive",
-            "ivory tower",
-            "kojima productions",
-            "machinegames",
-            "massive entertainment",
-            "maxis",
-            "media molecule",
-            "microsoft corporation",
-            "microsoft game studios",
-            "monolith soft",
-            "moon studios gmbh",
-            "mojang",
-            "mojang studios",
-            "motive studio",
-            "naughty dog",
-            "netherrealm studios",
-            "ninja theory",
-            "nintendo epd",
-            "obsidian entertainment",
-            "playground games",
-            "polyphony digital",
-            "popcap games",
-            "rare",
-            "raven software",
-            "red storm entertainment",
-            "relic entertainment",
-            "remedy entertainment",
-            "respawn entertainment",
-            "retro studios",
-            "riot games",
-            "rockstar",
-            "rockstar north",
-            "rockstar san diego",
-            "rocksteady studios",
-            "ryu ga gotoku studio",
-            "santa monica studio",
-            "sledgehammer games",
-            "square enix",
-            "sucker punch productions",
-            "tango gameworks",
-            "team asobi",
-            "techland",
-            "the coalition",
-            "toys for bob",
-            "treyarch",
-            "traveller's tales",
-            "turn 10 studios",
-            "ubisoft",
-            "ubisoft montréal",
-            "ubisoft paris",
-            "ubisoft québec",
-            "ubisoft toronto",
-            "undead labs",
-            "valve",
-            "valve corporation",
-            "vicarious visions",
-            "visual concepts",
-            "world's edge",
-    ]
-}
\ No newline at end of file
+    tiers = _load_metadata()["developer_tiers"]
+    return {tier: list(developers) for tier, developers in tiers.items()}
+
+
+@lru_cache(maxsize=None)
+def get_normalised_developer_tiers():
+    """Read-only tier -> frozenset of stripped, lower-cased developer names."""
+    tiers = _load_metadata()["developer_tiers"]
+    return MappingProxyType(
+        {
+            tier: frozenset(str(dev).strip().lower() for dev in developers)
+            for tier, developers in tiers.items()
+        }
+    )
@@ -13,7 +13,7 @@ from data_preprocessing import power_scaler, quantile_scaler, robust_scaler
 
 
 def scaler_comparison(df: pd.DataFrame) -> dict:
-    numeric_columns = df.select_dtypes(include=["float64", "int64"]).columns
+    numeric_columns = df.select_dtypes(include="number").columns
 
     df_power = pd.DataFrame(
         power_scaler.fit_transform(df[numeric_columns]),